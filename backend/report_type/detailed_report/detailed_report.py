@@ -5,6 +5,7 @@ from typing import List, Dict, Set, Optional, Any
 from fastapi import WebSocket
 
 from gpt_researcher import GPTResearcher
+from gpt_researcher.utils.url_index import CanonicalURLSet
 
 
 class DetailedReport:
@@ -72,8 +73,7 @@ class DetailedReport:
         self.existing_headers: List[Dict] = []
         self.global_context: List[str] = []
         self.global_written_sections: List[str] = []
-        self.global_urls: Set[str] = set(
-            self.source_urls) if self.source_urls else set()
+        self.global_urls: Set[str] = CanonicalURLSet(self.source_urls or [])
 
     def _generate_research_id(self, query: str) -> str:
         """Generate a unique research ID from query and timestamp."""
@@ -154,7 +154,8 @@ class DetailedReport:
             source_urls=self.source_urls,
             # Propagate MCP configuration so follow-up researchers can use MCP
             mcp_configs=self.gpt_researcher.mcp_configs,
-            mcp_strategy=self.gpt_researcher.mcp_strategy
+            mcp_strategy=self.gpt_researcher.mcp_strategy,
+            search_cache=self.gpt_researcher.search_cache,
         )
 
         # Propagate max_search_results override to subtopic researcher
@@ -163,6 +164,9 @@ class DetailedReport:
 
         subtopic_assistant.context = list(set(self._hashable_context(self.global_context)))
         await subtopic_assistant.conduct_research()
+        self.gpt_researcher.add_search_cache_stats(subtopic_assistant.get_search_cache_stats())
+        self.gpt_researcher.add_page_cache_stats(subtopic_assistant.get_page_cache_stats())
+        self.gpt_researcher.add_prefetch_stats(subtopic_assistant.get_prefetch_stats())
 
         draft_section_titles = await subtopic_assistant.get_draft_section_titles(current_subtopic_task)
 
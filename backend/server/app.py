@@ -28,6 +28,7 @@ from server.server_utils import (
     execute_multi_agents, handle_websocket_communication
 )
 from server.agent_discovery import build_agent_discovery_document
+from gpt_researcher.utils.http_client import close_async_http_client
 
 from server.websocket_manager import run_agent
 from utils import write_md_to_word, write_md_to_pdf
@@ -92,6 +93,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Research API shutting down")
+    await close_async_http_client()
 
 # App initialization
 app = FastAPI(lifespan=lifespan)
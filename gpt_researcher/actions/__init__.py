@@ -1,5 +1,6 @@
-from .retriever import get_retriever, get_retrievers
-from .query_processing import plan_research_outline, get_search_results
+from .retriever import get_retriever, get_retriever_name, get_retrievers, run_retriever_search, search_many
+from .query_processing import plan_research_outline, get_search_results, get_search_results_many
+from .search_ranking import rank_search_results
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
 from .report_generation import write_conclusion, summarize_url, generate_draft_section_titles, generate_report, write_report_introduction
@@ -8,9 +9,14 @@ from .utils import stream_output
 
 __all__ = [
     "get_retriever",
+    "get_retriever_name",
     "get_retrievers",
+    "run_retriever_search",
+    "search_many",
     "get_search_results",
+    "get_search_results_many",
     "plan_research_outline",
+    "rank_search_results",
     "extract_json_with_regex",
     "scrape_urls",
     "write_conclusion",
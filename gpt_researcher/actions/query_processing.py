@@ -1,6 +1,17 @@
 import json_repair
+import asyncio
+import logging
+import re
+import time
+from typing import Any, List, Dict, Tuple
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
+from ..utils.llm import create_chat_completion
+from ..prompts import PromptFamily
+from ..config import Config
+from ..utils.retriever_health import RetrieverUnavailableError
+from .retriever import get_retriever_name, run_retriever_search, search_many
+from .search_ranking import STOPWORDS, cosine_similarity
 
 
 def _normalize_sub_queries(parsed: Any, fallback_query: str) -> List[str]:
@@ -32,11 +43,7 @@ def _normalize_sub_queries(parsed: Any, fallback_query: str) -> List[str]:
     if not queries and fallback_query.strip():
         return [fallback_query.strip()]
     return queries
-from ..utils.llm import create_chat_completion
-from ..prompts import PromptFamily
-from typing import Any, List, Dict
-from ..config import Config
-import logging
+
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +53,7 @@ async def get_search_results(
     query_domains: List[str] = None,
     researcher=None,
     max_results: int | None = None,
+    timeout: float | None = None,
 ) -> List[Dict[str, Any]]:
     """
     Get web search results for a given query.
@@ -56,14 +64,30 @@ async def get_search_results(
         query_domains: Optional list of domains to search
         researcher: The researcher instance (needed for MCP retrievers)
         max_results: Optional cap on the number of results
+        timeout: Optional search deadline in seconds; raises asyncio.TimeoutError past it
 
     Returns:
         A list of search results
     """
-    import asyncio
+    is_mcp_retriever = "mcpretriever" in retriever.__name__.lower()
+
+    # MCP results depend on the researcher's server configuration, so they
+    # are never served from the search cache.
+    search_cache = None if is_mcp_retriever else getattr(researcher, "search_cache", None)
+    retriever_health = None if is_mcp_retriever else getattr(researcher, "retriever_health", None)
+    if search_cache is not None or retriever_health is not None:
+        retriever_name = get_retriever_name(retriever)
+    if search_cache is not None:
+        cached_results = await asyncio.to_thread(
+            search_cache.get, retriever_name, query, query_domains, max_results
+        )
+        _record_search_cache_result(researcher, hit=cached_results is not None)
+        if cached_results is not None:
+            logger.info(f"Search cache hit for {retriever_name}: {query}")
+            return cached_results
 
     # Check if this is an MCP retriever and pass the researcher instance
-    if "mcpretriever" in retriever.__name__.lower():
+    if is_mcp_retriever:
         search_retriever = retriever(
             query, 
             query_domains=query_domains,
@@ -76,8 +100,117 @@ async def get_search_results(
     if max_results is not None:
         search_kwargs["max_results"] = max_results
 
-    # Retriever searches are blocking HTTP calls; keep the event loop free
-    return await asyncio.to_thread(search_retriever.search, **search_kwargs)
+    if retriever_health is None:
+        search_results = await asyncio.wait_for(
+            run_retriever_search(search_retriever, **search_kwargs), timeout
+        )
+    else:
+        search_results = await _run_tracked_search(
+            retriever_health,
+            retriever_name,
+            lambda: run_retriever_search(search_retriever, **search_kwargs),
+            timeout,
+        )
+
+    if search_cache is not None and isinstance(search_results, list):
+        await asyncio.to_thread(
+            search_cache.set, retriever_name, query, search_results, query_domains, max_results
+        )
+    return search_results
+
+
+async def get_search_results_many(
+    queries: List[str],
+    retriever: Any,
+    query_domains: List[str] = None,
+    researcher=None,
+    max_results: int | None = None,
+    timeout: float | None = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get web search results for several queries from one retriever in one step.
+
+    Queries found in the search cache are served from it; the rest go to the
+    retriever's ``search_many`` (a native batch request where supported) and
+    are cached. MCP retrievers are not supported.
+
+    Args:
+        queries: The search queries
+        retriever: The retriever class
+        query_domains: Optional list of domains to search
+        researcher: The researcher instance (for the search cache and retriever health)
+        max_results: Optional cap on the number of results per query
+        timeout: Optional deadline in seconds for the batch; raises asyncio.TimeoutError past it
+
+    Returns:
+        The search results keyed by query
+    """
+    retriever_name = get_retriever_name(retriever)
+    retriever_health = getattr(researcher, "retriever_health", None)
+    search_cache = getattr(researcher, "search_cache", None)
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    missing = []
+    for query in dict.fromkeys(queries):
+        cached_results = None
+        if search_cache is not None:
+            cached_results = await asyncio.to_thread(
+                search_cache.get, retriever_name, query, query_domains, max_results
+            )
+            _record_search_cache_result(researcher, hit=cached_results is not None)
+        if cached_results is not None:
+            results[query] = cached_results
+        else:
+            missing.append(query)
+
+    if missing:
+        def batch_search():
+            return search_many(retriever, missing, max_results=max_results, query_domains=query_domains)
+
+        if retriever_health is None:
+            batch_results = await asyncio.wait_for(batch_search(), timeout)
+        else:
+            batch_results = await _run_tracked_search(retriever_health, retriever_name, batch_search, timeout)
+        for query, search_results in zip(missing, batch_results):
+            results[query] = search_results
+            if search_cache is not None:
+                await asyncio.to_thread(
+                    search_cache.set, retriever_name, query, search_results, query_domains, max_results
+                )
+    return results
+
+
+def _record_search_cache_result(researcher, hit: bool) -> None:
+    stats = getattr(researcher, "search_cache_stats", None)
+    if isinstance(stats, dict):
+        key = "hits" if hit else "misses"
+        stats[key] = stats.get(key, 0) + 1
+
+
+async def _run_tracked_search(retriever_health, retriever_name: str, search, timeout: float | None = None):
+    """
+    Run a search unless the retriever's circuit is open, recording its latency and outcome.
+
+    Args:
+        search: Starts the search; called only when the circuit lets the request through
+        timeout: Optional deadline in seconds, recorded as a failure when it runs out
+    """
+    if not retriever_health.allow_request(retriever_name):
+        raise RetrieverUnavailableError(f"{retriever_name} circuit is open, skipping search")
+
+    start = time.monotonic()
+    try:
+        search_results = await asyncio.wait_for(search(), timeout)
+    except asyncio.CancelledError:
+        # The caller stopped waiting (e.g. it already has enough results from
+        # faster retrievers), which says nothing about this retriever's health.
+        retriever_health.release_request(retriever_name)
+        raise
+    except Exception:
+        # Errors and this search's own deadline running out (asyncio.TimeoutError)
+        retriever_health.record_failure(retriever_name, time.monotonic() - start)
+        raise
+    retriever_health.record_success(retriever_name, time.monotonic() - start)
+    return search_results
 
 async def generate_sub_queries(
     query: str,
@@ -212,3 +345,55 @@ async def plan_research_outline(
     )
 
     return sub_queries
+
+
+def _lexical_query_key(query: str) -> tuple:
+    """Normalize a query to its sorted content words, ignoring case, punctuation and word order."""
+    tokens = re.findall(r"\w+", query.lower())
+    return tuple(sorted({token for token in tokens if token not in STOPWORDS} or set(tokens)))
+
+
+async def deduplicate_sub_queries(
+    sub_queries: List[str],
+    embeddings=None,
+    similarity_threshold: float = 0.9,
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Collapse near-duplicate sub-queries before they are researched.
+
+    Queries are clustered greedily in order: each query is merged into the
+    first kept query it matches, otherwise it is kept. Two queries match when
+    their embeddings' cosine similarity reaches the threshold. Without
+    embeddings, or if embedding fails, they match when they have the same
+    content words regardless of case, punctuation and word order.
+
+    Args:
+        sub_queries: The sub-queries, in priority order.
+        embeddings: Optional LangChain Embeddings; all queries are embedded in one batch.
+        similarity_threshold: Minimum cosine similarity for two queries to be merged.
+
+    Returns:
+        The kept sub-queries and a mapping of each kept query to the queries merged into it.
+    """
+    vectors = None
+    if embeddings is not None and len(sub_queries) > 1:
+        try:
+            vectors = await embeddings.aembed_documents(list(sub_queries))
+        except Exception as e:
+            logger.warning(f"Embedding sub-queries failed, falling back to lexical de-duplication: {e}")
+
+    kept: List[int] = []
+    merged: Dict[str, List[str]] = {}
+    for index, sub_query in enumerate(sub_queries):
+        for kept_index in kept:
+            if vectors is not None:
+                is_duplicate = cosine_similarity(vectors[index], vectors[kept_index]) >= similarity_threshold
+            else:
+                is_duplicate = _lexical_query_key(sub_query) == _lexical_query_key(sub_queries[kept_index])
+            if is_duplicate:
+                merged.setdefault(sub_queries[kept_index], []).append(sub_query)
+                break
+        else:
+            kept.append(index)
+
+    return [sub_queries[index] for index in kept], merged
@@ -4,6 +4,11 @@ This module provides functions to instantiate and manage various
 search retriever implementations.
 """
 
+import asyncio
+import inspect
+
+from ..utils.cassette import get_cassette
+
 
 def get_retriever(retriever: str):
     """Get a retriever class by name.
@@ -34,6 +39,7 @@ def get_retriever(retriever: str):
         - mcp: Model Context Protocol retriever
         - xquik: Xquik X/Twitter search
         - getxapi: GetXAPI X/Twitter search
+        - localindex: Offline BM25 search over a local document directory
     """
     match retriever:
         case "google":
@@ -120,6 +126,10 @@ def get_retriever(retriever: str):
             from gpt_researcher.retrievers import GetXAPISearch
 
             return GetXAPISearch
+        case "localindex":
+            from gpt_researcher.retrievers import LocalIndexSearch
+
+            return LocalIndexSearch
 
         case _:
             return None
@@ -164,10 +174,120 @@ def get_retrievers(headers: dict[str, str], cfg):
     # Convert retriever names to actual retriever classes
     # Use get_default_retriever() as a fallback for any invalid retriever names
     retriever_classes = [get_retriever(r) or get_default_retriever() for r in retrievers]
-    
+
+    # Record or replay searches when a cassette is active. MCP retrievers need
+    # the live researcher and MCP servers, so they are left alone.
+    cassette = get_cassette()
+    if cassette is not None:
+        retriever_classes = [
+            cls if "mcpretriever" in cls.__name__.lower() else cassette.wrap_retriever(cls)
+            for cls in retriever_classes
+        ]
+
     return retriever_classes
 
 
+def get_retriever_name(retriever_class) -> str:
+    """Get the configuration name of a retriever class.
+
+    Args:
+        retriever_class: A retriever class such as TavilySearch.
+
+    Returns:
+        The name used in the RETRIEVER setting (e.g. 'tavily'), or the class
+        name when the class is not one of the built-in retrievers.
+    """
+    # Wrappers (e.g. cassette retrievers) are named after the class they wrap
+    retriever_class = getattr(retriever_class, "__wrapped__", retriever_class)
+    # Built-in retrievers live in gpt_researcher.retrievers.<name>, so the
+    # name can be read off the module without importing every retriever.
+    module = getattr(retriever_class, "__module__", "") or ""
+    prefix = "gpt_researcher.retrievers."
+    if module.startswith(prefix):
+        name = module[len(prefix):].split(".", 1)[0]
+        if name and get_retriever(name) is retriever_class:
+            return name
+    return retriever_class.__name__
+
+
+async def run_retriever_search(retriever, **search_kwargs):
+    """Run a retriever instance's search without blocking the event loop.
+
+    Retrievers that implement ``search_async`` are awaited directly, so their
+    requests go through the shared pooled HTTP client and are really cancelled
+    when a caller times out. Sync-only retrievers run in a worker thread.
+
+    Args:
+        retriever: An instantiated retriever.
+        **search_kwargs: Keyword arguments for the search call (e.g. max_results).
+
+    Returns:
+        The retriever's search results.
+
+    Raises:
+        The request errors of ``search_async`` (e.g. ``httpx.HTTPStatusError``
+        for a 429), which are not turned into empty results so the retriever
+        health registry counts them as failures.
+    """
+    search_async = getattr(retriever, "search_async", None)
+    if inspect.iscoroutinefunction(search_async):
+        return await search_async(**search_kwargs)
+    return await asyncio.to_thread(retriever.search, **search_kwargs)
+
+
+def supports_batch_search(retriever_class) -> bool:
+    """Check whether a retriever class natively searches several queries per request."""
+    return callable(getattr(retriever_class, "search_many", None))
+
+
+async def search_many(
+    retriever_class,
+    queries: list[str],
+    max_results: int | None = None,
+    query_domains: list[str] | None = None,
+    concurrency: int = 5,
+) -> list[list]:
+    """Search several queries with one retriever.
+
+    Retrievers that implement a ``search_many(queries, max_results,
+    query_domains)`` classmethod (sync or async) batch the queries natively.
+    Any other retriever runs one search per query, at most ``concurrency``
+    at a time.
+
+    Args:
+        retriever_class: The retriever class, e.g. SerperSearch.
+        queries: The search queries.
+        max_results: Optional cap on the number of results per query.
+        query_domains: Optional list of domains to search.
+        concurrency: Maximum concurrent single searches for non-batching retrievers.
+
+    Returns:
+        One list of search results per query, in the order of the queries.
+    """
+    search_kwargs = {}
+    if max_results is not None:
+        search_kwargs["max_results"] = max_results
+
+    if supports_batch_search(retriever_class):
+        batch_search = retriever_class.search_many
+        if inspect.iscoroutinefunction(batch_search):
+            results = await batch_search(list(queries), query_domains=query_domains, **search_kwargs)
+        else:
+            results = await asyncio.to_thread(
+                batch_search, list(queries), query_domains=query_domains, **search_kwargs
+            )
+        return [list(query_results or []) for query_results in results]
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def search_one(query):
+        async with semaphore:
+            retriever = retriever_class(query, query_domains=query_domains)
+            return list(await run_retriever_search(retriever, **search_kwargs) or [])
+
+    return list(await asyncio.gather(*(search_one(query) for query in queries)))
+
+
 def get_default_retriever():
     """Get the default retriever class.
 
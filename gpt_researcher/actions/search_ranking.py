@@ -0,0 +1,154 @@
+"""Ranking of search results merged from several retrievers.
+
+Results are fused with reciprocal rank fusion (RRF): a URL scores
+``1 / (k + rank)`` for every retriever that returned it, so URLs ranked
+highly by several retrievers come first. An optional lexical snippet score
+boosts results whose title/snippet overlaps the query, and an optional
+embedding filter drops results whose snippet is unrelated to the query
+before they are scraped.
+"""
+
+import asyncio
+import math
+import re
+from typing import Any, Dict, List
+
+from ..utils.url_index import canonicalize_url
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in",
+    "is", "it", "of", "on", "or", "that", "the", "to", "what", "when", "where",
+    "which", "who", "why", "with",
+}
+
+
+def _tokenize(text: str) -> set[str]:
+    return {
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and len(token) > 1
+    }
+
+
+def snippet_relevance(query: str, result: Dict[str, Any]) -> float:
+    """Score how much of the query a result's title and snippet cover.
+
+    Args:
+        query: The (sub-)query the results were retrieved for.
+        result: A search result with optional "title" and "body" keys.
+
+    Returns:
+        The fraction of query terms found in the title or snippet, from 0 to 1.
+    """
+    query_terms = _tokenize(query)
+    if not query_terms:
+        return 0.0
+    text = f"{result.get('title') or ''} {result.get('body') or ''}"
+    return len(query_terms & _tokenize(text)) / len(query_terms)
+
+
+def rank_search_results(
+    results_per_retriever: List[List[Dict[str, Any]]],
+    query: str = "",
+    rrf_k: int = 60,
+    snippet_boost: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """Merge and rank the results of several retrievers.
+
+    Results pointing to the same page (by canonical URL) are merged, keeping
+    the record with the most pre-fetched content. Each merged result is scored
+    by reciprocal rank fusion, normalized so the best result scores 1, plus
+    ``snippet_boost`` times its snippet relevance to the query.
+
+    Args:
+        results_per_retriever: Each retriever's results, in the retriever's order.
+        query: The (sub-)query, used for the snippet boost.
+        rrf_k: The RRF constant; higher values flatten rank differences.
+        snippet_boost: Weight of the snippet relevance score (0 disables it).
+
+    Returns:
+        The merged results, best first. Ties keep the order in which the
+        results were first seen.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+    for results in results_per_retriever:
+        for rank, result in enumerate(results or [], start=1):
+            url = result.get("href") or result.get("url")
+            if not url:
+                continue
+            key = canonicalize_url(url)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (rrf_k + rank)
+            current = merged.get(key)
+            if current is None or len(result.get("raw_content") or "") > len(current.get("raw_content") or ""):
+                merged[key] = result
+
+    if not merged:
+        return []
+
+    best_score = max(scores.values())
+    final_scores = {}
+    for key, result in merged.items():
+        score = scores[key] / best_score
+        if snippet_boost:
+            score += snippet_boost * snippet_relevance(query, result)
+        final_scores[key] = score
+
+    order = {key: position for position, key in enumerate(merged)}
+    ranked_keys = sorted(merged, key=lambda key: (-final_scores[key], order[key]))
+    return [merged[key] for key in ranked_keys]
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity of two embedding vectors (0 when either is all zeros)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def snippet_text(result: Dict[str, Any]) -> str:
+    """Get the text of a search result that describes the page before it is scraped."""
+    return f"{result.get('title') or ''}\n{result.get('body') or ''}".strip()
+
+
+async def filter_results_by_snippet_similarity(
+    query: str,
+    results: List[Dict[str, Any]],
+    embeddings,
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    """Drop search results whose snippet is not similar enough to the query.
+
+    The query is embedded as a query and all snippets as documents in one
+    batched call, concurrently. Results without a snippet are kept, since
+    there is nothing to judge them by.
+
+    Args:
+        query: The (sub-)query the results were retrieved for.
+        results: Search results with optional "title" and "body" keys.
+        embeddings: A LangChain Embeddings instance.
+        threshold: Minimum cosine similarity between query and snippet.
+
+    Returns:
+        The results that pass the threshold, in their original order.
+    """
+    snippets = {index: snippet_text(result) for index, result in enumerate(results)}
+    snippets = {index: text for index, text in snippets.items() if text}
+    if not snippets:
+        return list(results)
+
+    query_vector, snippet_vectors = await asyncio.gather(
+        embeddings.aembed_query(query),
+        embeddings.aembed_documents(list(snippets.values())),
+    )
+    similarities = {
+        index: cosine_similarity(query_vector, vector)
+        for index, vector in zip(snippets, snippet_vectors)
+    }
+    return [
+        result for index, result in enumerate(results)
+        if index not in similarities or similarities[index] >= threshold
+    ]
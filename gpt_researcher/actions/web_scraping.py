@@ -9,14 +9,40 @@ from ..utils.logger import get_formatted_logger
 logger = get_formatted_logger()
 
 
+def scraper_options(cfg: Config) -> dict[str, Any]:
+    """
+    Get the scraper settings of the config that Scraper sets on each scraper having them
+    Args:
+        cfg: Config
+
+    Returns:
+        dict[str, Any]: scraper attribute names and their values
+    """
+    options = {
+        "max_content_bytes": getattr(cfg, "scraper_max_content_bytes", None),
+        "max_pdf_bytes": getattr(cfg, "scraper_max_pdf_bytes", None),
+        "read_budget": getattr(cfg, "scraper_read_budget", None),
+        "pdf_max_pages": getattr(cfg, "scraper_pdf_max_pages", None),
+        "pdf_max_chars": getattr(cfg, "scraper_pdf_max_chars", None),
+        "pdf_parallel_pages": getattr(cfg, "scraper_pdf_parallel_pages", None),
+        "driver_max_pages": getattr(cfg, "scraper_browser_pages_per_driver", None),
+        "block_resources": getattr(cfg, "scraper_nodriver_block_resources", None),
+        "extraction_engine": getattr(cfg, "scraper_extraction_engine", None),
+    }
+    # Unset options keep the scrapers' defaults
+    return {name: value for name, value in options.items() if value is not None}
+
+
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool
+    urls, cfg: Config, worker_pool: WorkerPool, page_cache=None, cache_stats: dict | None = None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls
     Args:
         urls: List of urls
         cfg: Config (optional)
+        page_cache: PageCache to answer previously scraped pages from (optional)
+        cache_stats: Dict the page cache hits, revalidations and misses are counted in (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and images
@@ -32,7 +58,16 @@ async def scrape_urls(
 
     scraper = None
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = Scraper(
+            urls,
+            user_agent,
+            cfg.scraper,
+            worker_pool=worker_pool,
+            page_cache=page_cache,
+            cache_stats=cache_stats,
+            batch_size=getattr(cfg, "scraper_batch_size", 1) or 1,
+            scraper_options=scraper_options(cfg),
+        )
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -6,6 +6,7 @@ autonomous research and report generation using LLMs and web search.
 
 import asyncio
 import json
+import logging
 import os
 from typing import Any, Optional
 
@@ -31,6 +32,12 @@ from .skills.researcher import ResearchConductor
 from .skills.writer import ReportGenerator
 from .utils.enum import ReportSource, ReportType, Tone
 from .utils.llm import create_chat_completion
+from .utils.retriever_health import RetrieverUnavailableError, get_retriever_health_registry
+from .utils.http_client import configure_http_client
+from .utils.page_cache import get_page_cache
+from .utils.scholarly import get_scholarly_cache
+from .utils.search_cache import SearchCache, get_search_cache
+from .utils.url_index import CanonicalURLSet
 from .vector_store import VectorStoreWrapper
 
 
@@ -80,6 +87,7 @@ class GPTResearcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        search_cache: SearchCache | None = None,
         **kwargs
     ):
         """
@@ -134,6 +142,9 @@ class GPTResearcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            search_cache (SearchCache, optional): Search result cache to use. Defaults to the
+                process-wide cache configured by SEARCH_CACHE. Pass the parent's cache to
+                nested researchers so they share entries.
         """
         self.kwargs = kwargs
         self.query = query
@@ -158,7 +169,12 @@ class GPTResearcher:
         self.role = role
         self.parent_query = parent_query
         self.subtopics = subtopics or []
-        self.visited_urls = visited_urls or set()
+        # Deduplicates URL variants (http/https, www., tracking params, AMP, ...)
+        # while keeping the original URLs for citations. An existing
+        # CanonicalURLSet is shared as-is so nested researchers see each other's URLs.
+        self.visited_urls = (
+            visited_urls if isinstance(visited_urls, CanonicalURLSet) else CanonicalURLSet(visited_urls or ())
+        )
         self.verbose = verbose
         self.context = context or []
         self.headers = headers or {}
@@ -174,6 +190,19 @@ class GPTResearcher:
             self._process_mcp_configs(mcp_configs)
         
         self.retrievers = get_retrievers(self.headers, self.cfg)
+        self.search_cache = search_cache if search_cache is not None else get_search_cache(self.cfg)
+        self.search_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+        # Resolves DOI/arXiv/PMCID identities so each paper is scraped from one source
+        self.scholarly_cache = get_scholarly_cache(self.cfg)
+        # Scraped pages, shared by every researcher (and process) with the same settings
+        self.page_cache = get_page_cache(self.cfg)
+        self.page_cache_stats: dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0}
+        # Per retriever: results returned, and how many came with their page content
+        self.prefetch_stats: dict[str, dict[str, int]] = {}
+        # Shared by every researcher in the process so degraded retrievers are skipped everywhere
+        self.retriever_health = get_retriever_health_registry(self.cfg)
+        # Pool settings of the shared async HTTP client retrievers search with
+        configure_http_client(self.cfg)
         self.memory = Memory(
             self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
         )
@@ -539,9 +568,7 @@ class GPTResearcher:
         if all_retrievers and len(self.retrievers) > 1:
             search_results = await self._search_all_retrievers(query, query_domains)
         else:
-            search_results = await get_search_results(
-                query, self.retrievers[0], query_domains=query_domains, researcher=self
-            )
+            search_results = await self._search_first_available(query, query_domains)
 
         if not aggregated_summary:
             return search_results
@@ -569,6 +596,32 @@ class GPTResearcher:
 
         return summary
 
+    async def _search_first_available(
+        self, query: str, query_domains: list[str] = None
+    ) -> list[dict[str, Any]]:
+        """Search with the primary retriever, or the next one if its circuit is open or its search fails.
+
+        Args:
+            query: The search query.
+            query_domains: Optional list of domains to restrict search to.
+
+        Returns:
+            The search results, or an empty list if every retriever is unavailable.
+        """
+        for retriever in self.retrievers:
+            try:
+                return await get_search_results(
+                    query, retriever, query_domains=query_domains, researcher=self
+                )
+            except RetrieverUnavailableError as e:
+                logging.getLogger(__name__).warning(f"{e}, searching with the next retriever")
+            except Exception as e:
+                logging.getLogger(__name__).error(
+                    f"Error searching with {retriever.__name__}: {e!r}, searching with the next retriever"
+                )
+        logging.getLogger(__name__).warning(f"No retriever available to search '{query}'")
+        return []
+
     async def _search_all_retrievers(
         self, query: str, query_domains: list[str] = None
     ) -> list[dict[str, Any]]:
@@ -762,6 +815,61 @@ class GPTResearcher:
         """
         return dict(self.step_costs)
 
+    def get_search_cache_stats(self) -> dict[str, int]:
+        """Get the search cache hits and misses of this researcher.
+
+        Returns:
+            Dictionary with "hits" and "misses" counts.
+        """
+        return dict(self.search_cache_stats)
+
+    def add_search_cache_stats(self, stats: dict[str, int]) -> None:
+        """Add a nested researcher's search cache hits and misses to this researcher.
+
+        Args:
+            stats: Counters as returned by ``get_search_cache_stats``.
+        """
+        for key, count in stats.items():
+            self.search_cache_stats[key] = self.search_cache_stats.get(key, 0) + count
+
+    def get_page_cache_stats(self) -> dict[str, int]:
+        """Get the page cache hits, revalidations and misses of this researcher.
+
+        Returns:
+            Dictionary with "hits", "revalidated" and "misses" counts.
+        """
+        return dict(self.page_cache_stats)
+
+    def add_page_cache_stats(self, stats: dict[str, int]) -> None:
+        """Add a nested researcher's page cache counters to this researcher.
+
+        Args:
+            stats: Counters as returned by ``get_page_cache_stats``.
+        """
+        for key, count in stats.items():
+            self.page_cache_stats[key] = self.page_cache_stats.get(key, 0) + count
+
+    def get_prefetch_stats(self) -> dict[str, dict[str, int]]:
+        """Get, per retriever, how many search results came back with their page content.
+
+        Pre-fetched results (e.g. with RETRIEVER_FULL_TEXT enabled) skip the scrape phase.
+
+        Returns:
+            Dictionary mapping retriever names to "results" and "prefetched" counts.
+        """
+        return {name: dict(counts) for name, counts in self.prefetch_stats.items()}
+
+    def add_prefetch_stats(self, stats: dict[str, dict[str, int]]) -> None:
+        """Add a nested researcher's pre-fetched result counts to this researcher.
+
+        Args:
+            stats: Counters as returned by ``get_prefetch_stats``.
+        """
+        for name, counts in stats.items():
+            totals = self.prefetch_stats.setdefault(name, {"results": 0, "prefetched": 0})
+            for key, count in counts.items():
+                totals[key] = totals.get(key, 0) + count
+
     def set_verbose(self, verbose: bool) -> None:
         """Set the verbose output mode.
 
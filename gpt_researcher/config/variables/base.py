@@ -17,6 +17,33 @@ class BaseConfig(TypedDict):
     TEMPERATURE: float
     USER_AGENT: str
     MAX_SEARCH_RESULTS_PER_QUERY: int
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_TIMEOUTS: dict
+    RETRIEVER_FIRST_N_RESULTS: int
+    RETRIEVER_FAILURE_THRESHOLD: int
+    RETRIEVER_CIRCUIT_COOLDOWN: float
+    RETRIEVER_HEALTH_WINDOW: int
+    RETRIEVER_HEDGE_BACKUPS: dict
+    HTTP_MAX_CONNECTIONS: int
+    HTTP_MAX_CONNECTIONS_PER_HOST: int
+    HTTP_KEEPALIVE_EXPIRY: float
+    HTTP_TIMEOUT: float
+    SEARCH_RRF_K: int
+    SEARCH_SNIPPET_BOOST: float
+    SNIPPET_SIMILARITY_THRESHOLD: float
+    SUB_QUERY_SIMILARITY_THRESHOLD: float
+    SCRAPE_BUDGET_PER_QUERY: int
+    SEARCH_CACHE: str
+    SEARCH_CACHE_PATH: str
+    SEARCH_CACHE_TTL: int
+    SEARCH_CACHE_TTLS: dict
+    SEARCH_CACHE_MAX_ENTRIES: int
+    SCHOLARLY_CACHE: str
+    SCHOLARLY_CACHE_PATH: str
+    PAGE_CACHE: str
+    PAGE_CACHE_PATH: str
+    PAGE_CACHE_TTL: int
+    PAGE_CACHE_MAX_MB: float
     MEMORY_BACKEND: str
     TOTAL_WORDS: int
     REPORT_FORMAT: str
@@ -26,7 +53,23 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    MAX_SCRAPER_CONCURRENCY: int
+    MAX_PARSE_WORKERS: int
     SCRAPER_RATE_LIMIT_DELAY: float
+    SCRAPER_HOST_RATE_LIMIT: float
+    SCRAPER_HOST_BURST: int
+    SCRAPER_MAX_IN_FLIGHT_PER_HOST: int
+    SCRAPER_PROVIDER_RATE_LIMITS: dict
+    SCRAPER_BATCH_SIZE: int
+    SCRAPER_MAX_CONTENT_BYTES: int
+    SCRAPER_MAX_PDF_BYTES: int
+    SCRAPER_READ_BUDGET: float
+    SCRAPER_PDF_MAX_PAGES: int
+    SCRAPER_PDF_MAX_CHARS: int
+    SCRAPER_PDF_PARALLEL_PAGES: int
+    SCRAPER_BROWSER_PAGES_PER_DRIVER: int
+    SCRAPER_NODRIVER_BLOCK_RESOURCES: bool
+    SCRAPER_EXTRACTION_ENGINE: str
     MAX_SUBTOPICS: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
@@ -19,6 +19,33 @@ DEFAULT_CONFIG: BaseConfig = {
     "TEMPERATURE": 0.4,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0",
     "MAX_SEARCH_RESULTS_PER_QUERY": 5,
+    "RETRIEVER_TIMEOUT": 0.0,  # Per-retriever search deadline in seconds (0 = wait for each retriever to finish)
+    "RETRIEVER_TIMEOUTS": {},  # Per-retriever deadline overrides, e.g. {"semantic_scholar": 10}
+    "RETRIEVER_FIRST_N_RESULTS": 0,  # Stop waiting for slower retrievers once this many results arrived (0 = wait for all)
+    "RETRIEVER_FAILURE_THRESHOLD": 0,  # Consecutive failures after which a retriever is skipped until its circuit half-opens (0 = never skip)
+    "RETRIEVER_CIRCUIT_COOLDOWN": 60.0,  # Seconds a retriever is skipped before a single probe search is let through
+    "RETRIEVER_HEALTH_WINDOW": 100,  # Recent searches per retriever used for latency percentiles and error rates
+    "RETRIEVER_HEDGE_BACKUPS": {},  # Backup retriever per retriever, queried when the primary exceeds its p95 latency, e.g. {"searx": "duckduckgo"}
+    "HTTP_MAX_CONNECTIONS": 100,  # Connections of the shared async HTTP client used by retrievers with search_async, across all hosts
+    "HTTP_MAX_CONNECTIONS_PER_HOST": 10,  # Requests the shared async HTTP client sends to one host at once
+    "HTTP_KEEPALIVE_EXPIRY": 30.0,  # Seconds an idle keep-alive connection of the shared async HTTP client is kept
+    "HTTP_TIMEOUT": 30.0,  # Default request timeout in seconds of the shared async HTTP client
+    "SEARCH_RRF_K": 60,  # Reciprocal rank fusion constant used to merge retriever rankings; higher values flatten rank differences
+    "SEARCH_SNIPPET_BOOST": 0.0,  # Weight of the snippet/sub-query term overlap added to the fused rank (0 = rank fusion only)
+    "SNIPPET_SIMILARITY_THRESHOLD": 0.0,  # Skip scraping URLs whose snippet embedding similarity to the sub-query is below this (0 = disabled)
+    "SUB_QUERY_SIMILARITY_THRESHOLD": 0.0,  # Merge generated sub-queries whose embedding similarity is at least this (0 = disabled)
+    "SCRAPE_BUDGET_PER_QUERY": 0,  # Scrape only the top N ranked URLs per sub-query (0 = scrape all)
+    "SEARCH_CACHE": "none",  # Search result cache: "none", "memory" (in-process LRU) or "sqlite" (LRU backed by an on-disk database)
+    "SEARCH_CACHE_PATH": "./.cache/search_cache.sqlite",  # SQLite file used when SEARCH_CACHE is "sqlite"
+    "SEARCH_CACHE_TTL": 86400,  # Seconds a cached search stays valid
+    "SEARCH_CACHE_TTLS": {},  # Per-retriever TTL overrides, e.g. {"tavily": 3600, "arxiv": 604800} (0 = never cache)
+    "SEARCH_CACHE_MAX_ENTRIES": 1024,  # Maximum searches kept in the in-memory tier
+    "SCHOLARLY_CACHE": "memory",  # Paper identity cache for DOI/arXiv/PMCID deduplication: "none" (disables it), "memory" or "sqlite" (persisted across runs)
+    "SCHOLARLY_CACHE_PATH": "./.cache/scholarly_cache.sqlite",  # SQLite file used when SCHOLARLY_CACHE is "sqlite"
+    "PAGE_CACHE": "none",  # Scraped page cache: "none", "memory" (in-process) or "sqlite" (on disk, shared by processes on the host)
+    "PAGE_CACHE_PATH": "./.cache/page_cache.sqlite",  # SQLite file used when PAGE_CACHE is "sqlite"
+    "PAGE_CACHE_TTL": 86400,  # Seconds a cached page is used without revalidation (0 = never cache)
+    "PAGE_CACHE_MAX_MB": 512,  # Compressed size the cache is kept under by evicting least recently used pages (0 = unbounded)
     "MEMORY_BACKEND": "local",
     "TOTAL_WORDS": 1200,
     "REPORT_FORMAT": "APA",
@@ -26,7 +53,23 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
-    "SCRAPER_RATE_LIMIT_DELAY": 0.0,  # Minimum seconds between scraper requests (0 = no limit, useful for API rate limiting)
+    "MAX_SCRAPER_CONCURRENCY": 0,  # Scrapes in flight at once (0 = MAX_SCRAPER_WORKERS); async scrapers like "bs" need no thread while fetching
+    "MAX_PARSE_WORKERS": 0,  # Worker processes that parse scraped pages (0 = parse on the scraper threads)
+    "SCRAPER_RATE_LIMIT_DELAY": 0.0,  # Minimum seconds between requests to each host or scraping API without its own rate (0 = no limit)
+    "SCRAPER_HOST_RATE_LIMIT": 0.0,  # Requests per second to any one host (0 = SCRAPER_RATE_LIMIT_DELAY applies)
+    "SCRAPER_HOST_BURST": 1,  # Requests a host may get back to back before SCRAPER_HOST_RATE_LIMIT applies
+    "SCRAPER_MAX_IN_FLIGHT_PER_HOST": 0,  # Requests in flight to any one host (0 = no limit)
+    "SCRAPER_BATCH_SIZE": 20,  # URLs per extract call for "tavily_extract" and "firecrawl" (1 = one call per URL)
+    "SCRAPER_PROVIDER_RATE_LIMITS": {},  # Per scraping API, e.g. {"firecrawl": {"rate": 0.16, "burst": 1, "max_in_flight": 2}}
+    "SCRAPER_MAX_CONTENT_BYTES": 10485760,  # Largest HTML/text body read, in bytes; longer pages are truncated
+    "SCRAPER_MAX_PDF_BYTES": 52428800,  # Largest PDF downloaded, in bytes; larger PDFs are skipped
+    "SCRAPER_READ_BUDGET": 30.0,  # Seconds a single page or PDF may take to download (0 = no limit)
+    "SCRAPER_PDF_MAX_PAGES": 0,  # Pages read per PDF (0 = all)
+    "SCRAPER_PDF_MAX_CHARS": 0,  # Characters of text kept per PDF; reading stops once reached (0 = all)
+    "SCRAPER_PDF_PARALLEL_PAGES": 64,  # PDFs with more pages are split across the MAX_PARSE_WORKERS processes
+    "SCRAPER_BROWSER_PAGES_PER_DRIVER": 50,  # Pages a pooled Selenium browser loads before it is restarted (0 = never)
+    "SCRAPER_NODRIVER_BLOCK_RESOURCES": True,  # Block images, media, fonts and ad/analytics hosts with SCRAPER=nodriver
+    "SCRAPER_EXTRACTION_ENGINE": "bs4",  # HTML extraction engine: "bs4" (BeautifulSoup) or "lxml" (same output, faster)
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
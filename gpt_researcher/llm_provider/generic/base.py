@@ -10,6 +10,8 @@ from colorama import Fore, Style, init
 import os
 from enum import Enum
 
+from gpt_researcher.utils.cassette import get_cassette
+
 _SUPPORTED_PROVIDERS = {
     "openai",
     "anthropic",
@@ -113,7 +115,12 @@ class ChatLogger:
                     "stacktrace": traceback.format_exc()
                 }) + "\n")
 
+# Provider kwargs that change the response and so identify a recorded chat call
+_CASSETTE_KEY_KWARGS = ("model", "temperature", "max_tokens", "reasoning_effort")
+
+
 class GenericLLMProvider:
+    cassette_key: list | None = None
 
     def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True):
         self.llm = llm
@@ -144,6 +151,17 @@ class GenericLLMProvider:
 
     @classmethod
     def from_provider(cls, provider: str, chat_log: str | None = None, verbose: bool=True, **kwargs: Any):
+        cassette = get_cassette()
+        if cassette is not None and cassette.replaying:
+            # Replayed responses come from the cassette, so the model is never built
+            instance = cls(None, chat_log, verbose=verbose)
+        else:
+            instance = cls._from_provider(provider, chat_log, verbose=verbose, **kwargs)
+        instance.cassette_key = [provider, {k: kwargs[k] for k in _CASSETTE_KEY_KWARGS if k in kwargs}]
+        return instance
+
+    @classmethod
+    def _from_provider(cls, provider: str, chat_log: str | None = None, verbose: bool=True, **kwargs: Any):
         if provider == "openai":
             _check_pkg("langchain_openai")
             from langchain_openai import ChatOpenAI
@@ -354,6 +372,26 @@ class GenericLLMProvider:
 
 
     async def get_chat_response(self, messages, stream, websocket=None, **kwargs):
+        cassette = get_cassette()
+        if cassette is None:
+            return await self._get_chat_response(messages, stream, websocket, **kwargs)
+
+        async def respond():
+            content = await self._get_chat_response(messages, stream, websocket, **kwargs)
+            return {"content": content, "usage": self.last_usage_metadata}
+
+        self._reset_last_response_metadata()
+        cassette_key = self.cassette_key or [type(self.llm).__name__, getattr(self.llm, "model_name", None)]
+        recorded = await cassette.acall("chat", [cassette_key, messages, stream, kwargs], respond)
+        if cassette.replaying:
+            self.last_usage_metadata = recorded.get("usage")
+            if stream:
+                await self._send_output(recorded["content"], websocket)
+            if self.chat_logger:
+                await self.chat_logger.log_request(messages, recorded["content"])
+        return recorded["content"]
+
+    async def _get_chat_response(self, messages, stream, websocket=None, **kwargs):
         self._reset_last_response_metadata()
         if not stream:
             # Getting output from the model chain using ainvoke for asynchronous invoking
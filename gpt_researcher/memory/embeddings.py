@@ -25,6 +25,8 @@ Supported providers:
 import os
 from typing import Any
 
+from ..utils.cassette import get_cassette
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -84,6 +86,14 @@ class Memory:
         Raises:
             Exception: If the embedding provider is not supported.
         """
+        self._model_id = f"{embedding_provider}:{model}"
+        self._cassette_embeddings = None
+        cassette = get_cassette()
+        if cassette is not None and cassette.replaying:
+            # Replayed embeddings come from the cassette, so the provider is never built
+            self._embeddings = None
+            return
+
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -230,6 +240,12 @@ class Memory:
         """Get the configured embeddings instance.
 
         Returns:
-            The LangChain embeddings instance configured for this Memory.
+            The LangChain embeddings instance configured for this Memory, wrapped
+            to record or replay embeddings when a cassette is active.
         """
-        return self._embeddings
+        cassette = get_cassette()
+        if cassette is None:
+            return self._embeddings
+        if self._cassette_embeddings is None or self._cassette_embeddings.cassette is not cassette:
+            self._cassette_embeddings = cassette.wrap_embeddings(self._embeddings, self._model_id)
+        return self._cassette_embeddings
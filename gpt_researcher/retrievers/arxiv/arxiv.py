@@ -31,10 +31,14 @@ class ArxivSearch:
 
         for result in arxiv_gen:
 
-            search_result.append({
+            paper = {
                 "title": result.title,
                 "href": result.pdf_url,
                 "body": result.summary,
-            })
+                "scholarly_ids": {"arxiv": result.get_short_id()},
+            }
+            if result.doi:
+                paper["scholarly_ids"]["doi"] = result.doi
+            search_result.append(paper)
         
         return search_result
\ No newline at end of file
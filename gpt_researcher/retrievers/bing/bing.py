@@ -36,16 +36,12 @@ class BingSearch():
                 "Bing API key not found. Please set the BING_API_KEY environment variable.")
         return api_key
 
-    def search(self, max_results=7) -> list[dict[str]]:
+    def _build_request(self, max_results):
         """
-        Searches the query
+        Builds the Bing request
         Returns:
-
+            tuple: (url, headers, params)
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Bing API."""
-
-        # Search the query
         url = "https://api.bing.microsoft.com/v7.0/search"
 
         headers = {
@@ -62,14 +58,14 @@ class BingSearch():
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
+        return url, headers, params
 
-        resp = requests.get(url, headers=headers, params=params)
-
-        # Preprocess the results
-        if resp is None:
-            return []
+    def _parse_response(self, text) -> list[dict[str]]:
+        """
+        Normalizes a Bing response body to match the format of the other search APIs
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
             results = search_results.get("webPages", {}).get("value", [])
         except Exception as e:
             self.logger.error(
@@ -79,7 +75,6 @@ class BingSearch():
             self.logger.warning(f"No search results found for query: {self.query}")
             return []
 
-        # Normalize the results to match the format of the other search APIs
         search_response = []
         for result in results:
             url = result.get("url", "")
@@ -93,3 +88,37 @@ class BingSearch():
             })
 
         return search_response
+
+    def search(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Bing API."""
+
+        url, headers, params = self._build_request(max_results)
+        resp = requests.get(url, headers=headers, params=params)
+
+        # Preprocess the results
+        if resp is None:
+            return []
+        return self._parse_response(resp.text)
+
+    async def search_async(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        print("Searching with query {0}...".format(self.query))
+
+        url, headers, params = self._build_request(max_results)
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        resp = await get_async_http_client().get(url, headers=headers, params=params)
+        resp.raise_for_status()
+        return self._parse_response(resp.text)
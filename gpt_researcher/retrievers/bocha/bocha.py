@@ -22,11 +22,11 @@ class BoChaSearch():
         self.query_domains = query_domains or None
         self.api_key = os.environ["BOCHA_API_KEY"]
 
-    def search(self, max_results=7) -> list[dict[str]]:
+    def _build_request(self, max_results):
         """
-        Searches the query
+        Builds the BoCha request
         Returns:
-
+            tuple: (url, headers, data)
         """
         url = 'https://api.bochaai.com/v1/web-search'
         headers = {
@@ -39,17 +39,13 @@ class BoChaSearch():
             "summary": True,  # 是否返回长文本摘要
             "count": max_results
         }
+        return url, headers, data
 
-        try:
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-            response.raise_for_status()
-            json_response = response.json()
-        except (requests.RequestException, ValueError) as e:
-            logging.getLogger(__name__).warning(
-                f"Error: {e}. Failed fetching sources. Resulting in empty response."
-            )
-            return []
-
+    @staticmethod
+    def _parse_results(json_response) -> list[dict[str]]:
+        """
+        Normalizes a BoCha response to match the format of the other search APIs
+        """
         # The BoCha response shape is data.webPages.value; any of these may be
         # missing on an error/empty payload, so walk it defensively rather than
         # KeyError-ing the whole research run.
@@ -58,7 +54,6 @@ class BoChaSearch():
         ).get("value") or []
         search_results = []
 
-        # Normalize the results to match the format of the other search APIs
         for result in results:
             search_results.append(
                 {
@@ -68,4 +63,40 @@ class BoChaSearch():
                 }
             )
 
-        return search_results
\ No newline at end of file
+        return search_results
+
+    def search(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query
+        Returns:
+
+        """
+        url, headers, data = self._build_request(max_results)
+
+        try:
+            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response.raise_for_status()
+            json_response = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logging.getLogger(__name__).warning(
+                f"Error: {e}. Failed fetching sources. Resulting in empty response."
+            )
+            return []
+
+        return self._parse_results(json_response)
+
+    async def search_async(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        url, headers, data = self._build_request(max_results)
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().post(url, headers=headers, json=data, timeout=10)
+        response.raise_for_status()
+        return self._parse_results(response.json())
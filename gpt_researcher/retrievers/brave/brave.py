@@ -37,15 +37,12 @@ class BraveSearch:
             )
         return api_key
 
-    def search(self, max_results=7) -> list[dict[str, str]]:
+    def _build_request(self, max_results):
         """
-        Searches the query
+        Builds the Brave Search request
         Returns:
-
+            tuple: (url, headers, params)
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Brave Search API."""
-
         url = "https://api.search.brave.com/res/v1/web/search"
         headers = {
             "X-Subscription-Token": self.api_key,
@@ -57,21 +54,14 @@ class BraveSearch:
             "q": self.query,
             "count": min(max_results, 20),
         }
+        return url, headers, params
 
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=20)
-            response.raise_for_status()
-            search_results = response.json()
-            results = search_results.get("web", {}).get("results", [])
-        except Exception as e:
-            self.logger.error(
-                f"Error fetching Brave search results: {e}. Resulting in empty response."
-            )
-            return []
-
+    @staticmethod
+    def _parse_results(results) -> list[dict[str, str]]:
+        """
+        Normalizes the results to match the format of the other search APIs
+        """
         search_results = []
-
-        # Normalize the results to match the format of the other search APIs
         for result in results:
             url = result.get("url")
             if not url:
@@ -84,3 +74,46 @@ class BraveSearch:
             search_results.append(search_result)
 
         return search_results
+
+    def search(self, max_results=7) -> list[dict[str, str]]:
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Brave Search API."""
+
+        url, headers, params = self._build_request(max_results)
+
+        try:
+            response = requests.get(url, headers=headers, params=params, timeout=20)
+            response.raise_for_status()
+            search_results = response.json()
+            results = search_results.get("web", {}).get("results", [])
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching Brave search results: {e}. Resulting in empty response."
+            )
+            return []
+
+        return self._parse_results(results)
+
+    async def search_async(self, max_results=7) -> list[dict[str, str]]:
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        print("Searching with query {0}...".format(self.query))
+
+        url, headers, params = self._build_request(max_results)
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().get(url, headers=headers, params=params, timeout=20)
+        response.raise_for_status()
+        results = response.json().get("web", {}).get("results", [])
+        return self._parse_results(results)
@@ -74,15 +74,30 @@ class CRWRetriever:
         )
         return base_url.rstrip("/")
 
-    def _search(self, query: str, max_results: int = 10) -> dict:
-        """
-        Internal search method to send the request to the API.
-        """
+    @staticmethod
+    def _check_envelope(results: dict) -> dict:
+        # fastCRW wraps responses in a {success, error, data} envelope.
+        if results.get("success") is False:
+            raise Exception(results.get("error", "fastCRW API search failed."))
+        return results
 
+    @staticmethod
+    def _build_payload(query: str, max_results: int, full_text: bool) -> dict:
         data = {
             "query": query,
             "limit": max_results,
         }
+        if full_text:
+            # Have fastCRW scrape each result so the page content comes back with it
+            data["scrapeOptions"] = {"formats": ["markdown"]}
+        return data
+
+    def _search(self, query: str, max_results: int = 10, full_text: bool = False) -> dict:
+        """
+        Internal search method to send the request to the API.
+        """
+
+        data = self._build_payload(query, max_results, full_text)
 
         response = requests.post(
             f"{self.base_url}/v1/search",
@@ -92,11 +107,57 @@ class CRWRetriever:
         )
         # Raises a HTTPError if the HTTP request returned an unsuccessful status code
         response.raise_for_status()
-        results = response.json()
-        # fastCRW wraps responses in a {success, error, data} envelope.
-        if results.get("success") is False:
-            raise Exception(results.get("error", "fastCRW API search failed."))
-        return results
+        return self._check_envelope(response.json())
+
+    async def _search_async(self, query: str, max_results: int = 10, full_text: bool = False) -> dict:
+        """
+        Internal search method to send the request to the API on the shared async client.
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        data = self._build_payload(query, max_results, full_text)
+
+        response = await get_async_http_client().post(
+            f"{self.base_url}/v1/search",
+            content=json.dumps(data),
+            headers=self.headers,
+            timeout=100,
+        )
+        response.raise_for_status()
+        return self._check_envelope(response.json())
+
+    @staticmethod
+    def _parse_results(results: dict, full_text: bool = False) -> list[dict]:
+        """
+        Normalizes the API response into href/body records.
+
+        With full_text, the scraped markdown is returned as raw_content and
+        the description (or a snippet of the markdown) as body.
+        """
+        sources = results.get("data") or []
+        if not sources:
+            raise Exception("No results found with fastCRW API search.")
+        from gpt_researcher.retrievers.utils import make_snippet
+
+        # A source missing "url" is unusable, so skip it rather than raising
+        # a KeyError that discards the whole result set.
+        search_response = []
+        for obj in sources:
+            if not obj.get("url"):
+                continue
+            markdown = obj.get("markdown")
+            if full_text and markdown:
+                search_response.append({
+                    "href": obj["url"],
+                    "body": obj.get("description") or make_snippet(markdown),
+                    "raw_content": markdown,
+                })
+            else:
+                search_response.append({
+                    "href": obj["url"],
+                    "body": markdown or obj.get("description", ""),
+                })
+        return search_response
 
     def search(self, max_results=10):
         """
@@ -104,23 +165,27 @@ class CRWRetriever:
         Returns:
 
         """
+        from gpt_researcher.retrievers.utils import full_text_enabled
+
         try:
-            # Search the query
-            results = self._search(self.query, max_results=max_results)
-            sources = results.get("data") or []
-            if not sources:
-                raise Exception("No results found with fastCRW API search.")
-            # Return the results. A source missing "url" is unusable, so skip it
-            # rather than raising a KeyError that discards the whole result set.
-            search_response = [
-                {
-                    "href": obj["url"],
-                    "body": obj.get("markdown") or obj.get("description", ""),
-                }
-                for obj in sources
-                if obj.get("url")
-            ]
+            full_text = full_text_enabled()
+            results = self._search(self.query, max_results=max_results, full_text=full_text)
+            search_response = self._parse_results(results, full_text)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    async def search_async(self, max_results=10):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        from gpt_researcher.retrievers.utils import full_text_enabled
+
+        # Request errors are raised rather than turned into an empty response,
+        # so the retriever health registry counts them as failures
+        full_text = full_text_enabled()
+        results = await self._search_async(self.query, max_results=max_results, full_text=full_text)
+        return self._parse_results(results, full_text)
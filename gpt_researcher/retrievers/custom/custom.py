@@ -56,6 +56,32 @@ class CustomRetriever:
             print(f"Failed to retrieve search results: {e}")
             return []
 
+        return self._validate_payload(payload)
+
+    async def search_async(self, max_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Performs the search on the shared async HTTP client.
+
+        :param max_results: Maximum number of results to return (not currently used)
+        :return: Same format as search()
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().get(
+            self.endpoint,
+            params={**self.params, "query": self.query},
+            timeout=20,
+        )
+        response.raise_for_status()
+        return self._validate_payload(response.json())
+
+    @staticmethod
+    def _validate_payload(payload) -> List[Dict[str, Any]]:
+        """
+        Ensures the endpoint response is a list of result objects.
+        """
         # Contract: callers iterate the return value. A null JSON body or a
         # non-list payload used to surface as TypeError later (or as the
         # documented but surprising Optional). Always hand back a list.
@@ -1,5 +1,5 @@
 import os
-from ..utils import check_pkg
+from ..utils import check_pkg, full_text_enabled, make_snippet
 
 
 class ExaSearch:
@@ -49,9 +49,14 @@ class ExaSearch:
             search_type: The type of search (e.g., "neural", "keyword").
             **filters: Additional filters (e.g., date range, domains).
         Returns:
-            A list of search results.
+            A list of search results. When RETRIEVER_FULL_TEXT is enabled, the
+            page text is requested along with the results and returned as raw_content.
         """
-        results = self.client.search(
+        full_text = full_text_enabled()
+        search = self.client.search_and_contents if full_text else self.client.search
+        if full_text:
+            filters.setdefault("text", True)
+        results = search(
             self.query,
             type=search_type,
             use_autoprompt=use_autoprompt,
@@ -65,7 +70,12 @@ class ExaSearch:
             href = getattr(result, "url", None)
             if not href:
                 continue
-            body = getattr(result, "text", None) or getattr(result, "summary", None) or ""
+            text = getattr(result, "text", None)
+            if full_text and text:
+                body = getattr(result, "summary", None) or make_snippet(text)
+                search_response.append({"href": href, "body": body, "raw_content": text})
+                continue
+            body = text or getattr(result, "summary", None) or ""
             search_response.append({"href": href, "body": body})
         return search_response
 
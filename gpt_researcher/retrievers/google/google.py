@@ -51,11 +51,11 @@ class GoogleSearch:
                             "You can get a key at https://developers.google.com/custom-search/v1/overview")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_url(self):
         """
-        Searches the query using Google Custom Search API, optionally restricting to specific domains
+        Builds the Custom Search API URL, optionally restricting to specific domains
         Returns:
-            list: List of search results with title, href and body
+            str: The request URL
         """
         # Build query with domain restrictions if specified
         search_query = self.query
@@ -76,16 +76,17 @@ class GoogleSearch:
                 "start": 1,
             }
         )
-        url = f"https://www.googleapis.com/customsearch/v1?{query_string}"
-        resp = requests.get(url)
-
-        if resp.status_code < 200 or resp.status_code >= 300:
-            print("Google search: unexpected response status: ", resp.status_code)
+        return f"https://www.googleapis.com/customsearch/v1?{query_string}"
 
-        if resp is None:
-            return []
+    @staticmethod
+    def _parse_response(text, max_results):
+        """
+        Normalizes a Custom Search API response body
+        Returns:
+            list: List of search results with title, href and body
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return []
         if not isinstance(search_results, dict):
@@ -112,3 +113,32 @@ class GoogleSearch:
             )
 
         return search_response[:max_results]
+
+    def search(self, max_results=7):
+        """
+        Searches the query using Google Custom Search API, optionally restricting to specific domains
+        Returns:
+            list: List of search results with title, href and body
+        """
+        resp = requests.get(self._build_url())
+
+        if resp is None:
+            return []
+        if resp.status_code < 200 or resp.status_code >= 300:
+            print("Google search: unexpected response status: ", resp.status_code)
+
+        return self._parse_response(resp.text, max_results)
+
+    async def search_async(self, max_results=7):
+        """
+        Searches the query using Google Custom Search API on the shared async HTTP client
+        Returns:
+            list: List of search results with title, href and body
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        resp = await get_async_http_client().get(self._build_url())
+        resp.raise_for_status()
+        return self._parse_response(resp.text, max_results)
@@ -34,24 +34,19 @@ class GroundRouteSearch:
                 )
         return api_key
 
-    def search(self, max_results=7):
-        """Search via GroundRoute. Returns [{"href": url, "body": content}, ...]."""
-        try:
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={"query": self.query, "max_results": max_results},
-                timeout=20,
-            )
-            response.raise_for_status()
-            payload = response.json()
-        except Exception as e:
-            print(f"Error performing GroundRoute search: {e}")
-            return []
+    def _request_kwargs(self, max_results):
+        return {
+            "headers": {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            "json": {"query": self.query, "max_results": max_results},
+            "timeout": 20,
+        }
 
+    @staticmethod
+    def _parse_results(payload, max_results):
+        """Normalize a GroundRoute payload into href/body records."""
         if isinstance(payload, list):
             results = payload
         elif isinstance(payload, dict):
@@ -74,3 +69,27 @@ class GroundRouteSearch:
             if len(normalized) >= max_results:
                 break
         return normalized
+
+    def search(self, max_results=7):
+        """Search via GroundRoute. Returns [{"href": url, "body": content}, ...]."""
+        try:
+            response = requests.post(self.base_url, **self._request_kwargs(max_results))
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as e:
+            print(f"Error performing GroundRoute search: {e}")
+            return []
+
+        return self._parse_results(response.json(), max_results)
+
+    async def search_async(self, max_results=7):
+        """Search via GroundRoute on the shared async HTTP client."""
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().post(
+            self.base_url, **self._request_kwargs(max_results)
+        )
+        response.raise_for_status()
+        return self._parse_results(payload, max_results)
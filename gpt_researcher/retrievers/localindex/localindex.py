@@ -0,0 +1,303 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+INDEX_VERSION = 1
+# Formats read directly; anything else goes through the DocumentLoader
+TEXT_EXTENSIONS = {"md", "markdown", "txt", "rst"}
+HTML_EXTENSIONS = {"html", "htm"}
+LOADER_EXTENSIONS = {"pdf", "doc", "docx", "pptx", "csv", "xls", "xlsx"}
+SNIPPET_LENGTH = 300
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _extract_text(path: str, extension: str) -> str:
+    if extension in TEXT_EXTENSIONS:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    if extension in HTML_EXTENSIONS:
+        from bs4 import BeautifulSoup
+
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return BeautifulSoup(f.read(), "lxml").get_text("\n", strip=True)
+
+    if extension == "pdf":
+        try:
+            import pymupdf
+        except ImportError:
+            pass
+        else:
+            with pymupdf.open(path) as pdf:
+                return "\n\n".join(page.get_text() for page in pdf)
+    if extension == "docx":
+        try:
+            import docx
+        except ImportError:
+            pass
+        else:
+            return "\n".join(paragraph.text for paragraph in docx.Document(path).paragraphs)
+
+    from gpt_researcher.document import DocumentLoader
+
+    # The index is built in a worker thread, which has no running event loop
+    pages = asyncio.run(DocumentLoader([path]).load())
+    return "\n\n".join(page["raw_content"] for page in pages)
+
+
+def _get_title(path: str, text: str) -> str:
+    for line in text.splitlines()[:20]:
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return os.path.basename(path)
+
+
+class LocalIndex:
+    """
+    Persistent BM25 inverted index over a directory of documents.
+
+    Each document's term frequencies and text are persisted to a JSON file
+    outside the corpus. On refresh only files whose mtime or size changed are
+    re-read, new files are added and deleted ones dropped, so reopening a
+    large corpus does not re-index it.
+    """
+
+    def __init__(self, corpus_path: str, index_path: str, k1: float = 1.5, b: float = 0.75):
+        self.corpus_path = os.path.abspath(corpus_path)
+        self.index_path = index_path
+        self.k1 = k1
+        self.b = b
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.average_length = 0.0
+        self.refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION and data.get("corpus_path") == self.corpus_path:
+            self.documents = data.get("documents") or {}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        os.makedirs(directory, exist_ok=True)
+        data = {"version": INDEX_VERSION, "corpus_path": self.corpus_path, "documents": self.documents}
+        # Write to a temporary file and swap it in so readers never see a partial index
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _scan(self) -> Dict[str, tuple]:
+        files = {}
+        for root, dirs, names in os.walk(self.corpus_path):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                extension = os.path.splitext(name)[1].lstrip(".").lower()
+                if name.startswith(".") or extension not in TEXT_EXTENSIONS | HTML_EXTENSIONS | LOADER_EXTENSIONS:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files[os.path.relpath(path, self.corpus_path)] = (stat.st_mtime, stat.st_size, extension)
+        return files
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the corpus directory.
+
+        Returns:
+            The number of added, updated and removed documents.
+        """
+        with self._lock:
+            files = self._scan()
+            stats = {"added": 0, "updated": 0, "removed": 0}
+            for rel_path in list(self.documents):
+                if rel_path not in files:
+                    del self.documents[rel_path]
+                    stats["removed"] += 1
+            for rel_path, (mtime, size, extension) in files.items():
+                document = self.documents.get(rel_path)
+                if document and document["mtime"] == mtime and document["size"] == size:
+                    continue
+                path = os.path.join(self.corpus_path, rel_path)
+                try:
+                    text = _extract_text(path, extension)
+                except Exception as e:
+                    # Indexed as empty so it is only retried once the file changes
+                    print(f"Failed to index {path}: {e}")
+                    text = ""
+                tokens = tokenize(text)
+                self.documents[rel_path] = {
+                    "mtime": mtime,
+                    "size": size,
+                    "title": _get_title(path, text),
+                    "text": text,
+                    "length": len(tokens),
+                    "terms": dict(Counter(tokens)),
+                }
+                stats["updated" if document else "added"] += 1
+
+            self._build_postings()
+            if any(stats.values()) or not os.path.exists(self.index_path):
+                try:
+                    self._save()
+                except OSError as e:
+                    print(f"Failed to save local index to {self.index_path}: {e}")
+            self.refreshed_at = time.monotonic()
+            return stats
+
+    def _build_postings(self) -> None:
+        postings: Dict[str, Dict[str, int]] = {}
+        for rel_path, document in self.documents.items():
+            for term, count in document["terms"].items():
+                postings.setdefault(term, {})[rel_path] = count
+        self.postings = postings
+        lengths = [document["length"] for document in self.documents.values()]
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    def search(self, query: str, max_results: int = 5) -> List[tuple]:
+        """
+        Rank documents by BM25 against the query.
+
+        Returns:
+            (relative path, score) pairs, best first. Ties are broken by path so results are deterministic.
+        """
+        with self._lock:
+            document_count = len(self.documents)
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for rel_path, frequency in postings.items():
+                    length_norm = 1 - self.b + self.b * self.documents[rel_path]["length"] / (self.average_length or 1)
+                    scores[rel_path] = scores.get(rel_path, 0.0) + idf * frequency * (self.k1 + 1) / (
+                        frequency + self.k1 * length_norm
+                    )
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return ranked[:max_results]
+
+    def get_document(self, rel_path: str) -> Dict[str, Any]:
+        return self.documents[rel_path]
+
+
+def _best_snippet(text: str, query: str) -> str:
+    """Get the paragraph that mentions the most query terms, shortened to a snippet."""
+    query_terms = set(tokenize(query))
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    if not paragraphs:
+        return ""
+    best = max(paragraphs, key=lambda p: len(query_terms & set(tokenize(p))))
+    best = " ".join(best.split())
+    return best if len(best) <= SNIPPET_LENGTH else best[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "..."
+
+
+# Indexes are shared process-wide so the retriever, which is created per
+# query, does not reload the index file every time.
+_indexes: Dict[tuple, LocalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_local_index(corpus_path: str, index_path: Optional[str] = None, refresh_interval: float = 300) -> LocalIndex:
+    """
+    Get the shared, up-to-date index of a corpus directory.
+
+    Args:
+        corpus_path: Directory of documents to index.
+        index_path: JSON file the index is persisted to. Defaults to a file
+            under ./.cache/localindex named after the corpus path.
+        refresh_interval: Seconds after which the corpus is re-scanned for changes.
+
+    Returns:
+        The LocalIndex for the corpus.
+    """
+    corpus_path = os.path.abspath(corpus_path)
+    if not index_path:
+        digest = hashlib.sha256(corpus_path.encode("utf-8")).hexdigest()[:16]
+        index_path = os.path.join(".cache", "localindex", f"{digest}.json")
+    index_path = os.path.abspath(index_path)
+
+    with _indexes_lock:
+        index = _indexes.get((corpus_path, index_path))
+        if index is None:
+            index = _indexes[(corpus_path, index_path)] = LocalIndex(corpus_path, index_path)
+    if not index.refreshed_at or time.monotonic() - index.refreshed_at >= refresh_interval:
+        index.refresh()
+    return index
+
+
+class LocalIndexSearch:
+    """
+    Offline BM25 retriever over a local directory of documents.
+
+    Needs no network access, so research can run in air-gapped environments
+    and benchmarks are deterministic. Results carry the full document text as
+    raw_content, so they are used as-is instead of being scraped.
+
+    Environment variables:
+    - LOCAL_INDEX_PATH: directory of documents to search (defaults to DOC_PATH or ./my-docs).
+    - LOCAL_INDEX_STORE: JSON file the index is persisted to (defaults to ./.cache/localindex/<hash>.json).
+    - LOCAL_INDEX_REFRESH_INTERVAL: seconds between re-scans of the directory for changed files (defaults to 300).
+    """
+
+    def __init__(self, query: str, query_domains=None):
+        """
+        Initializes the LocalIndexSearch object.
+
+        :param query: Search query string.
+        :param query_domains: Ignored; local documents have no domain.
+        """
+        self.query = query
+        self.corpus_path = os.getenv("LOCAL_INDEX_PATH") or os.getenv("DOC_PATH") or "./my-docs"
+        self.index_path = os.getenv("LOCAL_INDEX_STORE")
+        self.refresh_interval = float(os.getenv("LOCAL_INDEX_REFRESH_INTERVAL", 300))
+
+    def search(self, max_results: int = 5) -> List[Dict[str, str]]:
+        """
+        Searches the local index.
+
+        :param max_results: Maximum number of documents to return.
+        :return: List of results with title, href (a file:// URI), body and raw_content.
+        """
+        if not os.path.isdir(self.corpus_path):
+            print(f"Local index directory not found: {self.corpus_path}")
+            return []
+
+        index = get_local_index(self.corpus_path, self.index_path, self.refresh_interval)
+        results = []
+        for rel_path, _ in index.search(self.query, max_results):
+            document = index.get_document(rel_path)
+            results.append({
+                "title": document["title"],
+                "href": Path(index.corpus_path, rel_path).as_uri(),
+                "body": _best_snippet(document["text"], self.query),
+                "raw_content": document["text"],
+            })
+        return results
@@ -41,13 +41,7 @@ class OpenAlexSearch:
         self.email: Optional[str] = os.environ.get("OPENALEX_EMAIL")
         self.api_key: Optional[str] = os.environ.get("OPENALEX_API_KEY")
 
-    def search(self, max_results: int = 20) -> List[Dict[str, str]]:
-        """
-        Perform the search on OpenAlex and return results.
-
-        :param max_results: Maximum number of results to retrieve (capped at 25 per request).
-        :return: List of dictionaries containing title, href, and body of each work.
-        """
+    def _build_params(self, max_results: int) -> Dict[str, str]:
         params = {
             "search": self.query,
             "per_page": min(max_results, 25),
@@ -57,15 +51,15 @@ class OpenAlexSearch:
             params["mailto"] = self.email
         if self.api_key:
             params["api_key"] = self.api_key
+        return params
 
-        try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"An error occurred while accessing OpenAlex API: {e}")
-            return []
+    def _parse_results(self, payload) -> List[Dict[str, str]]:
+        """
+        Normalize an OpenAlex works response.
 
-        payload = response.json()
+        :param payload: Decoded JSON response.
+        :return: List of dictionaries containing title, href, and body of each work.
+        """
         if not isinstance(payload, dict):
             return []
         results = payload.get("results", [])
@@ -81,16 +75,51 @@ class OpenAlexSearch:
             body = self._reconstruct_abstract(result.get("abstract_inverted_index"))
 
             if href:
-                search_result.append(
-                    {
-                        "title": title,
-                        "href": href,
-                        "body": body or "Abstract not available",
-                    }
-                )
+                work = {
+                    "title": title,
+                    "href": href,
+                    "body": body or "Abstract not available",
+                }
+                scholarly_ids = self._scholarly_ids(result)
+                if scholarly_ids:
+                    work["scholarly_ids"] = scholarly_ids
+                search_result.append(work)
 
         return search_result
 
+    def search(self, max_results: int = 20) -> List[Dict[str, str]]:
+        """
+        Perform the search on OpenAlex and return results.
+
+        :param max_results: Maximum number of results to retrieve (capped at 25 per request).
+        :return: List of dictionaries containing title, href, and body of each work.
+        """
+        try:
+            response = requests.get(self.BASE_URL, params=self._build_params(max_results), timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"An error occurred while accessing OpenAlex API: {e}")
+            return []
+
+        return self._parse_results(response.json())
+
+    async def search_async(self, max_results: int = 20) -> List[Dict[str, str]]:
+        """
+        Perform the search on OpenAlex using the shared async HTTP client.
+
+        :param max_results: Maximum number of results to retrieve (capped at 25 per request).
+        :return: List of dictionaries containing title, href, and body of each work.
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Request errors and error statuses (e.g. 429) are raised, so the
+        # retriever health registry counts them as failures
+        response = await get_async_http_client().get(
+            self.BASE_URL, params=self._build_params(max_results), timeout=10
+        )
+        response.raise_for_status()
+        return self._parse_results(response.json())
+
     @staticmethod
     def _pick_href(result: dict) -> Optional[str]:
         """
@@ -109,6 +138,24 @@ class OpenAlexSearch:
 
         return result.get("id")
 
+    @staticmethod
+    def _scholarly_ids(result: dict) -> Dict[str, str]:
+        """
+        Collect the DOI and PMCID of a work (OpenAlex reports them as URLs)
+        for cross-retriever deduplication.
+        """
+        ids = result.get("ids")
+        if not isinstance(ids, dict):
+            ids = {}
+        scholarly_ids = {}
+        doi = ids.get("doi") or result.get("doi")
+        if isinstance(doi, str) and doi:
+            scholarly_ids["doi"] = doi
+        pmcid = ids.get("pmcid")
+        if isinstance(pmcid, str) and pmcid:
+            scholarly_ids["pmcid"] = pmcid
+        return scholarly_ids
+
     @staticmethod
     def _reconstruct_abstract(inverted: Optional[dict]) -> Optional[str]:
         """
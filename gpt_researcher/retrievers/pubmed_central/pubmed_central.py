@@ -1,8 +1,13 @@
 from typing import List, Dict, Any, Optional
+import asyncio
 import os
 import xml.etree.ElementTree as ET
 import requests
 
+# Concurrent efetch requests; NCBI allows 3 requests/s without an API key and 10 with one
+FETCH_CONCURRENCY = 3
+FETCH_CONCURRENCY_WITH_API_KEY = 10
+
 
 class PubMedCentralSearch:
     """
@@ -39,26 +44,42 @@ class PubMedCentralSearch:
         params.setdefault('retmode', 'json')
         return params
 
-    def _search_articles(self, max_results: int) -> Optional[List[str]]:
-        """
-        Search for article IDs based on query
-        """
+    def _build_search_params(self, max_results: int) -> Dict[str, Any]:
         # Build search query with filters for full text
         if self.db_type == 'pubmed':
             search_term = f"{self.query} AND (ffrft[filter] OR pmc[filter])"
         else:  # PMC always has full text
             search_term = self.query
-        
-        search_params = {
+
+        params = {
             "db": self.db_type,
             "term": search_term,
             "retmax": max_results,
-            "api_key": self.api_key,
             **self.params  # Include custom params
         }
-        
+        return self._with_api_key(params)
+
+    def _build_fetch_params(self, article_id: str) -> Dict[str, Any]:
+        params = {
+            "db": "pmc",  # Always fetch from PMC for full text
+            "id": article_id,
+            "rettype": "full",
+            "retmode": "xml",
+        }
+        return self._with_api_key(params)
+
+    def _with_api_key(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # httpx sends None values as an empty "api_key=", so leave the key out when unset
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    def _search_articles(self, max_results: int) -> Optional[List[str]]:
+        """
+        Search for article IDs based on query
+        """
         try:
-            response = requests.get(self.base_search_url, params=search_params)
+            response = requests.get(self.base_search_url, params=self._build_search_params(max_results))
             response.raise_for_status()
             data = response.json()
             
@@ -70,61 +91,124 @@ class PubMedCentralSearch:
             print(f"Failed to search articles: {e}")
             return None
 
+    def _parse_article(self, article_id: str, xml_text: str) -> Optional[Dict[str, str]]:
+        """
+        Parse the efetch XML of a single article into a search result
+        """
+        try:
+            root = ET.fromstring(xml_text)
+        except ET.ParseError:
+            return None
+
+        # Extract title
+        title = root.find('.//article-title')
+        title_text = title.text if title is not None else ""
+
+        # Extract abstract
+        abstract = root.find('.//abstract')
+        abstract_text = " ".join(abstract.itertext()) if abstract is not None else ""
+
+        # Extract body text
+        body = root.find('.//body')
+        body_text = " ".join(body.itertext()) if body is not None else ""
+
+        # Combine all text content
+        full_content = f"Title: {title_text}\n\nAbstract: {abstract_text}\n\nBody: {body_text}"
+
+        # Build URL
+        if self.db_type == "pmc" or article_id.startswith("PMC"):
+            url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{article_id}/"
+        else:
+            url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/"
+
+        article = {
+            "href": url,
+            "url": url,
+            "body": full_content,
+            "raw_content": full_content,
+            "title": title_text
+        }
+
+        # Lets other retrievers' copies of this paper be deduplicated against it
+        scholarly_ids = {"pmcid": url.rstrip("/").rsplit("/", 1)[-1]}
+        doi = root.find(".//article-meta/article-id[@pub-id-type='doi']")
+        if doi is not None and doi.text:
+            scholarly_ids["doi"] = doi.text.strip()
+        article["scholarly_ids"] = scholarly_ids
+        return article
+
     def _fetch_full_text(self, article_id: str) -> Optional[Dict[str, str]]:
         """
         Fetch full text content for a single article
         """
-        fetch_params = {
-            "db": "pmc" if self.db_type == "pmc" else "pmc",  # Always fetch from PMC for full text
-            "id": article_id,
-            "rettype": "full",
-            "retmode": "xml",
-            "api_key": self.api_key
-        }
-        
         try:
-            response = requests.get(self.base_fetch_url, params=fetch_params)
+            response = requests.get(self.base_fetch_url, params=self._build_fetch_params(article_id))
             response.raise_for_status()
-            
-            # Parse XML content
-            try:
-                root = ET.fromstring(response.text)
-                
-                # Extract title
-                title = root.find('.//article-title')
-                title_text = title.text if title is not None else ""
-                
-                # Extract abstract
-                abstract = root.find('.//abstract')
-                abstract_text = " ".join(abstract.itertext()) if abstract is not None else ""
-                
-                # Extract body text
-                body = root.find('.//body')
-                body_text = " ".join(body.itertext()) if body is not None else ""
-                
-                # Combine all text content
-                full_content = f"Title: {title_text}\n\nAbstract: {abstract_text}\n\nBody: {body_text}"
-                
-                # Build URL
-                if self.db_type == "pmc" or article_id.startswith("PMC"):
-                    url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{article_id}/"
-                else:
-                    url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/"
-                
-                return {
-                    "href": url,
-                    "url": url,
-                    "body": full_content,
-                    "raw_content": full_content,
-                    "title": title_text
-                }
-                
-            except ET.ParseError as e:
-                return None
-                
-        except requests.RequestException as e:
+        except requests.RequestException:
+            return None
+
+        return self._parse_article(article_id, response.text)
+
+    async def _search_articles_async(self, max_results: int) -> List[str]:
+        """
+        Search for article IDs based on query on the shared async client
+
+        Request errors and error statuses are raised, so the retriever health
+        registry counts them as failures.
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        response = await get_async_http_client().get(
+            self.base_search_url, params=self._build_search_params(max_results)
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        id_list = data.get('esearchresult', {}).get('idlist', [])
+        print(f"Found {len(id_list)} articles with full text available")
+        return id_list
+
+    async def _fetch_full_text_async(self, article_id: str) -> Optional[Dict[str, str]]:
+        """
+        Fetch full text content for a single article on the shared async client
+        """
+        import httpx
+
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        try:
+            response = await get_async_http_client().get(
+                self.base_fetch_url, params=self._build_fetch_params(article_id)
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
             return None
 
+        return self._parse_article(article_id, response.text)
+
+    async def search_async(self, max_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Performs the search and fetches the full text of every article concurrently.
+
+        :param max_results: Maximum number of results to return
+        :return: Same format as search()
+        """
+        article_ids = await self._search_articles_async(max_results)
+        if not article_ids:
+            return []
+
+        # Stay within NCBI's rate limit instead of sending every efetch at once
+        semaphore = asyncio.Semaphore(
+            FETCH_CONCURRENCY_WITH_API_KEY if self.api_key else FETCH_CONCURRENCY
+        )
+
+        async def fetch(article_id: str) -> Optional[Dict[str, str]]:
+            async with semaphore:
+                return await self._fetch_full_text_async(article_id)
+
+        articles = await asyncio.gather(*(fetch(article_id) for article_id in article_ids))
+        return [article for article in articles if article]
+
     def search(self, max_results: int = 5) -> List[Dict[str, Any]]:
         """
         Performs the search and retrieves full text content.
@@ -32,16 +32,12 @@ class SearchApiSearch():
                             "You can get a key at https://www.searchapi.io/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_request(self):
         """
-        Searches the query
+        Builds the SearchApi request
         Returns:
-
+            tuple: (encoded_url, headers)
         """
-        print("SearchApiSearch: Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using SearchApi."""
-
-
         url = "https://www.searchapi.io/api/v1/search"
         params = {
             "q": self.query,
@@ -54,31 +50,68 @@ class SearchApiSearch():
             'X-SearchApi-Source': 'gpt-researcher'
         }
 
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+        return url + "?" + urllib.parse.urlencode(params), headers
+
+    @staticmethod
+    def _parse_results(search_results, max_results):
+        """
+        Normalizes the organic results of a SearchApi response
+        """
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
+
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("SearchApiSearch: Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using SearchApi."""
+
+        encoded_url, headers = self._build_request()
         search_response = []
 
         try:
             response = requests.get(encoded_url, headers=headers, timeout=20)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._parse_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
 
         return search_response
+
+    async def search_async(self, max_results=7):
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        print("SearchApiSearch: Searching with query {0}...".format(self.query))
+
+        encoded_url, headers = self._build_request()
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().get(encoded_url, headers=headers, timeout=20)
+        response.raise_for_status()
+        return self._parse_results(response.json(), max_results)
@@ -36,36 +36,23 @@ class SearxSearch():
                 "You can find public instances at https://searx.space/"
             )
 
-    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+    def _build_params(self) -> Dict[str, str]:
         """
-        Searches the query using SearxNG API
-        Args:
-            max_results: Maximum number of results to return
-        Returns:
-            List of dictionaries containing search results
+        Builds the SearxNG query parameters
         """
-        search_url = urljoin(self.base_url, "search")
         # TODO: Add support for query domains
-        params = {
+        return {
             # The search query.
             'q': self.query,
             # Output format of results. Format needs to be activated in searxng config.
             'format': 'json'
         }
 
-        try:
-            response = requests.get(
-                search_url,
-                params=params,
-                headers={'Accept': 'application/json'}
-            )
-            response.raise_for_status()
-            results = response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error querying SearxNG: {str(e)}")
-        except json.JSONDecodeError:
-            raise Exception("Error parsing SearxNG response")
-
+    @staticmethod
+    def _parse_results(results, max_results: int) -> List[Dict[str, str]]:
+        """
+        Normalizes a SearxNG JSON response into href/body records
+        """
         if not isinstance(results, dict):
             return []
 
@@ -88,3 +75,57 @@ class SearxSearch():
                 break
 
         return search_response
+
+    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        search_url = urljoin(self.base_url, "search")
+
+        try:
+            response = requests.get(
+                search_url,
+                params=self._build_params(),
+                headers={'Accept': 'application/json'}
+            )
+            response.raise_for_status()
+            results = response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
+
+        return self._parse_results(results, max_results)
+
+    async def search_async(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API on the shared async HTTP client
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        import httpx
+
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        search_url = urljoin(self.base_url, "search")
+
+        try:
+            response = await get_async_http_client().get(
+                search_url,
+                params=self._build_params(),
+                headers={'Accept': 'application/json'}
+            )
+            response.raise_for_status()
+            results = response.json()
+        except httpx.HTTPError as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
+
+        return self._parse_results(results, max_results)
@@ -26,28 +26,22 @@ class SemanticScholarSearch:
         # rejects or silently ignores.
         self.sort = sort
 
-    def search(self, max_results: int = 20) -> List[Dict[str, str]]:
-        """
-        Perform the search on Semantic Scholar and return results.
-
-        :param max_results: Maximum number of results to retrieve
-        :return: List of dictionaries containing title, href, and body of each paper
-        """
-        params = {
+    def _build_params(self, max_results: int) -> Dict[str, str]:
+        return {
             "query": self.query,
             "limit": max_results,
-            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
+            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf,externalIds",
             "sort": self.sort,
         }
 
-        try:
-            response = requests.get(self.BASE_URL, params=params)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"An error occurred while accessing Semantic Scholar API: {e}")
-            return []
+    @staticmethod
+    def _parse_results(payload) -> List[Dict[str, str]]:
+        """
+        Keep open-access papers with a PDF link and normalize them.
 
-        payload = response.json()
+        :param payload: Decoded JSON response of the search endpoint
+        :return: List of dictionaries containing title, href, and body of each paper
+        """
         if not isinstance(payload, dict):
             return []
         results = payload.get("data") or []
@@ -64,12 +58,55 @@ class SemanticScholarSearch:
             href = pdf.get("url") or ""
             if not href:
                 continue
-            search_result.append(
-                {
-                    "title": result.get("title") or "No Title",
-                    "href": href,
-                    "body": result.get("abstract") or "Abstract not available",
+            paper = {
+                "title": result.get("title") or "No Title",
+                "href": href,
+                "body": result.get("abstract") or "Abstract not available",
+            }
+            # The PDF link rarely carries an identifier, so pass the paper's
+            # own IDs on for cross-retriever deduplication.
+            external_ids = result.get("externalIds")
+            if isinstance(external_ids, dict):
+                scholarly_ids = {
+                    kind: external_ids[key]
+                    for kind, key in (("doi", "DOI"), ("arxiv", "ArXiv"), ("pmcid", "PubMedCentral"))
+                    if external_ids.get(key)
                 }
-            )
+                if scholarly_ids:
+                    paper["scholarly_ids"] = scholarly_ids
+            search_result.append(paper)
 
         return search_result
+
+    def search(self, max_results: int = 20) -> List[Dict[str, str]]:
+        """
+        Perform the search on Semantic Scholar and return results.
+
+        :param max_results: Maximum number of results to retrieve
+        :return: List of dictionaries containing title, href, and body of each paper
+        """
+        try:
+            response = requests.get(self.BASE_URL, params=self._build_params(max_results))
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"An error occurred while accessing Semantic Scholar API: {e}")
+            return []
+
+        return self._parse_results(response.json())
+
+    async def search_async(self, max_results: int = 20) -> List[Dict[str, str]]:
+        """
+        Perform the search on Semantic Scholar using the shared async HTTP client.
+
+        :param max_results: Maximum number of results to retrieve
+        :return: List of dictionaries containing title, href, and body of each paper
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Request errors and error statuses (e.g. 429) are raised, so the
+        # retriever health registry counts them as failures
+        response = await get_async_http_client().get(
+            self.BASE_URL, params=self._build_params(max_results)
+        )
+        response.raise_for_status()
+        return self._parse_results(response.json())
@@ -33,15 +33,12 @@ class SerpApiSearch():
                             "You can get a key at https://serpapi.com/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_url(self):
         """
-        Searches the query
+        Builds the SerpApi request URL
         Returns:
-
+            str: The encoded URL
         """
-        print("SerpApiSearch: Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using SerpApi."""
-
         url = "https://serpapi.com/search.json"
 
         search_query = self.query
@@ -53,38 +50,72 @@ class SerpApiSearch():
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+        return url + "?" + urllib.parse.urlencode(params)
+
+    @staticmethod
+    def _parse_results(search_results, max_results):
+        """
+        Normalizes the organic results of a SerpApi response
+        """
+        search_response = []
+        if search_results:
+            # A response with no organic results (e.g. an error payload
+            # or a query that matched nothing) has no "organic_results"
+            # key; default to [] instead of raising KeyError.
+            results = search_results.get("organic_results") or []
+            results_processed = 0
+            for result in results:
+                if results_processed >= max_results:
+                    break
+                link = result.get("link")
+                # A result without a link is unusable; skip it rather
+                # than emitting an entry with href=None.
+                if not link:
+                    continue
+                # skip youtube results
+                if "youtube.com" in link:
+                    continue
+                search_result = {
+                    "title": result.get("title", ""),
+                    "href": link,
+                    "body": result.get("snippet", ""),
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
+
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using SerpApi."""
+
         search_response = []
         try:
-            response = requests.get(encoded_url, timeout=10)
+            response = requests.get(self._build_url(), timeout=10)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    # A response with no organic results (e.g. an error payload
-                    # or a query that matched nothing) has no "organic_results"
-                    # key; default to [] instead of raising KeyError.
-                    results = search_results.get("organic_results") or []
-                    results_processed = 0
-                    for result in results:
-                        if results_processed >= max_results:
-                            break
-                        link = result.get("link")
-                        # A result without a link is unusable; skip it rather
-                        # than emitting an entry with href=None.
-                        if not link:
-                            continue
-                        # skip youtube results
-                        if "youtube.com" in link:
-                            continue
-                        search_result = {
-                            "title": result.get("title", ""),
-                            "href": link,
-                            "body": result.get("snippet", ""),
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._parse_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
 
         return search_response
+
+    async def search_async(self, max_results=7):
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        response = await get_async_http_client().get(self._build_url(), timeout=10)
+        response.raise_for_status()
+        return self._parse_results(response.json(), max_results)
@@ -5,6 +5,10 @@ import os
 import requests
 import json
 
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+# Serper accepts up to 100 searches in one batched request
+SERPER_MAX_BATCH_SIZE = 100
+
 
 class SerperSearch():
     """
@@ -54,23 +58,26 @@ class SerperSearch():
                             "You can get a key at https://serper.dev/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_request(self, max_results):
         """
-        Searches the query with optional country, language, and time filtering
+        Builds the Serper request headers and JSON body for the query
         Returns:
-            list: List of search results with title, href, and body
+            tuple: (url, headers, data)
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Serper API."""
+        return SERPER_SEARCH_URL, self._build_headers(), json.dumps(self._build_search_params(max_results))
 
-        # Search the query (see https://serper.dev/playground for the format)
-        url = "https://google.serper.dev/search"
-
-        headers = {
+    def _build_headers(self):
+        return {
             'X-API-KEY': self.api_key,
             'Content-Type': 'application/json'
         }
 
+    def _build_search_params(self, max_results):
+        """
+        Builds the Serper search parameters for the query (see https://serper.dev/playground for the format)
+        Returns:
+            dict: The search parameters
+        """
         # Build search parameters
         query_with_filters = self.query
 
@@ -100,19 +107,29 @@ class SerperSearch():
         if self.time_range:
             search_params["tbs"] = self.time_range  # Time-based search
 
-        data = json.dumps(search_params)
-
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+        return search_params
 
-        # Preprocess the results. Always return a list so callers (which do
-        # `len(...)` / iterate over the result) never receive None.
-        if resp is None:
-            return []
+    @classmethod
+    def _parse_response(cls, text):
+        """
+        Normalizes a Serper response body into title/href/body records
+        Returns:
+            list: List of search results with title, href, and body
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return []
-        if search_results is None:
+        return cls._parse_results(search_results)
+
+    @staticmethod
+    def _parse_results(search_results):
+        """
+        Normalizes one decoded Serper search response into title/href/body records
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        if not isinstance(search_results, dict):
             return []
 
         results = search_results.get("organic") or []
@@ -137,3 +154,70 @@ class SerperSearch():
             )
 
         return search_results
+
+    def search(self, max_results=7):
+        """
+        Searches the query with optional country, language, and time filtering
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Serper API."""
+
+        url, headers, data = self._build_request(max_results)
+        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+
+        # Preprocess the results. Always return a list so callers (which do
+        # `len(...)` / iterate over the result) never receive None.
+        if resp is None:
+            return []
+        return self._parse_response(resp.text)
+
+    async def search_async(self, max_results=7):
+        """
+        Searches the query on the shared async HTTP client
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        print("Searching with query {0}...".format(self.query))
+
+        url, headers, data = self._build_request(max_results)
+        # Request errors and error statuses are raised, so the retriever
+        # health registry counts them as failures
+        resp = await get_async_http_client().post(url, timeout=10, headers=headers, content=data)
+        resp.raise_for_status()
+        return self._parse_response(resp.text)
+
+    @classmethod
+    async def search_many(cls, queries, max_results=7, query_domains=None):
+        """
+        Searches several queries with batched Serper requests
+        Args:
+            queries (list): The search query strings.
+            max_results (int): Maximum number of results per query.
+            query_domains (list, optional): List of domains to include in every search.
+        Returns:
+            list: One list of search results per query, in the order of the queries
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        retrievers = [cls(query, query_domains=query_domains) for query in queries]
+        if not retrievers:
+            return []
+        print(f"Searching {len(retrievers)} queries with one Serper batch request...")
+
+        results = []
+        for start in range(0, len(retrievers), SERPER_MAX_BATCH_SIZE):
+            batch = retrievers[start:start + SERPER_MAX_BATCH_SIZE]
+            data = json.dumps([retriever._build_search_params(max_results) for retriever in batch])
+            resp = await get_async_http_client().post(
+                SERPER_SEARCH_URL, timeout=30, headers=batch[0]._build_headers(), content=data
+            )
+            resp.raise_for_status()
+            responses = resp.json()
+            if not isinstance(responses, list) or len(responses) != len(batch):
+                raise ValueError("Serper batch response does not match the batched queries")
+            results.extend(cls._parse_results(response) for response in responses)
+        return results
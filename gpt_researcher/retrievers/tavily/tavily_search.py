@@ -58,7 +58,7 @@ class TavilySearch:
         return api_key
 
 
-    def _search(
+    def _build_payload(
         self,
         query: str,
         search_depth: Literal["basic", "advanced"] = "basic",
@@ -73,10 +73,9 @@ class TavilySearch:
         use_cache: bool = True,
     ) -> dict:
         """
-        Internal search method to send the request to the API.
+        Builds the request body for the search API.
         """
-
-        data = {
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -91,6 +90,12 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
+    def _search(self, query: str, **kwargs) -> dict:
+        """
+        Internal search method to send the request to the API.
+        """
+        data = self._build_payload(query, **kwargs)
+
         response = requests.post(
             self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
         )
@@ -101,48 +106,106 @@ class TavilySearch:
             # Raises a HTTPError if the HTTP request returned an unsuccessful status code
             response.raise_for_status()
 
+    async def _search_async(self, query: str, **kwargs) -> dict:
+        """
+        Internal search method to send the request to the API on the shared async client.
+        """
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        data = self._build_payload(query, **kwargs)
+        response = await get_async_http_client().post(
+            self.base_url, content=json.dumps(data), headers=self.headers, timeout=100
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _prepare_query(self) -> tuple[str, Optional[list]]:
+        """
+        Translates Google-style site: operators into include_domains.
+
+        LLM-generated queries often use them, and Tavily rejects them
+        (returning zero results).
+        """
+        query = self.query
+        include_domains = self.query_domains
+        site_domains = _SITE_OPERATOR_PATTERN.findall(query)
+        if site_domains:
+            query = _SITE_OPERATOR_PATTERN.sub("", query).strip()
+            # Keep only the domain part (Tavily matches domains, not paths)
+            site_domains = [d.strip(",").split("/")[0] for d in site_domains]
+            include_domains = list(dict.fromkeys(site_domains + (include_domains or [])))
+        # Tavily rejects queries longer than 400 chars
+        return query[:400], include_domains
+
+    @staticmethod
+    def _parse_results(results: dict, full_text: bool = False) -> list[dict]:
+        """
+        Normalizes the API response into href/body records.
+
+        With full_text, the page content Tavily returned is kept as raw_content.
+        """
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        # Guard each source against missing/None fields so a single
+        # malformed hit does not drop the whole page.
+        search_response = []
+        for obj in sources:
+            if not isinstance(obj, dict):
+                continue
+            href = obj.get("url")
+            if not href:
+                continue
+            body = obj.get("content") or obj.get("snippet") or ""
+            result = {"href": href, "body": body}
+            if full_text and obj.get("raw_content"):
+                result["raw_content"] = obj["raw_content"]
+            search_response.append(result)
+        return search_response
+
     def search(self, max_results=10):
         """
         Searches the query
         Returns:
 
         """
+        from gpt_researcher.retrievers.utils import full_text_enabled
+
         try:
-            # LLM-generated queries often use Google-style site: operators,
-            # which Tavily rejects (returning zero results). Translate them
-            # into Tavily's include_domains parameter instead.
-            query = self.query
-            include_domains = self.query_domains
-            site_domains = _SITE_OPERATOR_PATTERN.findall(query)
-            if site_domains:
-                query = _SITE_OPERATOR_PATTERN.sub("", query).strip()
-                # Keep only the domain part (Tavily matches domains, not paths)
-                site_domains = [d.strip(",").split("/")[0] for d in site_domains]
-                include_domains = list(dict.fromkeys(site_domains + (include_domains or [])))
-
-            # Search the query (Tavily rejects queries longer than 400 chars)
+            query, include_domains = self._prepare_query()
+            full_text = full_text_enabled()
             results = self._search(
-                query[:400],
+                query,
                 search_depth="basic",
                 max_results=max_results,
                 topic=self.topic,
                 include_domains=include_domains,
+                include_raw_content=full_text,
             )
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
-            # Return the results. Guard each source against missing/None
-            # fields so a single malformed hit does not drop the whole page.
-            search_response = []
-            for obj in sources:
-                if not isinstance(obj, dict):
-                    continue
-                href = obj.get("url")
-                if not href:
-                    continue
-                body = obj.get("content") or obj.get("snippet") or ""
-                search_response.append({"href": href, "body": body})
+            search_response = self._parse_results(results, full_text)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    async def search_async(self, max_results=10):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        from gpt_researcher.retrievers.utils import full_text_enabled
+
+        # Request errors are raised rather than turned into an empty response,
+        # so the retriever health registry counts them as failures
+        query, include_domains = self._prepare_query()
+        full_text = full_text_enabled()
+        results = await self._search_async(
+            query,
+            search_depth="basic",
+            max_results=max_results,
+            topic=self.topic,
+            include_domains=include_domains,
+            include_raw_content=full_text,
+        )
+        return self._parse_results(results, full_text)
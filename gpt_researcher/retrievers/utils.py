@@ -58,6 +58,34 @@ def check_pkg(pkg: str) -> None:
             f"`pip install -U {pkg_kebab}`"
         )
 
+def full_text_enabled() -> bool:
+    """
+    Checks whether retrievers should return full page content (RETRIEVER_FULL_TEXT).
+
+    Retrievers that support it then put the page text in each result's
+    raw_content, so those results skip the scrape phase.
+
+    Returns:
+        bool: True if full-text mode is enabled
+    """
+    return os.getenv("RETRIEVER_FULL_TEXT", "").strip().lower() in ("true", "1", "yes", "on")
+
+def make_snippet(text: str, max_length: int = 300) -> str:
+    """
+    Shortens page content to a snippet-sized body, cutting at a word boundary.
+
+    Args:
+        text (str): The page content
+        max_length (int): Maximum snippet length in characters
+
+    Returns:
+        str: The snippet
+    """
+    text = " ".join((text or "").split())
+    if len(text) <= max_length:
+        return text
+    return text[:max_length].rsplit(" ", 1)[0] + "..."
+
 # Valid retrievers for fallback
 VALID_RETRIEVERS = [
     "tavily",
@@ -80,6 +108,7 @@ VALID_RETRIEVERS = [
     "mcp",
     "xquik",
     "openalex",
+    "localindex",
     "mock"
 ]
 
@@ -1,15 +1,43 @@
+import asyncio
 import logging
 import time
 
-from bs4 import BeautifulSoup
-
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..pymupdf.pymupdf import parse_pdf
+from ..streaming import (
+    CHUNK_SIZE,
+    MAX_CONTENT_BYTES,
+    MAX_PDF_BYTES,
+    READ_BUDGET,
+    ContentRejected,
+    apeek,
+    aread_capped,
+    check_text_content_type,
+    content_length_exceeds,
+    declared_charset,
+    is_pdf,
+    peek,
+    read_capped,
+)
+from ..utils import EXTRACTION_ENGINE, extract_page
 
 logger = logging.getLogger(__name__)
 
 # Response codes worth one retry: rate limiting and transient server errors.
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_CONTENT_BYTES = 10 * 1024 * 1024  # Skip pages larger than 10MB
+
+
+def parse_page(content, url, declared_encoding=None, engine=None):
+    """Extract cleaned text, images and title from a fetched page body.
+
+    This is the scraper's CPU-bound step. It is a module-level function of
+    plain arguments so it can run in a worker process as well as a thread.
+    """
+    try:
+        return extract_page(content, url, declared_encoding, engine)
+
+    except Exception as e:
+        logger.error(f"Error parsing {url}: {e}")
+        return "", [], ""
 
 
 class BeautifulSoupScraper:
@@ -17,6 +45,26 @@ class BeautifulSoupScraper:
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
+        # Executor that scrape_async parses pages on. Scraper sets it to its
+        # worker pool's parse executor (worker processes or threads); None
+        # uses the event loop's default executor.
+        self.parse_executor = None
+        # (ETag, Last-Modified) of the fetched page, for revalidating cached copies
+        self.validators = None
+        # "pdf" once the fetched body turned out to be a PDF, whatever its URL
+        self.content_kind = "html"
+        # Download limits; Scraper sets them from the SCRAPER_MAX_CONTENT_BYTES,
+        # SCRAPER_MAX_PDF_BYTES and SCRAPER_READ_BUDGET settings. Pages announcing
+        # more than max_content_bytes are skipped, longer streamed ones truncated.
+        self.max_content_bytes = MAX_CONTENT_BYTES
+        self.max_pdf_bytes = MAX_PDF_BYTES
+        self.read_budget = READ_BUDGET
+        # HTML extraction engine; Scraper sets it from SCRAPER_EXTRACTION_ENGINE
+        self.extraction_engine = EXTRACTION_ENGINE
+        # Pages read and characters kept of a PDF body (0 = all); Scraper sets
+        # them from SCRAPER_PDF_MAX_PAGES and SCRAPER_PDF_MAX_CHARS
+        self.pdf_max_pages = 0
+        self.pdf_max_chars = 0
 
     def scrape(self):
         """Fetch the page and extract cleaned text, images and title.
@@ -25,45 +73,95 @@ class BeautifulSoupScraper:
             Tuple of (content, image_urls, title). Empty values are returned
             when the page cannot be fetched or yields no usable content.
         """
-        response = self._fetch()
-        if response is None:
+        page = self._fetch()
+        if page is None:
             return "", [], ""
 
-        try:
-            # response.encoding defaults to ISO-8859-1 when the Content-Type
-            # header omits a charset, which garbles many UTF-8 pages. Only
-            # trust it when the server actually declared a charset; otherwise
-            # let BeautifulSoup detect the encoding from the document itself.
-            content_type = response.headers.get("Content-Type", "")
-            declared_encoding = response.encoding if "charset" in content_type.lower() else None
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=declared_encoding
-            )
-
-            soup = clean_soup(soup)
+        if self.content_kind == "pdf":
+            return parse_pdf(page[0], self.link, self.pdf_max_pages, self.pdf_max_chars)
+        return self._parse(*page)
 
-            content = get_text_from_soup(soup)
+    async def scrape_async(self):
+        """Fetch the page on the shared async HTTP client and parse it off the event loop.
 
-            image_urls = get_relevant_images(soup, self.link)
+        Returns:
+            Same as scrape().
+        """
+        page = await self._fetch_async()
+        if page is None:
+            return "", [], ""
 
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        if self.content_kind == "pdf":
+            return await asyncio.get_running_loop().run_in_executor(
+                self.parse_executor, parse_pdf, page[0], self.link, self.pdf_max_pages, self.pdf_max_chars
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor, parse_page, page[0], self.link, page[1], self.extraction_engine
+        )
+
+    def _parse(self, content, declared_encoding=None):
+        """Extract cleaned text, images and title from the page body."""
+        return parse_page(content, self.link, declared_encoding, self.extraction_engine)
+
+    def _accepts(self, headers) -> bool:
+        """Check from the response headers whether the body is worth reading."""
+        content_type = headers.get("Content-Type")
+        pdf = is_pdf(content_type)
+        content_length = headers.get("Content-Length")
+        if content_length_exceeds(content_length, self.max_pdf_bytes if pdf else self.max_content_bytes):
+            logger.warning(f"Content too large for {self.link} ({content_length} bytes), skipping")
+            return False
+        if pdf:
+            return True
+        try:
+            check_text_content_type(content_type)
+        except ContentRejected as e:
+            logger.warning(f"Skipping {self.link}: {e}")
+            return False
+        return True
 
-            return content, image_urls, title
+    def _route(self, headers, head) -> dict:
+        """Pick how to read the rest of the body from its headers and first bytes.
 
-        except Exception as e:
-            logger.error(f"Error parsing {self.link}: {e}")
-            return "", [], ""
+        PDFs (e.g. behind /download?id=… links or DOI redirects) are read from
+        the open stream for the PDF extractor rather than parsed as HTML.
+        """
+        if is_pdf(headers.get("Content-Type"), head):
+            self.content_kind = "pdf"
+            return {
+                "max_bytes": self.max_pdf_bytes,
+                "read_budget": self.read_budget,
+                "truncate": False,
+                "text_only": False,
+            }
+        self.content_kind = "html"
+        return {"max_bytes": self.max_content_bytes, "read_budget": self.read_budget}
+
+    @staticmethod
+    def _response_validators(headers):
+        return headers.get("ETag"), headers.get("Last-Modified")
+
+    @staticmethod
+    def _declared_encoding(headers):
+        # Clients fall back to ISO-8859-1 (requests) or UTF-8 (httpx) when the
+        # Content-Type header omits a charset, which garbles many pages. Only
+        # trust a charset the server actually declared; otherwise let
+        # BeautifulSoup detect the encoding from the document itself.
+        return declared_charset(headers.get("Content-Type"))
 
     def _fetch(self):
         """GET the page, retrying once on transient failures.
 
-        Returns the response on success, or None when the page is
-        unreachable, an error status, or too large to be worth parsing.
+        The body is streamed with a byte cap and read budget, and binary
+        responses are dropped as soon as their headers or first bytes show it.
+
+        Returns (body, declared charset) on success, or None when the page is
+        unreachable, an error status, binary, or too large to be worth parsing.
+        A PDF body is read too, and content_kind is set to "pdf".
         """
         for attempt in (1, 2):
             try:
-                response = self.session.get(self.link, timeout=10)
+                response = self.session.get(self.link, timeout=10, stream=True)
             except Exception as e:
                 logger.warning(f"Request failed for {self.link} (attempt {attempt}): {e}")
                 if attempt == 1:
@@ -71,23 +169,76 @@ class BeautifulSoupScraper:
                     continue
                 return None
 
-            if response.status_code in RETRYABLE_STATUS_CODES and attempt == 1:
-                logger.warning(
-                    f"Got HTTP {response.status_code} for {self.link}, retrying once"
-                )
-                time.sleep(1)
-                continue
+            with response:
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt == 1:
+                    logger.warning(
+                        f"Got HTTP {response.status_code} for {self.link}, retrying once"
+                    )
+                    time.sleep(1)
+                    continue
 
-            if response.status_code >= 400:
-                # Don't parse error/paywall pages as if they were content
-                logger.warning(f"Got HTTP {response.status_code} for {self.link}, skipping")
-                return None
+                if response.status_code >= 400:
+                    # Don't parse error/paywall pages as if they were content
+                    logger.warning(f"Got HTTP {response.status_code} for {self.link}, skipping")
+                    return None
+
+                if not self._accepts(response.headers):
+                    return None
+                try:
+                    head, chunks = peek(response.iter_content(CHUNK_SIZE))
+                    body = read_capped(chunks, **self._route(response.headers, head))
+                except ContentRejected as e:
+                    logger.warning(f"Skipping {self.link}: {e}")
+                    return None
+                except Exception as e:
+                    logger.warning(f"Failed to read {self.link}: {e}")
+                    return None
+                self.validators = self._response_validators(response.headers)
+                return body, self._declared_encoding(response.headers)
 
-            content_length = response.headers.get("Content-Length")
-            if content_length and int(content_length) > MAX_CONTENT_BYTES:
-                logger.warning(f"Content too large for {self.link} ({content_length} bytes), skipping")
-                return None
+        return None
 
-            return response
+    async def _fetch_async(self):
+        """Async counterpart of _fetch on the shared pooled HTTP client.
+
+        Connections are kept alive and capped per host, HTTP/2 is used when
+        h2 is installed, and gzip/brotli bodies are decoded by httpx.
+        """
+        import httpx
+
+        from gpt_researcher.utils.http_client import get_async_http_client
+
+        # Send the configured User-Agent (kept on the requests session); the
+        # session's other defaults (Connection, Accept-Encoding) are httpx's job
+        headers = {}
+        if self.session is not None and self.session.headers.get("User-Agent"):
+            headers["User-Agent"] = self.session.headers["User-Agent"]
+        client = get_async_http_client()
+        for attempt in (1, 2):
+            try:
+                async with client.stream("GET", self.link, headers=headers, timeout=10) as response:
+                    if response.status_code in RETRYABLE_STATUS_CODES and attempt == 1:
+                        logger.warning(
+                            f"Got HTTP {response.status_code} for {self.link}, retrying once"
+                        )
+                    elif response.status_code >= 400:
+                        logger.warning(f"Got HTTP {response.status_code} for {self.link}, skipping")
+                        return None
+                    elif not self._accepts(response.headers):
+                        return None
+                    else:
+                        try:
+                            head, chunks = await apeek(response.aiter_bytes(CHUNK_SIZE))
+                            body = await aread_capped(chunks, **self._route(response.headers, head))
+                        except ContentRejected as e:
+                            logger.warning(f"Skipping {self.link}: {e}")
+                            return None
+                        self.validators = self._response_validators(response.headers)
+                        return body, self._declared_encoding(response.headers)
+            except httpx.HTTPError as e:
+                logger.warning(f"Request failed for {self.link} (attempt {attempt}): {e!r}")
+                if attempt == 2:
+                    return None
+            await asyncio.sleep(1)
 
         return None
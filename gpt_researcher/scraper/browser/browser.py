@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import traceback
 import pickle
 from pathlib import Path
@@ -9,7 +10,6 @@ import random
 import string
 import os
 
-from bs4 import BeautifulSoup
 from typing import Iterable, cast
 
 from .processing.scrape_skills import (scrape_pdf_with_pymupdf,
@@ -30,7 +30,8 @@ def _is_pdf_url(url: str) -> bool:
         return False
     return urlparse(url).path.lower().endswith(".pdf")
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..utils import EXTRACTION_ENGINE, extract_page
+from .driver_pool import PAGES_PER_DRIVER, get_driver_pool
 
 FILE_DIR = Path(__file__).parent.parent
 
@@ -45,6 +46,17 @@ class BrowserScraper:
                            "Chrome/128.0.0.0 Safari/537.36")
         self.driver = None
         self.use_browser_cookies = False
+        # Worker processes that page source is parsed in, set by Scraper when
+        # enabled; None parses on the calling thread
+        self.parse_executor = None
+        # Most warm drivers kept for this configuration; Scraper sizes it from
+        # MAX_SCRAPER_WORKERS, since that many pages are scraped at once
+        self.driver_pool_size = 4
+        # Pages a pooled driver loads before it is replaced; Scraper sets it
+        # from SCRAPER_BROWSER_PAGES_PER_DRIVER
+        self.driver_max_pages = PAGES_PER_DRIVER
+        # HTML extraction engine; Scraper sets it from SCRAPER_EXTRACTION_ENGINE
+        self.extraction_engine = EXTRACTION_ENGINE
         self._import_selenium()  # Import only if used to avoid unnecessary dependencies
         self.cookie_filename = f"{self._generate_random_string(8)}.pkl"
 
@@ -54,13 +66,13 @@ class BrowserScraper:
             return "", [], ""
 
         try:
-            self.setup_driver()
-            self._visit_google_and_save_cookies()
-            self._load_saved_cookies()
-            self._add_header()
+            # Reuse a warm driver from the shared pool instead of starting a browser per URL
+            with self._driver_pool().lease() as driver:
+                self.driver = driver
+                self._add_header()
 
-            text, image_urls, title = self.scrape_text_with_selenium()
-            return text, image_urls, title
+                text, image_urls, title = self.scrape_text_with_selenium()
+                return text, image_urls, title
         except Exception as e:
             print(f"An error occurred during scraping: {str(e)}")
             print("Full stack trace:")
@@ -69,9 +81,30 @@ class BrowserScraper:
             # error text being treated as page content downstream.
             return "", [], ""
         finally:
-            if self.driver:
-                self.driver.quit()
-            self._cleanup_cookie_file()
+            self.driver = None
+
+    def _driver_pool(self):
+        """Get the shared pool of drivers set up like this scraper's"""
+        key = (self.selenium_web_browser, self.headless, self.user_agent, self.use_browser_cookies)
+        return get_driver_pool(key, self._start_driver, self.driver_pool_size, self.driver_max_pages)
+
+    def _start_driver(self):
+        """Start a driver and warm it up with Google's cookies, for the pool"""
+        # Pools start drivers from several threads, so work on a copy of this scraper
+        starter = copy.copy(self)
+        starter.driver = None
+        starter.cookie_filename = f"{self._generate_random_string(8)}.pkl"
+        try:
+            starter.setup_driver()
+            starter._visit_google_and_save_cookies()
+            starter._load_saved_cookies()
+            return starter.driver
+        except Exception:
+            if starter.driver:
+                starter.driver.quit()
+            raise
+        finally:
+            starter._cleanup_cookie_file()
 
     def _import_selenium(self):
         try:
@@ -228,13 +261,14 @@ class BrowserScraper:
             page_source = self.driver.execute_script(
                 "return document.documentElement.outerHTML;"
             )
-            soup = BeautifulSoup(page_source, "lxml")
-
-            soup = clean_soup(soup)
-
-            text = get_text_from_soup(soup)
-            image_urls = get_relevant_images(soup, self.url)
-            title = extract_title(soup)
+            if self.parse_executor is not None:
+                text, image_urls, title = self.parse_executor.submit(
+                    extract_page, page_source, self.url, None, self.extraction_engine
+                ).result()
+            else:
+                text, image_urls, title = extract_page(
+                    page_source, self.url, engine=self.extraction_engine
+                )
 
         return text, image_urls, title
 
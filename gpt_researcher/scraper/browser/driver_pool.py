@@ -0,0 +1,181 @@
+"""
+Pool of long-lived Selenium drivers for BrowserScraper.
+
+Starting Chrome or Firefox and warming it up (visiting Google for cookies)
+takes seconds, so drivers are kept and reused across URLs and researchers
+instead of being started for every page. The pool is bounded. A driver is
+health-checked before it is reused, and replaced once it crashed or has loaded
+max_pages pages (the SCRAPER_BROWSER_PAGES_PER_DRIVER setting), since
+long-running browsers leak memory.
+"""
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default pages a driver loads before it is replaced by a fresh one (0 = never replaced)
+PAGES_PER_DRIVER = 50
+
+
+class _PooledDriver:
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    Thread-safe bounded pool of WebDriver instances.
+
+    Scrapes run on worker threads, so a lease blocks until a driver is free
+    when max_drivers are in use.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Any],
+        max_drivers: int = 4,
+        max_pages: int = PAGES_PER_DRIVER,
+    ):
+        """
+        Args:
+            create: Starts and warms up a new driver.
+            max_drivers: Most drivers alive at once.
+            max_pages: Pages a driver loads before it is replaced (0 = never).
+        """
+        self.create = create
+        self.max_drivers = max(1, int(max_drivers))
+        self.max_pages = max(0, int(max_pages))
+        self._idle: List[_PooledDriver] = []
+        self._alive = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def is_healthy(driver: Any) -> bool:
+        """Check that the browser still answers; it may have crashed or been closed."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @contextmanager
+    def lease(self):
+        """Borrow a driver for one page, starting one if none is idle and the pool isn't full."""
+        pooled = self._acquire()
+        failed = True
+        try:
+            yield pooled.driver
+            failed = False
+        finally:
+            self._release(pooled, failed)
+
+    def _acquire(self) -> _PooledDriver:
+        while True:
+            with self._condition:
+                while not self._idle and self._alive >= self.max_drivers and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    raise RuntimeError("The driver pool is closed")
+                if not self._idle:
+                    # Count the new driver now so other threads don't start one too
+                    self._alive += 1
+                    break
+                pooled = self._idle.pop()
+            # Checked outside the lock, since it's a round trip to the browser
+            if self.is_healthy(pooled.driver):
+                return pooled
+            logger.warning("Replacing a browser driver that stopped responding")
+            self._discard(pooled)
+
+        try:
+            return _PooledDriver(self.create())
+        except BaseException:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, pooled: _PooledDriver, failed: bool) -> None:
+        pooled.pages += 1
+        retire = bool(self.max_pages and pooled.pages >= self.max_pages)
+        # A failed scrape may just be a slow page; only drop the driver if it crashed
+        if failed and not retire:
+            retire = not self.is_healthy(pooled.driver)
+        with self._condition:
+            if not retire and not self._closed and self._alive <= self.max_drivers:
+                self._idle.append(pooled)
+                self._condition.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit browser driver: {e}")
+        with self._condition:
+            self._alive -= 1
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Quit the idle drivers; drivers in use are quit when they are returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+
+# Pools are shared process-wide, one per driver configuration, so every
+# researcher reuses the same warm browsers
+_pools: Dict[Hashable, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(
+    key: Hashable,
+    create: Callable[[], Any],
+    max_drivers: Optional[int] = None,
+    max_pages: Optional[int] = None,
+) -> DriverPool:
+    """
+    Get the shared pool of drivers configured as ``key``.
+
+    Args:
+        key: The driver configuration (browser, headless, user agent, ...).
+        create: Starts a driver, used when the pool needs a new one.
+        max_drivers: Size of the pool; an existing pool only grows to it.
+        max_pages: Pages a driver loads before it is replaced (0 = never,
+            None = PAGES_PER_DRIVER, or the existing pool's setting).
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pages = PAGES_PER_DRIVER if max_pages is None else max_pages
+            pool = _pools[key] = DriverPool(create, max_drivers or 4, pages)
+        else:
+            if max_pages is not None:
+                pool.max_pages = max(0, int(max_pages))
+            if max_drivers and max_drivers > pool.max_drivers:
+                with pool._condition:
+                    pool.max_drivers = max_drivers
+                    pool._condition.notify_all()
+        return pool
+
+
+def close_driver_pools() -> None:
+    """Quit every pooled driver (also done at exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_driver_pools)
@@ -2,15 +2,52 @@ from contextlib import asynccontextmanager
 import math
 from pathlib import Path
 import random
+import time
 import traceback
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 from typing import Dict, Literal, cast, Tuple, List
 import requests
 import asyncio
 import logging
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..utils import EXTRACTION_ENGINE, extract_page
+
+# Only text and image URLs are kept, so images, media and fonts aren't downloaded
+# (unless the SCRAPER_NODRIVER_BLOCK_RESOURCES setting turns blocking off)
+BLOCKED_RESOURCE_TYPES = ("Image", "Media", "Font")
+# Ad and analytics hosts, whose scripts keep pages busy without adding content
+BLOCKED_HOSTS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "segment.io",
+    "connect.facebook.net",
+    "ads-twitter.com",
+    "clarity.ms",
+)
+
+# Returns a snapshot of the page that changes while it is still loading or rendering
+DOM_SNAPSHOT_JS = (
+    "document.readyState + ':' + document.getElementsByTagName('*').length"
+    " + ':' + (document.body ? document.body.textContent.length : 0)"
+)
+
+
+def blocked_url_patterns() -> List[str]:
+    """Fetch URL patterns of the blocked hosts, matching each host itself and its subdomains"""
+    return [pattern for host in BLOCKED_HOSTS for pattern in (f"*://{host}/*", f"*://*.{host}/*")]
 
 
 class NoDriverScraper:
@@ -19,6 +56,25 @@ class NoDriverScraper:
     browser_load_threshold = 8
     browsers: set["NoDriverScraper.Browser"] = set()
     browsers_lock = asyncio.Lock()
+    # Seconds each domain's pages took to settle (moving average), used to
+    # bound the next wait on that domain
+    settle_times: Dict[str, float] = {}
+    min_settle_timeout = 1.0
+    max_settle_timeout = 6.0
+
+    @classmethod
+    def settle_timeout(cls, url: str) -> float:
+        """How long to wait for a page on this domain to settle"""
+        learned = cls.settle_times.get(cls.get_domain(url))
+        if learned is None:
+            return cls.max_settle_timeout
+        return min(cls.max_settle_timeout, max(cls.min_settle_timeout, 2 * learned))
+
+    @classmethod
+    def record_settle_time(cls, url: str, seconds: float) -> None:
+        domain = cls.get_domain(url)
+        previous = cls.settle_times.get(domain)
+        cls.settle_times[domain] = seconds if previous is None else 0.7 * previous + 0.3 * seconds
 
     @staticmethod
     def get_domain(url: str) -> str:
@@ -41,21 +97,52 @@ class NoDriverScraper:
             self.tab_mode = True
             self.max_scroll_percent = 500
             self.stopping = False
+            self.block_resources = True
 
-        async def get(self, url: str) -> "zendriver.Tab":
+        async def get(self, url: str, block_resources: bool | None = None) -> "zendriver.Tab":
+            """Open the url in a new tab, blocking heavy requests unless block_resources
+            is False (None = the browser's block_resources)"""
+            if block_resources is None:
+                block_resources = self.block_resources
             self.processing_count += 1
             try:
                 async with self.rate_limit_for_domain(url):
                     new_window = not self.has_blank_page
                     self.has_blank_page = False
+                    # Blocking has to be set up on the tab before it navigates
+                    target = "about:blank" if block_resources else url
                     if self.tab_mode:
-                        return await self.driver.get(url, new_tab=new_window)
+                        page = await self.driver.get(target, new_tab=new_window)
                     else:
-                        return await self.driver.get(url, new_window=new_window)
+                        page = await self.driver.get(target, new_window=new_window)
+                    if page is not None and block_resources:
+                        await self.block_heavy_requests(page)
+                        await page.get(url)
+                    return page
             except Exception:
                 self.processing_count -= 1
                 raise
 
+        async def block_heavy_requests(self, page: "zendriver.Tab"):
+            """Fail image, media and font requests and requests to ad and analytics hosts"""
+            cdp = zendriver.cdp
+            patterns = [
+                cdp.fetch.RequestPattern(resource_type=cdp.network.ResourceType(resource_type))
+                for resource_type in BLOCKED_RESOURCE_TYPES
+            ] + [cdp.fetch.RequestPattern(url_pattern=pattern) for pattern in blocked_url_patterns()]
+
+            async def fail(event: "zendriver.cdp.fetch.RequestPaused"):
+                await page.send(
+                    cdp.fetch.fail_request(event.request_id, cdp.network.ErrorReason.BLOCKED_BY_CLIENT)
+                )
+
+            # Only matching requests are paused; answer them off the event
+            # listener so it keeps reading the connection
+            page.add_handler(
+                cdp.fetch.RequestPaused, lambda event: asyncio.ensure_future(fail(event))
+            )
+            await page.send(cdp.fetch.enable(patterns=patterns))
+
         async def scroll_page_to_bottom(self, page: "zendriver.Tab"):
             total_scroll_percent = 0
             while True:
@@ -65,8 +152,8 @@ class NoDriverScraper:
                 scroll_percent = random.randrange(46, 97)
                 total_scroll_percent += scroll_percent
                 await page.scroll_down(scroll_percent)
-                await self.wait_or_timeout(page, "idle", 2)
-                await page.sleep(random.uniform(0.23, 0.56))
+                # Lazily loaded content settles much faster than the whole page
+                await self.wait_until_stable(page, timeout=1.5, quiet=0.25)
 
                 if total_scroll_percent >= self.max_scroll_percent:
                     break
@@ -96,6 +183,39 @@ class NoDriverScraper:
                     f"timeout waiting for {until} after {timeout} seconds"
                 )
 
+        async def wait_until_stable(
+            self,
+            page: "zendriver.Tab",
+            timeout: float = 6,
+            quiet: float = 0.5,
+            interval: float = 0.1,
+        ) -> float:
+            """
+            Wait until the page has loaded and its DOM stopped changing for `quiet` seconds.
+
+            Returns:
+                The seconds it took, or `timeout` if the page never settled.
+            """
+            start = time.monotonic()
+            last_snapshot = None
+            stable_since = start
+            while True:
+                now = time.monotonic()
+                try:
+                    snapshot = await page.evaluate(DOM_SNAPSHOT_JS)
+                except Exception:
+                    # The page is navigating (e.g. redirecting) and has no document yet
+                    snapshot = None
+                if snapshot != last_snapshot or not str(snapshot).startswith("complete"):
+                    last_snapshot = snapshot
+                    stable_since = now
+                elif now - stable_since >= quiet:
+                    return stable_since - start
+                if now - start >= timeout:
+                    NoDriverScraper.logger.debug(f"page did not settle after {timeout} seconds")
+                    return timeout
+                await asyncio.sleep(interval)
+
         async def close_page(self, page: "zendriver.Tab"):
             try:
                 await page.close()
@@ -186,6 +306,14 @@ class NoDriverScraper:
         self.url = url
         self.session = session
         self.debug = False
+        # Executor that pages are parsed on, set by Scraper; None uses the
+        # event loop's default executor
+        self.parse_executor = None
+        # HTML extraction engine; Scraper sets it from SCRAPER_EXTRACTION_ENGINE
+        self.extraction_engine = EXTRACTION_ENGINE
+        # Whether pages are loaded without images, media, fonts and ad/analytics
+        # hosts; Scraper sets it from SCRAPER_NODRIVER_BLOCK_RESOURCES
+        self.block_resources = True
 
     async def scrape_async(self) -> Tuple[str, list[dict], str]:
         """Returns tuple of (text, image_urls, title)"""
@@ -205,25 +333,23 @@ class NoDriverScraper:
                 self.logger.error(f"Failed to initialize browser: {str(e)}")
                 return str(e), [], ""
 
-            page = await browser.get(self.url)
+            page = await browser.get(self.url, self.block_resources)
             if page is None:
                 # browser.get() increments processing_count before returning;
                 # a None result means the connection timed out. Decrement to
                 # avoid leaking the slot and deadlocking the browser pool.
                 browser.processing_count -= 1
                 return "Browser failed to open page (returned None)", [], ""
-            await browser.wait_or_timeout(page, "complete", 2)
-            # wait for potential redirection
-            await page.sleep(random.uniform(0.3, 0.7))
-            await browser.wait_or_timeout(page, "idle", 2)
+            # Wait for the page, including any redirect, to settle, for at
+            # most about twice as long as this domain's pages usually take
+            settle_time = await browser.wait_until_stable(page, self.settle_timeout(self.url))
+            self.record_settle_time(self.url, settle_time)
 
             await browser.scroll_page_to_bottom(page)
             html = await page.get_content()
-            soup = BeautifulSoup(html, "lxml")
-            clean_soup(soup)
-            text = get_text_from_soup(soup)
-            image_urls = get_relevant_images(soup, self.url)
-            title = extract_title(soup)
+            text, image_urls, title = await asyncio.get_running_loop().run_in_executor(
+                self.parse_executor, extract_page, html, self.url, None, self.extraction_engine
+            )
 
             if len(text) < 200:
                 self.logger.warning(
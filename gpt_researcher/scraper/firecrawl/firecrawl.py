@@ -1,6 +1,5 @@
-from bs4 import BeautifulSoup
 import os
-from ..utils import get_relevant_images
+from ..utils import fetch_images_and_title, match_batch_results
 
 class FireCrawl:
 
@@ -36,6 +35,25 @@ class FireCrawl:
             server_url = 'https://api.firecrawl.dev'
         return server_url
 
+    def extract_batch(self, links: list) -> dict:
+        """
+        Extracts the content and title of several links with a single FireCrawl batch scrape.
+
+        Returns:
+          A dict of each link to its (markdown content, title), or to None if FireCrawl couldn't scrape it.
+        """
+        job = self.firecrawl.batch_scrape(links, formats=["markdown"], ignore_invalid_urls=True)
+        results = []
+        for document in job.data or []:
+            metadata = document.metadata
+            if metadata is None:
+                continue
+            if metadata.error or (metadata.status_code and metadata.status_code != 200):
+                print(f"Scrape failed! : {metadata.source_url or metadata.url} {metadata.error or metadata.status_code}")
+                continue
+            results.append((metadata.source_url or metadata.url, (document.markdown or "", metadata.title or "")))
+        return match_batch_results(links, results)
+
     def scrape(self) -> tuple:
         """
         This function extracts content and title from a specified link using the FireCrawl Python SDK,
@@ -66,14 +84,8 @@ class FireCrawl:
             content = response.markdown if response.markdown else ""
             title = response.metadata.title if response.metadata and response.metadata.title else ""
 
-            # Parse the HTML content of the response to create a BeautifulSoup object for the utility functions
-            response_bs = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response_bs.content, "lxml", from_encoding=response_bs.encoding
-            )
-
-            # Get relevant images using the utility function
-            image_urls = get_relevant_images(soup, self.link)
+            # Get relevant images from the page itself
+            image_urls, _ = fetch_images_and_title(self.link, self.session)
 
             return content, image_urls, title
 
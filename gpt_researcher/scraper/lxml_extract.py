@@ -0,0 +1,171 @@
+"""
+Single-pass page extraction on lxml.
+
+``extract_page_lxml`` produces the same text, image list and title as the
+BeautifulSoup pipeline (``clean_soup`` + ``get_text_from_soup`` +
+``get_relevant_images`` + ``extract_title``) without building a tree at all:
+it is the lxml parser's target, so text, images and the title are collected
+from the parser events as they stream by, and everything inside a dropped
+element (navigation, footers, scripts, ...) is ignored.
+
+To stay equivalent it makes the same choices BeautifulSoup's lxml builder
+does: the same encoding detection, the same lxml HTML parser (fed the same
+way, so markup after ``</html>`` is kept), and the same rule for which
+strings are page text (not comments, nor anything inside
+``script``/``style``/``template``/``rt``/``rp``).
+"""
+import re
+from typing import List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from bs4.dammit import EncodingDetector
+from lxml import etree
+
+from .utils import score_image
+
+# Same tags and classes clean_soup() decomposes
+DROPPED_TAGS = frozenset({"script", "style", "footer", "header", "nav", "menu", "sidebar", "svg"})
+DROPPED_CLASSES = frozenset({"nav", "menu", "sidebar", "footer"})
+# Tags whose strings BeautifulSoup stores as Script/Stylesheet/TemplateString/
+# RubyTextString/RubyParenthesisString, which get_text() leaves out
+HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+class _PageExtractor:
+    """lxml parser target that collects page text, <img> attributes and the title."""
+
+    def __init__(self):
+        self.parts = []
+        self.images = []
+        self.title = None
+        self._data = []
+        # Per open element outside dropped subtrees: (hides text, is the title)
+        self._open = []
+        # Open elements inside the current dropped subtree
+        self._dropped_depth = 0
+        self._hidden_depth = 0
+        self._title_start = None
+
+    def _flush(self):
+        # Text arrives in pieces; like BeautifulSoup, a string ends at the next
+        # tag, comment or processing instruction
+        if self._data:
+            string = "".join(self._data).strip()
+            self._data = []
+            if string and not self._dropped_depth and not self._hidden_depth:
+                self.parts.append(string)
+
+    def start(self, tag, attrib):
+        self._flush()
+        if self._dropped_depth:
+            self._dropped_depth += 1
+            return
+        classes = attrib.get("class")
+        if tag in DROPPED_TAGS or (classes and not DROPPED_CLASSES.isdisjoint(classes.split())):
+            self._dropped_depth = 1
+            return
+
+        if tag == "img" and "src" in attrib:
+            self.images.append(dict(attrib))
+        is_title = tag == "title" and self._title_start is None
+        if is_title:
+            self._title_start = len(self.parts)
+        hides_text = tag in HIDDEN_TEXT_TAGS
+        if hides_text:
+            self._hidden_depth += 1
+        self._open.append((hides_text, is_title))
+
+    def end(self, tag):
+        self._flush()
+        if self._dropped_depth:
+            self._dropped_depth -= 1
+            return
+        hides_text, is_title = self._open.pop()
+        if hides_text:
+            self._hidden_depth -= 1
+        if is_title:
+            self.title = "".join(self.parts[self._title_start:])
+
+    def data(self, data):
+        self._data.append(data)
+
+    def comment(self, text):
+        self._flush()
+
+    def pi(self, target, data=None):
+        self._flush()
+
+    def doctype(self, name, pubid, system):
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return self
+
+
+def parse_page(markup: Union[bytes, str], declared_encoding: Optional[str] = None) -> _PageExtractor:
+    """
+    Run a page through lxml's HTML parser the way BeautifulSoup(markup, "lxml") does.
+
+    Args:
+        markup: The page body, raw bytes or already decoded.
+        declared_encoding: Charset the server declared, tried first for bytes.
+
+    Returns:
+        The extractor holding the page's text parts, images and title.
+    """
+    if isinstance(markup, str):
+        if markup.startswith("\N{BYTE ORDER MARK}"):
+            markup = markup[1:]
+        strategies = [(markup, None), (markup.encode("utf8"), "utf8")]
+    else:
+        detector = EncodingDetector(
+            markup,
+            known_definite_encodings=[declared_encoding] if declared_encoding else [],
+            is_html=True,
+        )
+        strategies = ((detector.markup, encoding) for encoding in detector.encodings)
+
+    for data, encoding in strategies:
+        try:
+            parser = etree.HTMLParser(target=_PageExtractor(), recover=True, encoding=encoding)
+            parser.feed(data)
+            return parser.close()
+        except (UnicodeDecodeError, LookupError, etree.ParserError):
+            continue
+    raise ValueError("no encoding could parse the page")
+
+
+def extract_page_lxml(
+    markup: Union[bytes, str], url: str, declared_encoding: Optional[str] = None
+) -> Tuple[str, List[dict], str]:
+    """
+    Extract cleaned text, relevant images and title in one pass over the page.
+
+    Args:
+        markup: The page body, raw bytes or already decoded.
+        url: The page URL, to resolve image sources against.
+        declared_encoding: Charset the server declared, if any.
+
+    Returns:
+        Tuple of (text, image_urls, title), as the BeautifulSoup pipeline returns them.
+    """
+    page = parse_page(markup, declared_encoding)
+    text = _WHITESPACE_RUN.sub(" ", "\n".join(page.parts))
+    return text, _relevant_images(page.images, url), page.title or ""
+
+
+def _relevant_images(images, url: str) -> List[dict]:
+    """Score <img> attributes like get_relevant_images() does for soup tags."""
+    image_urls = []
+    for img in images:
+        img_src = urljoin(url, img["src"])
+        if not img_src.startswith(("http://", "https://")):
+            continue
+        score = score_image((img.get("class") or "").split(), img.get("width"), img.get("height"))
+        if score is not None:
+            image_urls.append({"url": img_src, "score": score})
+
+    return sorted(image_urls, key=lambda x: x["score"], reverse=True)[:10]
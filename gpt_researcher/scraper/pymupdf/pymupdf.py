@@ -1,8 +1,117 @@
-import os
+import logging
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
+
+from ..streaming import (
+    CHUNK_SIZE,
+    MAX_PDF_BYTES,
+    READ_BUDGET,
+    ContentRejected,
+    content_length_exceeds,
+    read_capped,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default of the SCRAPER_PDF_PARALLEL_PAGES setting: PDFs with more pages than
+# this are split across the parse worker processes, if any
+PDF_PARALLEL_PAGES = 64
+
+
+def _open_pdf(source):
+    import pymupdf
+
+    # Bytes are opened in memory; anything else is a local file path
+    if isinstance(source, (bytes, bytearray)):
+        return pymupdf.open(stream=source, filetype="pdf")
+    return pymupdf.open(source)
+
+
+def _page_texts(pdf, start: int, stop: int, max_chars: int = 0) -> list[str]:
+    texts = []
+    size = 0
+    for number in range(start, stop):
+        text = pdf[number].get_text().strip()
+        texts.append(text)
+        size += len(text) + 1
+        if max_chars and size >= max_chars:
+            break
+    return texts
+
+
+def extract_pdf_pages(source, start: int, stop: int, max_chars: int = 0) -> list[str]:
+    """
+    Extract the text of pages [start, stop) of a PDF.
+
+    This is a module-level function of plain arguments so page ranges of a
+    long PDF can be extracted in worker processes.
+    """
+    with _open_pdf(source) as pdf:
+        return _page_texts(pdf, start, min(stop, pdf.page_count), max_chars)
+
+
+def extract_pdf(
+    source,
+    executor=None,
+    workers: int = 1,
+    max_pages: int = 0,
+    max_chars: int = 0,
+    parallel_pages: int = PDF_PARALLEL_PAGES,
+) -> tuple[str, list[str], str]:
+    """
+    Extract the text and title of a PDF with PyMuPDF, without temp files or LangChain Documents.
+
+    Args:
+      source: The PDF's bytes, or a local file path.
+      executor: Worker processes to split a long PDF's pages across (None = extract here).
+      workers: Number of workers in ``executor``; a long PDF is split into at most this many page ranges.
+      max_pages: Pages read (0 = all).
+      max_chars: Characters of text kept (0 = all); reading stops once reached.
+      parallel_pages: Page count above which the PDF is split across ``executor``.
+
+    Returns:
+      Tuple of (content, image_urls, title), like PyMuPDFScraper.scrape().
+    """
+    with _open_pdf(source) as pdf:
+        if pdf.needs_pass:
+            raise ValueError("PDF is password protected")
+        title = (pdf.metadata or {}).get("title") or ""
+        page_count = min(pdf.page_count, max_pages) if max_pages else pdf.page_count
+        if executor is None or page_count <= max(1, parallel_pages):
+            texts = _page_texts(pdf, 0, page_count, max_chars)
+            executor = None
+    if executor is not None:
+        # One page range per worker, so the PDF is sent to each worker once
+        tasks = max(1, min(workers, page_count // max(1, parallel_pages)))
+        step = -(-page_count // tasks)
+        futures = [
+            executor.submit(extract_pdf_pages, source, start, min(start + step, page_count), max_chars)
+            for start in range(0, page_count, step)
+        ]
+        texts = [text for future in futures for text in future.result()]
+
+    content = "\n".join(texts)
+    if max_chars:
+        content = content[:max_chars]
+    return content, [], title
+
+
+def parse_pdf(body: bytes, link: str, max_pages: int = 0, max_chars: int = 0) -> tuple[str, list[str], str]:
+    """
+    Extract the text and title of a PDF that another scraper already downloaded.
+
+    Scrapers that find a PDF behind a link that didn't look like one hand the
+    body over here instead of downloading it again. This is a module-level
+    function of plain arguments so it can run in a worker process.
+
+    Returns:
+      Same as PyMuPDFScraper.scrape().
+    """
+    try:
+        return extract_pdf(body, max_pages=max_pages, max_chars=max_chars)
+    except Exception as e:
+        logger.error(f"Error loading PDF : {link} {e}")
+        return "", [], ""
 
 
 class PyMuPDFScraper:
@@ -17,6 +126,20 @@ class PyMuPDFScraper:
         """
         self.link = link
         self.session = session
+        # Worker processes that split long PDFs by page range. Scraper sets it to
+        # its worker pool's process executor, and parse_workers to its size;
+        # None extracts on this thread.
+        self.parse_executor = None
+        self.parse_workers = 1
+        # Download limits; Scraper sets them from the SCRAPER_MAX_PDF_BYTES and
+        # SCRAPER_READ_BUDGET settings
+        self.max_pdf_bytes = MAX_PDF_BYTES
+        self.read_budget = READ_BUDGET
+        # Extraction limits, set by Scraper from the SCRAPER_PDF_MAX_PAGES,
+        # SCRAPER_PDF_MAX_CHARS and SCRAPER_PDF_PARALLEL_PAGES settings
+        self.pdf_max_pages = 0
+        self.pdf_max_chars = 0
+        self.pdf_parallel_pages = PDF_PARALLEL_PAGES
 
     def is_url(self) -> bool:
         """
@@ -33,11 +156,11 @@ class PyMuPDFScraper:
 
     def scrape(self) -> tuple[str, list[str], str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        The `scrape` function reads the PDF from the provided link (either URL or local file) with
+        PyMuPDF and returns its text. Downloads are opened from memory.
 
         Returns:
-          str: A string representation of the loaded document.
+          tuple: The (content, image_urls, title) of the document.
         """
         try:
             if self.is_url():
@@ -45,42 +168,47 @@ class PyMuPDFScraper:
                     response = requests.get(self.link, timeout=(5, 30), stream=True)
                     response.raise_for_status()
                 except requests.exceptions.SSLError:
-                    import logging
-                    logging.getLogger(__name__).warning(
+                    logger.warning(
                         f"SSL verification failed for {self.link}, retrying without verification"
                     )
                     response = requests.get(self.link, timeout=(5, 30), stream=True, verify=False)
                     response.raise_for_status()
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                # Always clean up the downloaded temp file, even if loading fails
-                # (PyMuPDFLoader.load() can raise on a malformed/partial PDF).
                 try:
-                    loader = PyMuPDFLoader(temp_filename)
-                    doc = loader.load()
+                    content_length = response.headers.get("Content-Length")
+                    if content_length_exceeds(content_length, self.max_pdf_bytes):
+                        print(f"PDF too large ({content_length} bytes), skipping : {self.link}")
+                        return "", [], ""
+
+                    # Read into memory with a hard byte cap and read budget, so
+                    # chunked downloads can't grow without bound either.
+                    source = read_capped(
+                        response.iter_content(chunk_size=CHUNK_SIZE),
+                        max_bytes=self.max_pdf_bytes,
+                        read_budget=self.read_budget,
+                        truncate=False,
+                        text_only=False,
+                    )
                 finally:
-                    try:
-                        os.remove(temp_filename)
-                    except OSError:
-                        pass
+                    response.close()
             else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+                source = self.link
 
-            # Extract the content, image (if any), and title from the document.
-            image = []
-            # Retrieve content from ALL pages to ensure PDFs with cover pages pass validation.
-            content = "\n".join(page.page_content for page in doc)
-            title = doc[0].metadata.get("title", "") if doc else ""
-            return content, image, title
+            return extract_pdf(
+                source,
+                self.parse_executor,
+                workers=self.parse_workers,
+                max_pages=self.pdf_max_pages,
+                max_chars=self.pdf_max_chars,
+                parallel_pages=self.pdf_parallel_pages,
+            )
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
             return "", [], ""
+        except ContentRejected as e:
+            print(f"Download aborted ({e}) : {self.link}")
+            return "", [], ""
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
             return "", [], ""
@@ -14,6 +14,9 @@ from urllib.parse import urlparse
 import requests
 from colorama import Fore, init
 
+from gpt_researcher.utils.cassette import get_cassette
+from gpt_researcher.utils.page_cache import revalidate
+from gpt_researcher.utils.url_index import dedupe_urls
 from gpt_researcher.utils.workers import WorkerPool
 
 from . import (
@@ -26,6 +29,70 @@ from . import (
     TavilyExtract,
     WebBaseLoaderScraper,
 )
+from .streaming import ContentRejected, check_text_content_type, is_pdf, probe_content_type
+from .utils import apply_scraper_options, fetch_images_and_title
+
+
+# Scrapers that fetch pages through a third-party API, rate limited per
+# provider rather than per destination host
+PROVIDER_SCRAPERS = ("tavily_extract", "firecrawl")
+# Scrapers that load links in a browser or loader without seeing the response
+# first; their links are checked with a HEAD request so PDFs go to the PDF
+# scraper and other binaries are skipped. The "bs" scraper sniffs its own stream.
+ROUTED_SCRAPERS = ("browser", "nodriver", "web_base_loader")
+
+
+class _ExtractBatcher:
+    """
+    Collects the links an API scraper is asked for at about the same time and
+    extracts them with one call per batch of up to `batch_size` links
+    """
+
+    def __init__(self, extract, batch_size):
+        """
+        Args:
+            extract: Coroutine function taking a list of links and returning a
+                dict of each link to its page, or to None if it wasn't extracted
+            batch_size: Most links per call
+        """
+        self.extract = extract
+        self.batch_size = batch_size
+        self._pending = []
+        self._flush_scheduled = False
+        # Keep references to running batches so they aren't garbage collected
+        self._tasks = set()
+
+    async def get(self, link):
+        """Get a link's page once its batch has been extracted (None if it wasn't)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((link, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            # Scrapes started in the same pass reach here before this callback
+            # runs, so they all join the batch
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self):
+        self._flush_scheduled = False
+        while self._pending:
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        try:
+            pages = await self.extract([link for link, _ in batch])
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Batch extraction of {len(batch)} URLs failed: {e}")
+            pages = {}
+        for link, future in batch:
+            if not future.done():
+                future.set_result(pages.get(link))
 
 
 class Scraper:
@@ -33,14 +100,33 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(
+        self,
+        urls,
+        user_agent,
+        scraper,
+        worker_pool: WorkerPool,
+        page_cache=None,
+        cache_stats=None,
+        batch_size=1,
+        scraper_options=None,
+    ):
         """
         Initialize the Scraper class.
         Args:
             urls: List of URLs to scrape (duplicates will be removed)
+            batch_size: Most URLs extracted per call by API scrapers that take
+                several at once ("tavily_extract", "firecrawl"); 1 = one call per URL
+            page_cache: PageCache answering for pages scraped before (None = always scrape)
+            cache_stats: Dict whose "hits", "revalidated" and "misses" counters
+                the page cache lookups of this run are added to
+            scraper_options: Settings set on each scraper that has an attribute
+                of the same name, e.g. {"max_content_bytes": 10485760}
         """
-        # Optimization: Remove duplicate URLs to avoid redundant scraping
-        unique_urls = list(dict.fromkeys(urls))  # Preserves order while removing duplicates
+        # Optimization: Remove duplicate URLs to avoid redundant scraping. URLs that
+        # only differ in scheme, www., tracking params, AMP variant or fragment count
+        # as duplicates; the first original URL is kept.
+        unique_urls = dedupe_urls(urls)
         duplicates_removed = len(urls) - len(unique_urls)
 
         self.urls = unique_urls
@@ -53,6 +139,15 @@ class Scraper:
             self._check_pkg(self.scraper)
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self.page_cache = page_cache
+        self.cache_stats = cache_stats
+        # Response validators (ETag, Last-Modified) of the pages scraped, for the page cache
+        self._validators = {}
+        self.batch_size = batch_size
+        self.scraper_options = scraper_options or {}
+        self._batcher = None
+        if self.scraper in PROVIDER_SCRAPERS and batch_size > 1 and get_cassette() is None:
+            self._batcher = _ExtractBatcher(self._extract_batch, batch_size)
 
         # Log deduplication results if duplicates were found
         if duplicates_removed > 0:
@@ -108,12 +203,93 @@ class Scraper:
 
     async def extract_data_from_url(self, link, session):
         """
-        Extracts the data from the link with logging
+        Extracts the data from the link with logging, answering from the page cache when it can
         """
-        async with self.worker_pool.throttle():
+        if self.page_cache is None:
+            return await self._scrape_url(link, session)
+
+        # The cache blocks on SQLite, which another process may hold the write lock of
+        cached = await asyncio.to_thread(self.page_cache.get, link, self.scraper)
+        outcome = "hits"
+        if cached is not None and not cached["fresh"]:
+            # Stale: reuse it only if the server confirms the page is unchanged
+            async with self.worker_pool.throttle(link):
+                validators = await revalidate(
+                    link, cached["etag"], cached["last_modified"], session.headers.get("User-Agent")
+                )
+            if validators is None:
+                cached = None
+            else:
+                await asyncio.to_thread(self.page_cache.refresh, link, self.scraper, *validators)
+                outcome = "revalidated"
+        if cached is None:
+            outcome = "misses"
+        self._record_cache_outcome(outcome)
+
+        if cached is not None:
+            self.logger.info(f"Page cache {'hit' if outcome == 'hits' else 'revalidated'} for {link}")
+            return {
+                "url": link,
+                "raw_content": cached["content"],
+                "image_urls": cached["image_urls"],
+                "title": cached["title"],
+            }
+
+        result = await self._scrape_url(link, session)
+        if result["raw_content"] is not None:
+            await asyncio.to_thread(
+                self.page_cache.set,
+                link,
+                self.scraper,
+                result["raw_content"],
+                result["image_urls"],
+                result["title"],
+                *self._validators.pop(link, (None, None)),
+            )
+        return result
+
+    def _record_cache_outcome(self, outcome):
+        self.page_cache.record(outcome)
+        if isinstance(self.cache_stats, dict):
+            self.cache_stats[outcome] = self.cache_stats.get(outcome, 0) + 1
+
+    async def _scrape_url(self, link, session):
+        """
+        Scrapes the link with the configured scraper
+        """
+        scraper_key = default_key = self._scraper_key(link)
+        if self._batcher is not None and scraper_key == self.scraper:
+            result = await self._scrape_url_batched(link, session)
+            if result is not None:
+                return result
+            self.logger.warning(f"{self.scraper} couldn't extract {link}, falling back to BeautifulSoupScraper")
+            scraper_key = "bs"
+        provider = scraper_key if scraper_key in PROVIDER_SCRAPERS else None
+        async with self.worker_pool.throttle(link, provider):
             try:
-                Scraper = self.get_scraper(link)
+                if scraper_key in ROUTED_SCRAPERS and get_cassette() is None:
+                    scraper_key = await self._route_by_content_type(link, session)
+                    if scraper_key is None:
+                        return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+                if scraper_key == default_key:
+                    Scraper = self.get_scraper(link)
+                else:
+                    Scraper = self.get_scraper(link, scraper_key)
                 scraper = Scraper(link, session)
+                if hasattr(scraper, "parse_executor"):
+                    # Async scrapers fetch on the event loop and parse on the
+                    # pool. Sync scrapers already run on a worker thread, so
+                    # they only hand parsing off to worker processes.
+                    if hasattr(scraper, "scrape_async"):
+                        scraper.parse_executor = self.worker_pool.parse_executor
+                    else:
+                        scraper.parse_executor = self.worker_pool.process_executor
+                        if hasattr(scraper, "parse_workers"):
+                            scraper.parse_workers = self.worker_pool.parse_workers
+                if hasattr(scraper, "driver_pool_size"):
+                    # At most max_workers sync scrapes run at once, each needing a browser
+                    scraper.driver_pool_size = self.worker_pool.max_workers
+                apply_scraper_options(scraper, self.scraper_options)
 
                 # Get scraper name
                 scraper_name = scraper.__class__.__name__
@@ -130,46 +306,97 @@ class Scraper:
                     ) = await asyncio.get_running_loop().run_in_executor(
                         self.worker_pool.executor, scraper.scrape
                     )
+                validators = getattr(scraper, "validators", None)
+                if validators:
+                    self._validators[link] = validators
 
-                if len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                # Log results
-                self.logger.info(f"\nTitle: {title}")
-                self.logger.info(
-                    f"Content length: {len(content) if content else 0} characters"
-                )
-                self.logger.info(f"Number of images: {len(image_urls)}")
-                self.logger.info(f"URL: {link}")
-                self.logger.info("=" * 50)
-
-                if not content or len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                return {
-                    "url": link,
-                    "raw_content": content,
-                    "image_urls": image_urls,
-                    "title": title,
-                }
+                return self._page_result(link, content, image_urls, title)
 
             except Exception as e:
                 self.logger.error(f"Error processing {link}: {str(e)}")
                 return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
 
-    def get_scraper(self, link):
+    async def _scrape_url_batched(self, link, session):
+        """
+        Gets the link's content from a batch extraction call, and its images and title from the page
+
+        Returns:
+            The scraped data, or None if the batch didn't extract the link
+        """
+        page = await self._batcher.get(link)
+        if page is None:
+            return None
+        content, title = page
+        try:
+            async with self.worker_pool.throttle(link):
+                image_urls, page_title = await asyncio.get_running_loop().run_in_executor(
+                    self.worker_pool.executor, fetch_images_and_title, link, session
+                )
+        except Exception as e:
+            self.logger.warning(f"Failed to get images and title of {link}: {e}")
+            image_urls, page_title = [], ""
+
+        self.logger.info(f"\n=== Using {self.scraper} batch extraction ===")
+        return self._page_result(link, content, image_urls, title or page_title)
+
+    async def _extract_batch(self, links):
+        """
+        Extracts several links with one call to the configured API scraper
+        """
+        async with self.worker_pool.throttle(provider=self.scraper):
+            scraper = self.get_scraper(links[0])(links[0], self.session)
+            self.logger.info(f"Extracting {len(links)} URLs with one {scraper.__class__.__name__} call")
+            return await asyncio.get_running_loop().run_in_executor(
+                self.worker_pool.executor, scraper.extract_batch, links
+            )
+
+    def _page_result(self, link, content, image_urls, title):
+        """
+        Logs the scraped page and builds its result, dropping pages with too little content
+        """
+        if not content or len(content) < 100:
+            self.logger.warning(f"Content too short or empty for {link}")
+            return {
+                "url": link,
+                "raw_content": None,
+                "image_urls": [],
+                "title": title,
+            }
+
+        # Log results
+        self.logger.info(f"\nTitle: {title}")
+        self.logger.info(f"Content length: {len(content)} characters")
+        self.logger.info(f"Number of images: {len(image_urls)}")
+        self.logger.info(f"URL: {link}")
+        self.logger.info("=" * 50)
+
+        return {
+            "url": link,
+            "raw_content": content,
+            "image_urls": image_urls,
+            "title": title,
+        }
+
+    async def _route_by_content_type(self, link, session):
+        """
+        Check a link's Content-Type with a HEAD request before loading it in a browser
+
+        Returns:
+            "pdf" for PDFs, None for other binaries (not worth scraping), else
+            the configured scraper (also when the server doesn't answer HEAD)
+        """
+        content_type = await probe_content_type(link, session.headers.get("User-Agent"))
+        if is_pdf(content_type):
+            self.logger.info(f"{link} is a PDF, using PyMuPDFScraper")
+            return "pdf"
+        try:
+            check_text_content_type(content_type)
+        except ContentRejected as e:
+            self.logger.warning(f"Skipping {link}: {e}")
+            return None
+        return self.scraper
+
+    def get_scraper(self, link, scraper_key=None):
         """
         The function `get_scraper` determines the appropriate scraper class based on the provided link
         or a default scraper if none matches.
@@ -178,6 +405,8 @@ class Scraper:
           link: The `get_scraper` method takes a `link` parameter which is a URL link to a webpage or a
         PDF file. Based on the type of content the link points to, the method determines the appropriate
         scraper class to use for extracting data from that content.
+          scraper_key: Key of the scraper to use instead (e.g. "pdf" once the link's
+        Content-Type showed a PDF).
 
         Returns:
           The `get_scraper` method returns the scraper class based on the provided link. The method
@@ -197,21 +426,25 @@ class Scraper:
             "firecrawl": FireCrawl,
         }
 
-        scraper_key = None
+        scraper_class = SCRAPER_CLASSES.get(scraper_key or self._scraper_key(link))
+        if scraper_class is None:
+            raise Exception("Scraper not found.")
+
+        cassette = get_cassette()
+        if cassette is not None:
+            return cassette.wrap_scraper(scraper_class)
+        return scraper_class
 
+    def _scraper_key(self, link):
+        """
+        Get the key of the scraper for a link: "pdf", "arxiv" or the configured scraper
+        """
         # Inspect only the path component so query strings / fragments don't
         # hide the extension (e.g. signed CDN/S3 links like "…/doc.pdf?sig=…").
         # Match case-insensitively because ".PDF" is a perfectly valid suffix.
         path = urlparse(link).path
         if path.lower().endswith(".pdf"):
-            scraper_key = "pdf"
-        elif "arxiv.org" in link:
-            scraper_key = "arxiv"
-        else:
-            scraper_key = self.scraper
-
-        scraper_class = SCRAPER_CLASSES.get(scraper_key)
-        if scraper_class is None:
-            raise Exception("Scraper not found.")
-
-        return scraper_class
+            return "pdf"
+        if "arxiv.org" in link:
+            return "arxiv"
+        return self.scraper
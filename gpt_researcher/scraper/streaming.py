@@ -0,0 +1,284 @@
+"""
+Streaming download helpers with hard byte caps and early abort.
+
+Scrapers read response bodies through ``iter_capped`` / ``read_capped`` /
+``aread_capped`` instead of ``response.content`` so a page can never be larger than its cap
+in memory, whether or not the server sent Content-Length. Reads that exceed
+the wall-clock budget are aborted, and responses that turn out to be binary
+(by Content-Type or by their first bytes) are dropped before the rest of the
+body is downloaded.
+
+PDFs are recognized the same way (``is_pdf``), so scrapers can hand the
+already-open stream to the PDF extractor instead of downloading it again.
+"""
+import asyncio
+import itertools
+import re
+import time
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple
+
+# Defaults of the SCRAPER_MAX_CONTENT_BYTES, SCRAPER_MAX_PDF_BYTES and
+# SCRAPER_READ_BUDGET settings, which Scraper sets on the scrapers it creates.
+# Largest HTML/text body read, in bytes; longer pages are truncated
+MAX_CONTENT_BYTES = 10 * 1024 * 1024
+# Largest PDF downloaded, in bytes; larger PDFs are skipped
+MAX_PDF_BYTES = 50 * 1024 * 1024
+# Seconds a single body may take to download, however steadily it trickles in
+READ_BUDGET = 30.0
+
+CHUNK_SIZE = 64 * 1024
+
+# Content types that are never worth parsing as a web page
+_BINARY_CONTENT_TYPE = re.compile(
+    r"^(?:image|audio|video|font)/"
+    r"|^application/(?:pdf|zip|gzip|x-gzip|x-tar|x-7z-compressed|x-rar-compressed|x-bzip2"
+    r"|msword|vnd\.(?![^;]*\+(?:xml|json))[^;]*|x-shockwave-flash|wasm|x-msdownload|java-archive)\b",
+    re.IGNORECASE,
+)
+
+# Magic numbers of common binary formats served under misleading types
+_BINARY_SIGNATURES = (
+    (b"%PDF-", "PDF"),
+    (b"PK\x03\x04", "ZIP archive"),
+    (b"\x1f\x8b", "gzip archive"),
+    (b"\x89PNG", "PNG image"),
+    (b"GIF8", "GIF image"),
+    (b"\xff\xd8\xff", "JPEG image"),
+    (b"RIFF", "RIFF media"),
+    (b"OggS", "Ogg media"),
+    (b"ID3", "MP3 audio"),
+    (b"\x1aE\xdf\xa3", "Matroska/WebM video"),
+    (b"7z\xbc\xaf\x27\x1c", "7z archive"),
+    (b"Rar!", "RAR archive"),
+    (b"wOFF", "web font"),
+    (b"\x00asm", "WebAssembly"),
+)
+
+_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+PDF_CONTENT_TYPES = ("application/pdf", "application/x-pdf", "application/acrobat")
+
+
+class ContentRejected(Exception):
+    """Raised when a response body is not worth reading any further."""
+
+
+def declared_charset(content_type: Optional[str]) -> Optional[str]:
+    """Get the charset declared in a Content-Type header, if any."""
+    match = _CHARSET.search(content_type or "")
+    return match.group(1) if match else None
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """Get the media type of a Content-Type header, lowercased and without parameters."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def check_text_content_type(content_type: Optional[str]) -> None:
+    """Raise ContentRejected if the Content-Type announces a binary format."""
+    media = media_type(content_type)
+    if media and _BINARY_CONTENT_TYPE.search(media):
+        raise ContentRejected(f"binary Content-Type {media}")
+
+
+def is_pdf(content_type: Optional[str], head: bytes = b"") -> bool:
+    """Recognize a PDF by its Content-Type or, whatever it is labelled, its first bytes."""
+    return media_type(content_type) in PDF_CONTENT_TYPES or head.lstrip()[:5] == b"%PDF-"
+
+
+def sniff_binary(head: bytes) -> Optional[str]:
+    """
+    Recognize a binary body from its first bytes.
+
+    Args:
+        head: The first bytes of the body (a few hundred are enough).
+
+    Returns:
+        A description of the binary format, or None if the body looks like text.
+    """
+    stripped = head.lstrip()
+    for signature, description in _BINARY_SIGNATURES:
+        if stripped.startswith(signature):
+            return description
+    if head[4:8] == b"ftyp":
+        return "MP4/QuickTime media"
+    # Text (including UTF-8) has no NUL bytes; UTF-16 pages start with a BOM
+    if b"\x00" in head[:1024] and not head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return "binary data"
+    return None
+
+
+class _CappedReader:
+    """Checks chunks against the byte cap and read budget, sniffing the first bytes."""
+
+    def __init__(self, max_bytes: int, read_budget: float, truncate: bool, text_only: bool):
+        self.max_bytes = max_bytes
+        self.read_budget = read_budget
+        self.truncate = truncate
+        self.text_only = text_only
+        self.deadline = time.monotonic() + read_budget if read_budget and read_budget > 0 else None
+        self.size = 0
+        self.head = b""
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Check a chunk and get the part of it to keep; sets ``done`` at the cap."""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ContentRejected(f"read budget of {self.read_budget:g}s exceeded")
+        if self.text_only and len(self.head) < 512:
+            self.head += chunk[:1024 - len(self.head)]
+            if len(self.head) >= 512:
+                self.sniff()
+        self.size += len(chunk)
+        if self.max_bytes and self.size > self.max_bytes:
+            if not self.truncate:
+                raise ContentRejected(f"body larger than {self.max_bytes} bytes")
+            self.done = True
+            return chunk[:len(chunk) - (self.size - self.max_bytes)]
+        if self.truncate and self.max_bytes and self.size == self.max_bytes:
+            self.done = True
+        return chunk
+
+    def sniff(self) -> None:
+        binary = sniff_binary(self.head)
+        if binary:
+            raise ContentRejected(f"body is {binary}")
+
+    def finish(self) -> None:
+        # Bodies shorter than the sniffing window are sniffed once complete
+        if self.text_only and 0 < len(self.head) < 512:
+            self.sniff()
+
+
+def iter_capped(
+    chunks: Iterable[bytes],
+    max_bytes: int = MAX_CONTENT_BYTES,
+    read_budget: float = READ_BUDGET,
+    truncate: bool = True,
+    text_only: bool = True,
+) -> Iterator[bytes]:
+    """
+    Pass a streamed body through without ever reading more than ``max_bytes`` of it.
+
+    Args:
+        chunks: The body chunks, e.g. ``response.iter_content(CHUNK_SIZE)``.
+        max_bytes: Byte cap (0 = unlimited).
+        read_budget: Wall-clock seconds allowed for the whole read (0 = unlimited).
+        truncate: Stop at the cap and keep the prefix (HTML parses fine
+            truncated) instead of rejecting the body (e.g. for PDFs).
+        text_only: Reject bodies whose first bytes are a binary format.
+
+    Yields:
+        The body chunks, at most ``max_bytes`` in total.
+
+    Raises:
+        ContentRejected: The body is binary, over the cap without ``truncate``,
+            or took longer than the read budget.
+    """
+    reader = _CappedReader(max_bytes, read_budget, truncate, text_only)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        kept = reader.feed(chunk)
+        if kept:
+            yield kept
+        if reader.done:
+            return
+    reader.finish()
+
+
+def peek(chunks: Iterable[bytes]) -> Tuple[bytes, Iterator[bytes]]:
+    """
+    Read the first chunk of a streamed body to sniff it, without losing it.
+
+    Returns:
+        The first non-empty chunk (b"" for an empty body) and an iterator over
+        the whole body, that chunk included.
+    """
+    chunks = iter(chunks)
+    head = next((chunk for chunk in chunks if chunk), b"")
+    return head, itertools.chain((head,), chunks)
+
+
+async def apeek(chunks: AsyncIterable[bytes]) -> Tuple[bytes, AsyncIterator[bytes]]:
+    """Async counterpart of ``peek``, e.g. for ``response.aiter_bytes()``."""
+    chunks = chunks.__aiter__()
+    head = b""
+    async for chunk in chunks:
+        if chunk:
+            head = chunk
+            break
+
+    async def body():
+        yield head
+        async for chunk in chunks:
+            yield chunk
+
+    return head, body()
+
+
+def read_capped(chunks: Iterable[bytes], **kwargs) -> bytes:
+    """Read a streamed body into memory through ``iter_capped`` (same arguments)."""
+    return b"".join(iter_capped(chunks, **kwargs))
+
+
+async def aread_capped(
+    chunks: AsyncIterable[bytes],
+    max_bytes: int = MAX_CONTENT_BYTES,
+    read_budget: float = READ_BUDGET,
+    truncate: bool = True,
+    text_only: bool = True,
+) -> bytes:
+    """
+    Async counterpart of ``read_capped``, e.g. for ``response.aiter_bytes()``.
+
+    The read budget is also enforced while waiting for a chunk, so a stalled
+    connection is aborted on time.
+    """
+    reader = _CappedReader(max_bytes, read_budget, truncate, text_only)
+    body = bytearray()
+
+    async def read():
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            body.extend(reader.feed(chunk))
+            if reader.done:
+                return
+        reader.finish()
+
+    if reader.deadline is None:
+        await read()
+    else:
+        try:
+            await asyncio.wait_for(read(), timeout=read_budget)
+        except asyncio.TimeoutError:
+            raise ContentRejected(f"read budget of {read_budget:g}s exceeded") from None
+    return bytes(body)
+
+
+async def probe_content_type(url: str, user_agent: Optional[str] = None) -> Optional[str]:
+    """
+    Get a URL's Content-Type with a HEAD request on the shared async HTTP client.
+
+    Returns:
+        The Content-Type header, or None if the server didn't answer the HEAD
+        request (many don't support it) or didn't send one.
+    """
+    import httpx
+
+    from gpt_researcher.utils.http_client import get_async_http_client
+
+    headers = {"User-Agent": user_agent} if user_agent else {}
+    try:
+        response = await get_async_http_client().request("HEAD", url, headers=headers, timeout=10)
+    except httpx.HTTPError:
+        return None
+    if response.status_code >= 400:
+        return None
+    return response.headers.get("Content-Type")
+
+
+def content_length_exceeds(content_length: Optional[str], max_bytes: int) -> bool:
+    """Check a Content-Length header against a byte cap (0 = unlimited)."""
+    return bool(max_bytes) and bool(content_length) and content_length.strip().isdigit() and int(content_length) > max_bytes
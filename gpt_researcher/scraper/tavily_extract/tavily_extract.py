@@ -1,6 +1,5 @@
-from bs4 import BeautifulSoup
 import os
-from ..utils import get_relevant_images, extract_title
+from ..utils import fetch_images_and_title, match_batch_results
 
 class TavilyExtract:
 
@@ -23,6 +22,20 @@ class TavilyExtract:
                 "Tavily API key not found. Please set the TAVILY_API_KEY environment variable.")
         return api_key
 
+    def extract_batch(self, links: list) -> dict:
+        """
+        Extracts the content of several links with a single Tavily extract call.
+
+        Returns:
+          A dict of each link to its (content, title), or to None if Tavily couldn't extract it. Tavily
+        returns no title, so titles are empty and come from the page itself.
+        """
+        response = self.tavily_client.extract(urls=links)
+        return match_batch_results(
+            links,
+            ((result.get("url"), (result.get("raw_content") or "", "")) for result in response["results"]),
+        )
+
     def scrape(self) -> tuple:
         """
         This function extracts content from a specified link using the Tavily Python SDK, the title and
@@ -36,27 +49,16 @@ class TavilyExtract:
         """
 
         try:
-            response = self.tavily_client.extract(urls=self.link)
-            if response['failed_results']:
+            page = self.extract_batch([self.link])[self.link]
+            if page is None:
                 return "", [], ""
+            content, _ = page
 
-            # Parse the HTML content of the response to create a BeautifulSoup object for the utility functions
-            response_bs = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response_bs.content, "lxml", from_encoding=response_bs.encoding
-            )
-
-            # Since only a single link is provided to tavily_client, the results will contain only one entry.
-            content = response['results'][0]['raw_content']
-
-            # Get relevant images using the utility function
-            image_urls = get_relevant_images(soup, self.link)
-
-            # Extract the title using the utility function
-            title = extract_title(soup)
+            # Get relevant images and the title from the page itself
+            image_urls, title = fetch_images_and_title(self.link, self.session)
 
             return content, image_urls, title
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
@@ -12,6 +12,21 @@ from urllib.parse import parse_qs, urljoin, urlparse
 import bs4
 from bs4 import BeautifulSoup
 
+from .streaming import (
+    CHUNK_SIZE,
+    MAX_CONTENT_BYTES,
+    READ_BUDGET,
+    ContentRejected,
+    check_text_content_type,
+    declared_charset,
+    read_capped,
+)
+
+# Default engine that extracts text, images and title from fetched HTML (the
+# SCRAPER_EXTRACTION_ENGINE setting): "bs4" builds a BeautifulSoup tree,
+# "lxml" walks an lxml tree once (same output, faster)
+EXTRACTION_ENGINE = "bs4"
+
 
 def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
     """Extract relevant images from the page"""
@@ -24,26 +39,10 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         for img in all_images:
             img_src = urljoin(url, img['src'])
             if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
-                
+                score = score_image(img.get('class', []), img.get('width'), img.get('height'))
+                if score is None:
+                    continue  # Skip small images
+
                 image_urls.append({'url': img_src, 'score': score})
         
         # Sort images by score (highest first)
@@ -55,6 +54,28 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(classes: list, width: str = None, height: str = None) -> int:
+    """Score an image by its classes and size attributes; None means too small to keep"""
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        return 4  # Higher score
+    # Check for size attributes
+    if width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                return 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                return 2  # Lower score
+            elif width >= 800 or height >= 500:
+                return 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                return 0  # Lowest score
+            else:
+                return None  # Skip small images
+    return 0
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
@@ -81,6 +102,52 @@ def extract_title(soup: BeautifulSoup) -> str:
         return ""
     return title_tag.get_text(strip=True)
 
+def fetch_images_and_title(
+    url: str,
+    session,
+    timeout: float = 4,
+    max_bytes: int = MAX_CONTENT_BYTES,
+    read_budget: float = READ_BUDGET,
+) -> tuple:
+    """Fetch a page for the images and title that content extraction APIs don't return
+
+    The body is streamed with a byte cap and read budget like scraped pages,
+    and binary responses are dropped unread. Returns ([], "") for pages that
+    can't be read.
+    """
+    with session.get(url, timeout=timeout, stream=True) as response:
+        if response.status_code >= 400:
+            return [], ""
+        content_type = response.headers.get("Content-Type")
+        try:
+            check_text_content_type(content_type)
+            body = read_capped(
+                response.iter_content(CHUNK_SIZE), max_bytes=max_bytes, read_budget=read_budget
+            )
+        except ContentRejected as e:
+            logging.warning(f"Skipping images and title of {url}: {e}")
+            return [], ""
+    soup = BeautifulSoup(body, "lxml", from_encoding=declared_charset(content_type))
+    return get_relevant_images(soup, url), extract_title(soup)
+
+def match_batch_results(links: list, results) -> dict:
+    """
+    Map the per-URL results of a batch extraction call back to the links asked for.
+
+    APIs may echo a URL normalized or redirected, so URLs are also matched by their
+    canonical form. Links without a result map to None.
+    """
+    from gpt_researcher.utils.url_index import canonicalize_url
+
+    by_url = {}
+    by_canonical_url = {}
+    for url, page in results:
+        if not url:
+            continue
+        by_url[url] = page
+        by_canonical_url.setdefault(canonicalize_url(url), page)
+    return {link: by_url.get(link, by_canonical_url.get(canonicalize_url(link))) for link in links}
+
 def get_image_hash(image_url: str) -> str:
     """Calculate a simple hash based on the image filename and essential query parameters"""
     try:
@@ -141,4 +208,43 @@ def get_text_from_soup(soup: BeautifulSoup) -> str:
     text = soup.get_text(strip=True, separator="\n")
     # Remove excess whitespace
     text = re.sub(r"\s{2,}", " ", text)
-    return text
\ No newline at end of file
+    return text
+
+
+def extract_page(markup, url: str, declared_encoding: str = None, engine: str = None) -> tuple:
+    """Extract cleaned text, relevant images and title from a page's HTML.
+
+    Args:
+        markup: The page HTML, raw bytes or already decoded.
+        url: The page URL, to resolve image sources against.
+        declared_encoding: Charset the server declared for raw bytes, if any.
+        engine: "bs4" or "lxml"; defaults to EXTRACTION_ENGINE.
+
+    Returns:
+        Tuple of (text, image_urls, title).
+    """
+    engine = (engine or EXTRACTION_ENGINE).strip().lower()
+    if engine == "lxml":
+        from .lxml_extract import extract_page_lxml
+
+        return extract_page_lxml(markup, url, declared_encoding)
+    if engine != "bs4":
+        raise ValueError(f"Unknown extraction engine {engine!r}, expected 'bs4' or 'lxml'")
+
+    soup = BeautifulSoup(markup, "lxml", from_encoding=declared_encoding)
+    soup = clean_soup(soup)
+    return get_text_from_soup(soup), get_relevant_images(soup, url), extract_title(soup)
+
+
+def apply_scraper_options(scraper, options: dict) -> None:
+    """Set each option on a scraper that has an attribute of that name.
+
+    Cassette wrappers have a ``scraper_options`` dict instead, which they pass
+    on to the scraper they wrap once it is built.
+    """
+    if isinstance(getattr(scraper, "scraper_options", None), dict):
+        scraper.scraper_options.update(options)
+        return
+    for name, value in options.items():
+        if hasattr(scraper, name):
+            setattr(scraper, name, value)
@@ -31,7 +31,13 @@ class BrowserManager:
         self.researcher = researcher
         self.worker_pool = WorkerPool(
             researcher.cfg.max_scraper_workers,
-            researcher.cfg.scraper_rate_limit_delay
+            researcher.cfg.scraper_rate_limit_delay,
+            getattr(researcher.cfg, "max_scraper_concurrency", 0) or 0,
+            getattr(researcher.cfg, "max_parse_workers", 0) or 0,
+            host_rate=getattr(researcher.cfg, "scraper_host_rate_limit", 0.0) or 0.0,
+            host_burst=getattr(researcher.cfg, "scraper_host_burst", 1) or 1,
+            host_max_in_flight=getattr(researcher.cfg, "scraper_max_in_flight_per_host", 0) or 0,
+            provider_limits=getattr(researcher.cfg, "scraper_provider_rate_limits", None),
         )
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
@@ -52,9 +58,16 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
+        cache_stats = getattr(self.researcher, "page_cache_stats", None)
+        cached_before = self._cached_pages(cache_stats)
         scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
+            urls,
+            self.researcher.cfg,
+            self.worker_pool,
+            page_cache=getattr(self.researcher, "page_cache", None),
+            cache_stats=cache_stats,
         )
+        from_cache = self._cached_pages(cache_stats) - cached_before
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
@@ -63,7 +76,8 @@ class BrowserManager:
             await stream_output(
                 "logs",
                 "scraping_content",
-                f"📄 Scraped {len(scraped_content)} pages of content",
+                f"📄 Scraped {len(scraped_content)} pages of content"
+                + (f" ({from_cache} from the page cache)" if from_cache else ""),
                 self.researcher.websocket,
             )
             await stream_output(
@@ -83,6 +97,12 @@ class BrowserManager:
 
         return scraped_content
 
+    @staticmethod
+    def _cached_pages(cache_stats) -> int:
+        if not isinstance(cache_stats, dict):
+            return 0
+        return cache_stats.get("hits", 0) + cache_stats.get("revalidated", 0)
+
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
         Select most relevant images and remove duplicates based on image content.
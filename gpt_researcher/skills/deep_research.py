@@ -11,6 +11,7 @@ from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
 from ..utils.enum import ReportType, ReportSource, Tone
 from ..actions.query_processing import get_search_results
+from ..utils.url_index import CanonicalURLSet
 
 logger = logging.getLogger(__name__)
 
@@ -391,7 +392,7 @@ Return ONLY a JSON object using this exact schema:
         if citations is None:
             citations = {}
         if visited_urls is None:
-            visited_urls = set()
+            visited_urls = CanonicalURLSet()
 
         progress = ResearchProgress(depth, breadth)
 
@@ -415,7 +416,7 @@ Return ONLY a JSON object using this exact schema:
 
         all_learnings = learnings.copy()
         all_citations = citations.copy()
-        all_visited_urls = visited_urls.copy()
+        all_visited_urls = CanonicalURLSet(visited_urls)
         all_context = []
         all_sources = []
 
@@ -441,11 +442,18 @@ Return ONLY a JSON object using this exact schema:
                         visited_urls=self.visited_urls,
                         # Propagate MCP configuration to nested researchers
                         mcp_configs=self.researcher.mcp_configs,
-                        mcp_strategy=self.researcher.mcp_strategy
+                        mcp_strategy=self.researcher.mcp_strategy,
+                        search_cache=getattr(self.researcher, "search_cache", None),
                     )
 
                     # Conduct research
                     context = await researcher.conduct_research()
+                    if hasattr(self.researcher, "add_search_cache_stats"):
+                        self.researcher.add_search_cache_stats(researcher.get_search_cache_stats())
+                    if hasattr(self.researcher, "add_page_cache_stats"):
+                        self.researcher.add_page_cache_stats(researcher.get_page_cache_stats())
+                    if hasattr(self.researcher, "add_prefetch_stats"):
+                        self.researcher.add_prefetch_stats(researcher.get_prefetch_stats())
 
                     # Get results and visited URLs
                     visited = researcher.visited_urls
@@ -630,7 +638,7 @@ Return ONLY a JSON object using this exact schema:
             else str(item)
             for item in final_context
         )
-        self.researcher.visited_urls = results['visited_urls']
+        self.researcher.visited_urls = CanonicalURLSet(results['visited_urls'])
 
         # Set research sources
         if results.get('sources'):
@@ -8,14 +8,32 @@ and context gathering.
 import asyncio
 import logging
 import os
-import random
 
 from ..actions.agent_creator import choose_agent
-from ..actions.query_processing import get_search_results, plan_research_outline
+from ..actions.query_processing import (
+    deduplicate_sub_queries,
+    get_search_results,
+    get_search_results_many,
+    plan_research_outline,
+)
+from ..actions.retriever import get_retriever, get_retriever_name, run_retriever_search, supports_batch_search
+from ..actions.search_ranking import filter_results_by_snippet_similarity, rank_search_results, snippet_text
 from ..actions.utils import stream_output
 from ..document import DocumentLoader, LangChainDocumentLoader, OnlineDocumentLoader
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
+from ..utils.retriever_health import RetrieverUnavailableError
+from ..utils.scholarly import collapse_scholarly_duplicates
+
+# Successful searches a retriever needs before its p95 is trusted for hedging
+HEDGE_MIN_SAMPLES = 10
+
+
+def _consume_task_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
 
 
 class ResearchConductor:
@@ -46,11 +64,19 @@ class ResearchConductor:
         self._mcp_cache_lock = asyncio.Lock()
         # Track MCP query count for balanced mode
         self._mcp_query_count = 0
+        # Per-run memo of planning searches, so the sub-query that repeats the
+        # original query reuses them instead of searching again
+        self._search_memo: dict[tuple, asyncio.Task] = {}
+        # Scrapes of the planning results started while sub-queries are generated
+        self._speculative_scrapes: dict[tuple, asyncio.Task] = {}
 
-    async def plan_research(self, query, query_domains=None):
+    async def plan_research(self, query, query_domains=None, speculative_scrape: bool = False):
         """Gets the sub-queries from the query
         Args:
             query: original query
+            query_domains: domains to restrict the search to
+            speculative_scrape: start scraping the planning search's URLs while the
+                sub-queries are generated, for the sub-query that repeats the query
         Returns:
             List of queries
         """
@@ -61,15 +87,12 @@ class ResearchConductor:
             self.researcher.websocket,
         )
 
-        search_results = await get_search_results(
-            query,
-            self.researcher.retrievers[0],
-            query_domains,
-            researcher=self.researcher,
-            max_results=self.researcher.cfg.max_search_results_per_query,
-        )
+        search_results = await self._planning_search(query, query_domains)
         self.logger.info(f"Initial search results obtained: {len(search_results)} results")
 
+        if speculative_scrape:
+            await self._start_speculative_scrape(query, query_domains, search_results)
+
         await stream_output(
             "logs",
             "planning_research",
@@ -110,6 +133,8 @@ class ResearchConductor:
         # accumulated URLs into each subtopic researcher) so that already
         # scraped URLs are not fetched again.
         research_data = []
+        # Planning searches are only memoized for the duration of one run
+        self._search_memo.clear()
 
         if self.researcher.verbose:
             await stream_output(
@@ -357,14 +382,28 @@ class ResearchConductor:
                     self._mcp_results_cache = mcp_context
                     self.logger.info(f"MCP results cached: {len(mcp_context)} total context entries")
 
+        # The original query is researched too unless this is a sub researcher.
+        # Its planning results can then be scraped while sub-queries are generated.
+        search_original_query = self.researcher.report_type != "subtopic_report"
+        speculative_scrape = search_original_query and not scraped_data
+
         # Generate Sub-Queries including original query
-        sub_queries = await self.plan_research(query, query_domains)
+        try:
+            sub_queries = await self.plan_research(query, query_domains, speculative_scrape=speculative_scrape)
+        except Exception:
+            if speculative_scrape:
+                self._cancel_speculative_scrape(query, query_domains)
+            raise
         self.logger.info(f"Generated sub-queries: {sub_queries}")
         
         # If this is not part of a sub researcher, add original query to research for better results
-        if self.researcher.report_type != "subtopic_report":
+        if search_original_query:
             sub_queries.append(query)
 
+        sub_queries = await self._deduplicate_sub_queries(
+            sub_queries, original_query=query if search_original_query else None
+        )
+
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -375,6 +414,9 @@ class ResearchConductor:
                 sub_queries,
             )
 
+        if not scraped_data:
+            await self._batch_search_sub_queries(sub_queries, query_domains)
+
         # Using asyncio.gather to process the sub_queries asynchronously
         try:
             context = await asyncio.gather(
@@ -394,6 +436,9 @@ class ResearchConductor:
         except Exception as e:
             self.logger.error(f"Error during web search: {e}", exc_info=True)
             return []
+        finally:
+            if speculative_scrape:
+                self._cancel_speculative_scrape(query, query_domains)
 
     def _get_mcp_strategy(self) -> str:
         """
@@ -821,54 +866,467 @@ class ResearchConductor:
 
         return new_urls
 
-    async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
-        new_search_urls = []
+    @staticmethod
+    def _search_memo_key(query, query_domains) -> tuple:
+        return query.strip(), tuple(sorted(query_domains or []))
+
+    async def _memoized_search(self, retriever_class, query, query_domains: list | None = None):
+        """Runs a search once per run; concurrent and later callers share its results."""
+        key = (retriever_class,) + self._search_memo_key(query, query_domains)
+        task = self._search_memo.get(key)
+        if task is None:
+            task = asyncio.ensure_future(get_search_results(
+                query,
+                retriever_class,
+                query_domains,
+                researcher=self.researcher,
+                max_results=self.researcher.cfg.max_search_results_per_query,
+            ))
+            self._search_memo[key] = task
+        # Shield the shared search so one caller being cancelled doesn't cancel it for the others
+        return list(await asyncio.shield(task))
+
+    async def _planning_search(self, query, query_domains: list | None = None) -> list:
+        """Runs the planning search on the first retriever that answers.
+
+        Retrievers whose circuit is open or whose search fails are skipped.
+        Returns no results, so planning goes ahead without them, when none answers.
+        """
+        for retriever_class in self.researcher.retrievers:
+            try:
+                return await self._memoized_search(retriever_class, query, query_domains)
+            except RetrieverUnavailableError as e:
+                self.logger.warning(f"{e}, planning with the next retriever")
+            except Exception as e:
+                self.logger.error(
+                    f"Error searching with {retriever_class.__name__}: {e!r}, planning with the next retriever"
+                )
+        self.logger.warning(f"No retriever available for the planning search of '{query}'")
+        return []
+
+    async def _batch_search_sub_queries(self, sub_queries: list, query_domains: list | None = None) -> None:
+        """Resolves all sub-query searches of batching retrievers in one step.
+
+        Retrievers with a native ``search_many`` answer every sub-query in one
+        request and the results are memoized, so the per-sub-query fan-out reads
+        them instead of searching again. Other retrievers keep searching per
+        sub-query, where deadlines, hedging and RETRIEVER_FIRST_N_RESULTS apply.
+        If a batch fails, its retriever falls back to single searches.
+        """
+        retriever_classes = [
+            r for r in self.researcher.retrievers
+            if "mcpretriever" not in r.__name__.lower() and supports_batch_search(r)
+        ]
+
+        async def batch_search(retriever_class):
+            queries = list(dict.fromkeys(
+                sub_query for sub_query in sub_queries
+                if (retriever_class,) + self._search_memo_key(sub_query, query_domains) not in self._search_memo
+            ))
+            if len(queries) < 2:
+                return
+            try:
+                results = await get_search_results_many(
+                    queries,
+                    retriever_class,
+                    query_domains=query_domains,
+                    researcher=self.researcher,
+                    max_results=self.researcher.cfg.max_search_results_per_query,
+                    timeout=self._get_retriever_deadline(retriever_class),
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Batch search with {retriever_class.__name__} failed, searching sub-queries one by one: {e!r}"
+                )
+                return
+            self.logger.info(f"Resolved {len(queries)} sub-query searches with one {retriever_class.__name__} batch")
+            for sub_query in queries:
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(results.get(sub_query, []))
+                self._search_memo[(retriever_class,) + self._search_memo_key(sub_query, query_domains)] = future
+
+        await asyncio.gather(*(batch_search(retriever_class) for retriever_class in retriever_classes))
+
+    async def _start_speculative_scrape(self, query, query_domains, search_results):
+        """Starts scraping the URLs of search results in the background.
+
+        The URLs are picked as for any sub-query search, so the snippet filter
+        and scrape budget apply, and are claimed now so no other sub-query
+        schedules them again.
+        """
+        new_urls, _ = await self._select_urls_to_scrape(query, self._rank_search_results(query, [search_results]))
+        if new_urls:
+            self.logger.info(f"Speculatively scraping {len(new_urls)} URLs for '{query}'")
+            self._speculative_scrapes[self._search_memo_key(query, query_domains)] = asyncio.create_task(
+                self.researcher.scraper_manager.browse_urls(new_urls)
+            )
+
+    async def _collect_speculative_scrape(self, query, query_domains) -> list:
+        """Waits for the speculative scrape started for the query, if any."""
+        task = self._speculative_scrapes.pop(self._search_memo_key(query, query_domains), None)
+        if task is None:
+            return []
+        try:
+            return await task
+        except Exception as e:
+            self.logger.error(f"Error in speculative scrape for '{query}': {e}")
+            return []
+
+    def _cancel_speculative_scrape(self, query, query_domains) -> None:
+        task = self._speculative_scrapes.pop(self._search_memo_key(query, query_domains), None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _get_retriever_deadline(self, retriever_class) -> float | None:
+        """Get the search deadline in seconds for a retriever.
+
+        RETRIEVER_TIMEOUTS overrides (keyed by retriever name, e.g. "tavily",
+        or class name) take precedence over the global RETRIEVER_TIMEOUT.
+        Returns None when the retriever may run until it finishes.
+        """
+        cfg = self.researcher.cfg
+        overrides = getattr(cfg, "retriever_timeouts", None) or {}
+        deadline = getattr(cfg, "retriever_timeout", 0)
+        if retriever_class.__name__ in overrides:
+            deadline = overrides[retriever_class.__name__]
+        elif overrides:
+            deadline = overrides.get(get_retriever_name(retriever_class), deadline)
+        try:
+            deadline = float(deadline or 0)
+        except (TypeError, ValueError):
+            self.logger.warning(f"Invalid search deadline for {retriever_class.__name__}: {deadline!r}")
+            return None
+        return deadline if deadline > 0 else None
+
+    async def _run_retriever(self, retriever_class, query, query_domains: list):
+        """Runs a retriever's search for the query (or serves it from the search cache) within its deadline."""
+        memoized = self._search_memo.get((retriever_class,) + self._search_memo_key(query, query_domains))
+        if memoized is not None:
+            # Reuse the planning search for the sub-query that repeats the original query
+            return list(await asyncio.shield(memoized))
+
+        backup_class = self._get_hedge_retriever(retriever_class)
+        hedge_delay = None
+        if backup_class is not None:
+            hedge_delay = self.researcher.retriever_health.latency_percentile(
+                get_retriever_name(retriever_class), 95, min_samples=HEDGE_MIN_SAMPLES
+            )
+        if hedge_delay is None:
+            return await self._search_with_deadline(retriever_class, query, query_domains)
+
+        # Hedge: if the primary is slower than its usual p95, send the same
+        # query to the backup and take whichever answers first.
+        primary = asyncio.ensure_future(self._search_with_deadline(retriever_class, query, query_domains))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            self.logger.info(
+                f"{retriever_class.__name__} exceeded its p95 of {hedge_delay:.2f}s for '{query}', "
+                f"hedging with {backup_class.__name__}"
+            )
+            pending.add(asyncio.ensure_future(self._search_with_deadline(backup_class, query, query_domains)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result():
+                        # The loser keeps running within its deadline so its latency is still recorded
+                        for other in pending:
+                            other.add_done_callback(_consume_task_exception)
+                        return task.result()
+            # Neither returned results: surface the primary's outcome
+            return primary.result()
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            raise
+
+    async def _search_with_deadline(self, retriever_class, query, query_domains: list):
+        # Native async retrievers are cancelled on timeout. Sync ones run in a
+        # thread that cannot be interrupted, so their search finishes in the
+        # background and its result is discarded. The deadline is enforced
+        # inside get_search_results so only it, not the caller cancelling the
+        # search, counts as a failure in the retriever's health.
+        return await get_search_results(
+            query,
+            retriever_class,
+            query_domains=query_domains,
+            researcher=self.researcher,
+            max_results=self.researcher.cfg.max_search_results_per_query,
+            timeout=self._get_retriever_deadline(retriever_class),
+        )
+
+    def _get_hedge_retriever(self, retriever_class):
+        """Get the backup retriever configured in RETRIEVER_HEDGE_BACKUPS for a retriever, if any."""
+        if getattr(self.researcher, "retriever_health", None) is None:
+            return None
+        backups = getattr(self.researcher.cfg, "retriever_hedge_backups", None) or {}
+        backup_name = backups.get(retriever_class.__name__) or backups.get(get_retriever_name(retriever_class))
+        if not backup_name:
+            return None
+        backup_class = get_retriever(backup_name)
+        if backup_class is None or backup_class is retriever_class:
+            self.logger.warning(f"Invalid hedge backup retriever for {retriever_class.__name__}: {backup_name!r}")
+            return None
+        return backup_class
+
+    @staticmethod
+    def _is_prefetched(result) -> bool:
+        """Checks whether a retriever already fetched the full page of a search result."""
+        # Only raw_content signals that a retriever already fetched the full page.
+        # body is snippet-sized text for most web retrievers and still needs scraping.
+        raw_content = result.get("raw_content")
+        return bool(raw_content) and len(raw_content) > 100
+
+    @classmethod
+    def _split_search_results(cls, search_results) -> tuple[list, list]:
+        """Separates results that already have content from those needing scraping."""
+        urls = []
         prefetched_content = []
+        for result in search_results:
+            url = result.get("href") or result.get("url")
+            if url and cls._is_prefetched(result):
+                prefetched_content.append({
+                    "url": url,
+                    "raw_content": result["raw_content"],
+                })
+            elif url:
+                urls.append(url)
+        return urls, prefetched_content
+
+    def _record_prefetched_results(self, retriever_class, query: str, search_results: list) -> None:
+        """Logs and counts how many of a retriever's results came with their page content."""
+        prefetched = sum(1 for result in search_results if self._is_prefetched(result))
+        retriever_name = get_retriever_name(retriever_class)
+        stats = getattr(self.researcher, "prefetch_stats", None)
+        if isinstance(stats, dict):
+            counts = stats.setdefault(retriever_name, {"results": 0, "prefetched": 0})
+            counts["results"] += len(search_results)
+            counts["prefetched"] += prefetched
+        if prefetched:
+            self.logger.info(
+                f"{retriever_name} returned {prefetched} of {len(search_results)} results "
+                f"for '{query}' with full content, skipping their scrape"
+            )
+
+    async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
         if query_domains is None:
             query_domains = []
 
-        # Iterate through the currently set retrievers
-        # This allows the method to work when retrievers are temporarily modified
-        for retriever_class in self.researcher.retrievers:
-            # Skip MCP retrievers as they don't provide URLs for scraping
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
+        # Use the currently set retrievers so the method works when retrievers
+        # are temporarily modified. MCP retrievers are skipped as they don't
+        # provide URLs for scraping.
+        retriever_classes = [
+            r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()
+        ]
+        first_n_results = getattr(self.researcher.cfg, "retriever_first_n_results", 0) or 0
+
+        # Fan out to all retrievers at once so a sub-query costs the slowest
+        # retriever (or its deadline) rather than the sum of all of them.
+        tasks = {
+            asyncio.create_task(self._run_retriever(retriever_class, query, query_domains)): index
+            for index, retriever_class in enumerate(retriever_classes)
+        }
+        results_by_retriever = {}
+        result_count = 0
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    retriever_class = retriever_classes[tasks[task]]
+                    try:
+                        search_results = task.result()
+                    except asyncio.TimeoutError:
+                        self.logger.warning(
+                            f"{retriever_class.__name__} exceeded its "
+                            f"{self._get_retriever_deadline(retriever_class)}s deadline for '{query}'"
+                        )
+                        continue
+                    except RetrieverUnavailableError as e:
+                        self.logger.info(str(e))
+                        continue
+                    except Exception as e:
+                        self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+                        continue
+                    if search_results:
+                        results_by_retriever[tasks[task]] = search_results
+                        result_count += len(search_results)
+                        self._record_prefetched_results(retriever_class, query, search_results)
+
+                if first_n_results and pending and result_count >= first_n_results:
+                    self.logger.info(
+                        f"Got {result_count} results for '{query}', "
+                        f"not waiting for {len(pending)} slower retriever(s)"
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Fuse the retrievers' rankings, in retriever order so the output
+        # doesn't depend on which provider happened to answer first.
+        ranked_results = self._rank_search_results(
+            query, [results_by_retriever[index] for index in sorted(results_by_retriever)]
+        )
+        new_search_urls, prefetched_content = await self._select_urls_to_scrape(query, ranked_results)
+        if prefetched_content:
+            self.researcher.add_research_sources([{"url": item["url"]} for item in prefetched_content])
 
-            try:
-                # Instantiate the retriever with the sub-query
-                retriever = retriever_class(query, query_domains=query_domains)
+        return new_search_urls, prefetched_content
 
-                # Perform the search using the current retriever
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-                )
+    def _rank_search_results(self, query, result_lists: list) -> list:
+        """Fuses the result lists of several retrievers into one ranking."""
+        cfg = self.researcher.cfg
+        return rank_search_results(
+            result_lists,
+            query,
+            rrf_k=getattr(cfg, "search_rrf_k", 60) or 60,
+            snippet_boost=getattr(cfg, "search_snippet_boost", 0.0) or 0.0,
+        )
 
-                if not search_results:
-                    continue
-
-                # Separate results that already have content from those needing scraping
-                for result in search_results:
-                    url = result.get("href") or result.get("url")
-                    raw_content = result.get("raw_content")
-                    if url and raw_content and len(raw_content) > 100:
-                        # Only raw_content signals that a retriever already fetched the full page.
-                        # body is snippet-sized text for most web retrievers and still needs scraping.
-                        prefetched_content.append({
-                            "url": url,
-                            "raw_content": raw_content,
-                        })
-                        self.researcher.add_research_sources([{"url": url}])
-                    elif url:
-                        new_search_urls.append(url)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+    async def _select_urls_to_scrape(self, query, ranked_results: list) -> tuple[list, list]:
+        """Picks and claims the URLs of ranked search results to scrape.
+
+        Returns the new URLs and the results that already carry full text,
+        which need no scraping.
+        """
+        ranked_results = self._collapse_scholarly_duplicates(query, ranked_results)
+        new_search_urls, prefetched_content = self._split_search_results(ranked_results)
+
+        # Only the best-ranked unvisited URLs are scraped; the rest stay
+        # unvisited so another sub-query can still pick them up.
+        new_search_urls = [url for url in new_search_urls if url not in self.researcher.visited_urls]
+        new_search_urls = await self._filter_urls_by_snippet_similarity(query, new_search_urls, ranked_results)
+        scrape_budget = getattr(self.researcher.cfg, "scrape_budget_per_query", 0) or 0
+        if scrape_budget and len(new_search_urls) > scrape_budget:
+            self.logger.info(
+                f"Scraping the top {scrape_budget} of {len(new_search_urls)} URLs for '{query}'"
+            )
+            new_search_urls = new_search_urls[:scrape_budget]
 
         # Get unique URLs
         new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
 
         return new_search_urls, prefetched_content
 
+    def _collapse_scholarly_duplicates(self, query, ranked_results: list) -> list:
+        """Keeps one source per paper, dropping papers this research already covered.
+
+        Disabled when SCHOLARLY_CACHE is "none". The same paper reached through
+        arXiv, doi.org, a publisher PDF or PMC is only scraped once, from its
+        preferred source.
+        """
+        scholarly_cache = getattr(self.researcher, "scholarly_cache", None)
+        if scholarly_cache is None or not ranked_results:
+            return ranked_results
+
+        ranked_results = scholarly_cache.annotate(ranked_results)
+        researched_urls = list(self.researcher.visited_urls)
+        researched_urls.extend(
+            source.get("url") for source in self.researcher.research_sources if isinstance(source, dict)
+        )
+        collapsed, dropped = collapse_scholarly_duplicates(
+            ranked_results, scholarly_cache.visited_paper_keys(researched_urls)
+        )
+        if dropped:
+            self.logger.info(
+                f"Dropped {dropped} of {len(ranked_results)} results for '{query}' "
+                f"that duplicate another copy of the same paper"
+            )
+        return collapsed
+
+    async def _deduplicate_sub_queries(self, sub_queries: list, original_query: str | None = None) -> list:
+        """Merges near-duplicate sub-queries so each topic is only searched once.
+
+        Disabled unless SUB_QUERY_SIMILARITY_THRESHOLD is set. When the original
+        query is researched too it always survives, and stays last, so
+        sub-queries that merely paraphrase it are the ones dropped.
+        """
+        threshold = getattr(self.researcher.cfg, "sub_query_similarity_threshold", 0) or 0
+        if not threshold or len(sub_queries) < 2:
+            return sub_queries
+
+        ordered = list(sub_queries)
+        if original_query is not None and original_query in ordered:
+            ordered.remove(original_query)
+            ordered.insert(0, original_query)
+
+        try:
+            embeddings = self.researcher.memory.get_embeddings()
+        except Exception as e:
+            self.logger.warning(f"Could not load embeddings for sub-query de-duplication: {e}")
+            embeddings = None
+
+        unique_queries, merged = await deduplicate_sub_queries(ordered, embeddings, float(threshold))
+        if not merged:
+            return sub_queries
+
+        if embeddings is not None:
+            try:
+                self.researcher.add_costs(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=ordered))
+            except Exception as e:
+                self.logger.debug(f"Could not estimate sub-query embedding cost: {e}")
+
+        if original_query is not None and unique_queries and unique_queries[0] == original_query:
+            unique_queries = unique_queries[1:] + [original_query]
+
+        self.logger.info(f"Merged near-duplicate sub-queries: {merged}")
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "merged_sub_queries",
+                f"🧹 Merged {len(sub_queries) - len(unique_queries)} near-duplicate sub-queries",
+                self.researcher.websocket,
+                True,
+                merged,
+            )
+        return unique_queries
+
+    async def _filter_urls_by_snippet_similarity(self, query, urls: list, search_results: list) -> list:
+        """Drops URLs whose search snippet is not similar enough to the query.
+
+        Disabled unless SNIPPET_SIMILARITY_THRESHOLD is set. The query and all
+        snippets are embedded in one batch, which is far cheaper than scraping
+        and chunk-embedding pages that turn out to be irrelevant.
+        """
+        threshold = getattr(self.researcher.cfg, "snippet_similarity_threshold", 0) or 0
+        if not threshold or not urls:
+            return urls
+
+        results_by_url = {}
+        for result in search_results:
+            url = result.get("href") or result.get("url")
+            if url:
+                results_by_url.setdefault(url, result)
+        candidates = [results_by_url.get(url, {"href": url}) for url in urls]
+
+        try:
+            kept = await filter_results_by_snippet_similarity(
+                query, candidates, self.researcher.memory.get_embeddings(), float(threshold)
+            )
+        except Exception as e:
+            self.logger.warning(f"Snippet relevance filter failed, keeping all URLs: {e}")
+            return urls
+
+        try:
+            self.researcher.add_costs(estimate_embedding_cost(
+                model=OPENAI_EMBEDDING_MODEL,
+                docs=[query, *(snippet_text(result) for result in candidates)],
+            ))
+        except Exception as e:
+            self.logger.debug(f"Could not estimate snippet embedding cost: {e}")
+
+        kept_urls = {id(result) for result in kept}
+        filtered_urls = [url for url, result in zip(urls, candidates) if id(result) in kept_urls]
+        if len(filtered_urls) < len(urls):
+            self.logger.info(
+                f"Snippet relevance filter dropped {len(urls) - len(filtered_urls)} of {len(urls)} URLs for '{query}'"
+            )
+        return filtered_urls
+
     async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None):
         """
         Runs a sub-query across multiple retrievers and scrapes the resulting URLs.
@@ -898,6 +1356,9 @@ class ResearchConductor:
         # Scrape URLs that need fetching (skip those already provided by retrievers)
         scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls)
 
+        # Pick up the planning results scraped while sub-queries were generated
+        scraped_content.extend(await self._collect_speculative_scrape(sub_query, query_domains))
+
         # Merge pre-fetched content from retrievers that already provide full text
         scraped_content.extend(prefetched_content)
 
@@ -943,8 +1404,9 @@ class ResearchConductor:
             
             # Perform the search
             if hasattr(retriever_instance, 'search'):
-                results = retriever_instance.search(
-                    max_results=self.researcher.cfg.max_search_results_per_query
+                results = await run_retriever_search(
+                    retriever_instance,
+                    max_results=self.researcher.cfg.max_search_results_per_query,
                 )
                 
                 # Log result information
@@ -0,0 +1,417 @@
+"""
+Record/replay cassettes for reproducible research runs.
+
+In record mode every retriever search, scraper result, embedding and chat
+completion of a run is captured, with its latency, into one gzip-compressed
+JSON cassette. In replay mode the same calls are answered from the cassette
+without touching the network (or needing API keys), optionally sleeping for
+the recorded latencies so concurrency changes can be benchmarked realistically.
+
+The cassette hooks into the existing extension points: ``get_retrievers``
+wraps the retriever classes, ``Scraper.get_scraper`` the scraper classes,
+``Memory.get_embeddings`` the embeddings and ``GenericLLMProvider`` its chat
+responses. Enable it with environment variables:
+
+- ``CASSETTE_MODE``: ``record``, ``replay`` or ``off`` (default).
+- ``CASSETTE_PATH``: the cassette file (default ``./cassettes/research.json.gz``).
+- ``CASSETTE_LATENCY``: in replay, multiply recorded latencies by this factor
+  and sleep for them (default 0, replay instantly).
+
+or programmatically with ``use_cassette(path, mode)``.
+"""
+import array
+import asyncio
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+CASSETTE_MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when a call was not recorded in the cassette."""
+
+
+class CassetteReplayedError(Exception):
+    """Re-raises, during replay, an error that the recorded call raised."""
+
+
+def _make_key(parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _encode_vector(vector: List[float]) -> str:
+    # float32 + base64 is about four times smaller than a JSON list of floats
+    return base64.b64encode(array.array("f", vector).tobytes()).decode("ascii")
+
+
+def _decode_vector(data: str) -> List[float]:
+    vector = array.array("f")
+    vector.frombytes(base64.b64decode(data))
+    return vector.tolist()
+
+
+class Cassette:
+    """
+    A recording of calls keyed by kind and call arguments.
+
+    Identical calls are recorded in order and replayed in the same order;
+    once a key's recordings are used up, its last one is repeated.
+
+    Args:
+        path: The cassette file.
+        mode: "record" or "replay".
+        latency_factor: In replay, sleep for the recorded latency times this factor (0 disables).
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency_factor: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode '{mode}', expected 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self.latency_factor = max(0.0, float(latency_factor or 0))
+        self.entries: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._positions: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {self.path}: {data.get('version')}")
+        self.entries = data.get("entries") or {}
+
+    def save(self) -> None:
+        """Write the recorded calls to the cassette file."""
+        if self.mode != "record":
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {"version": CASSETTE_VERSION, "entries": self.entries}
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        logger.info(f"Saved cassette with {self.count()} recorded calls to {self.path}")
+
+    def count(self) -> int:
+        return sum(len(recordings) for kind in self.entries.values() for recordings in kind.values())
+
+    def record(self, kind: str, key: str, response: Any = None, latency: float = 0.0, error: Optional[str] = None) -> None:
+        entry: Dict[str, Any] = {"latency": round(latency, 4)}
+        if error is not None:
+            entry["error"] = error
+        else:
+            # Copy through JSON so later changes to the caller's objects don't leak into the recording
+            entry["response"] = json.loads(json.dumps(response, default=str))
+        with self._lock:
+            self.entries.setdefault(kind, {}).setdefault(key, []).append(entry)
+
+    def lookup(self, kind: str, key: str) -> Dict[str, Any]:
+        """Get the next recording of a call, or raise CassetteMissError."""
+        with self._lock:
+            recordings = self.entries.get(kind, {}).get(key)
+            if not recordings:
+                raise CassetteMissError(f"No {kind} call with key {key[:12]} recorded in {self.path}")
+            position = self._positions.get((kind, key), 0)
+            self._positions[(kind, key)] = position + 1
+            return recordings[min(position, len(recordings) - 1)]
+
+    def _replay_delay(self, entry: Dict[str, Any]) -> float:
+        return entry.get("latency", 0.0) * self.latency_factor
+
+    @staticmethod
+    def _replay_result(entry: Dict[str, Any]) -> Any:
+        if "error" in entry:
+            raise CassetteReplayedError(entry["error"])
+        return entry.get("response")
+
+    def call(self, kind: str, key_parts: Any, func: Callable[[], Any]) -> Any:
+        """Record or replay a sync call whose result is JSON serializable."""
+        key = _make_key(key_parts)
+        if self.replaying:
+            entry = self.lookup(kind, key)
+            delay = self._replay_delay(entry)
+            if delay:
+                time.sleep(delay)
+            return self._replay_result(entry)
+
+        start = time.monotonic()
+        try:
+            result = func()
+        except Exception as e:
+            self.record(kind, key, latency=time.monotonic() - start, error=f"{type(e).__name__}: {e}")
+            raise
+        self.record(kind, key, result, time.monotonic() - start)
+        return result
+
+    async def acall(self, kind: str, key_parts: Any, func: Callable[[], Any]) -> Any:
+        """Record or replay an async call whose result is JSON serializable."""
+        key = _make_key(key_parts)
+        if self.replaying:
+            entry = self.lookup(kind, key)
+            delay = self._replay_delay(entry)
+            if delay:
+                await asyncio.sleep(delay)
+            return self._replay_result(entry)
+
+        start = time.monotonic()
+        try:
+            result = await func()
+        except Exception as e:
+            self.record(kind, key, latency=time.monotonic() - start, error=f"{type(e).__name__}: {e}")
+            raise
+        self.record(kind, key, result, time.monotonic() - start)
+        return result
+
+    def wrap_retriever(self, retriever_class):
+        """Get a retriever class that records or replays the searches of ``retriever_class``."""
+        return _make_cassette_retriever(self, retriever_class)
+
+    def wrap_scraper(self, scraper_class):
+        """Get a scraper class that records or replays the results of ``scraper_class``."""
+        return _make_cassette_scraper(self, scraper_class)
+
+    def wrap_embeddings(self, embeddings: Optional[Embeddings], model_id: str) -> "CassetteEmbeddings":
+        """Get embeddings that record or replay ``embeddings``, one text at a time."""
+        return CassetteEmbeddings(self, embeddings, model_id)
+
+
+def _make_cassette_retriever(cassette: Cassette, retriever_class):
+    class CassetteRetriever:
+        __wrapped__ = retriever_class
+
+        def __init__(self, query, query_domains=None, **kwargs):
+            self.query = query
+            self.query_domains = query_domains
+            self._kwargs = kwargs
+            self._retriever = None
+
+        def _get_retriever(self):
+            # Replay never builds the real retriever, so it needs no API key
+            if self._retriever is None:
+                self._retriever = retriever_class(self.query, query_domains=self.query_domains, **self._kwargs)
+            return self._retriever
+
+        def _key_parts(self, max_results):
+            from gpt_researcher.retrievers.utils import full_text_enabled
+
+            parts = [retriever_class.__name__, self.query, sorted(self.query_domains or []), max_results]
+            # Full-text searches return different results than snippet-only ones
+            if full_text_enabled():
+                parts.append("full_text")
+            return parts
+
+        def _search_kwargs(self, max_results):
+            return {} if max_results is None else {"max_results": max_results}
+
+        def search(self, max_results=None):
+            return cassette.call(
+                "search",
+                self._key_parts(max_results),
+                lambda: self._get_retriever().search(**self._search_kwargs(max_results)),
+            )
+
+        async def search_async(self, max_results=None):
+            async def search():
+                from gpt_researcher.actions.retriever import run_retriever_search
+
+                return await run_retriever_search(self._get_retriever(), **self._search_kwargs(max_results))
+
+            return await cassette.acall("search", self._key_parts(max_results), search)
+
+    CassetteRetriever.__name__ = retriever_class.__name__
+    CassetteRetriever.__qualname__ = retriever_class.__qualname__
+    return CassetteRetriever
+
+
+def _make_cassette_scraper(cassette: Cassette, scraper_class):
+    def get_scraper(self):
+        from gpt_researcher.scraper.utils import apply_scraper_options
+
+        if self._scraper is None:
+            self._scraper = scraper_class(self.link, self.session)
+            apply_scraper_options(self._scraper, self.scraper_options)
+            if hasattr(self._scraper, "parse_executor"):
+                self._scraper.parse_executor = self.parse_executor
+            if hasattr(self._scraper, "driver_pool_size") and self.driver_pool_size:
+                self._scraper.driver_pool_size = self.driver_pool_size
+        return self._scraper
+
+    def key_parts(self):
+        return [scraper_class.__name__, self.link]
+
+    def scrape(self):
+        return tuple(cassette.call("scrape", key_parts(self), lambda: list(get_scraper(self).scrape())))
+
+    async def scrape_async(self):
+        async def scrape():
+            return list(await get_scraper(self).scrape_async())
+
+        return tuple(await cassette.acall("scrape", key_parts(self), scrape))
+
+    def __init__(self, link, session=None):
+        self.link = link
+        self.session = session
+        self._scraper = None
+        self.parse_executor = None
+        self.driver_pool_size = None
+        self.scraper_options = {}
+
+    # Keep the sync/async shape of the wrapped scraper, so Scraper still runs
+    # sync scrapers in its worker pool executor
+    namespace = {"__init__": __init__, "__wrapped__": scraper_class}
+    if hasattr(scraper_class, "scrape_async"):
+        namespace["scrape_async"] = scrape_async
+    else:
+        namespace["scrape"] = scrape
+    return type(scraper_class.__name__, (), namespace)
+
+
+class CassetteEmbeddings(Embeddings):
+    """
+    Embeddings that record or replay each text's vector separately.
+
+    Recording per text keeps replay working when a changed pipeline batches
+    the same texts differently. Queries are recorded apart from documents,
+    since a model may embed the same text differently as a query.
+    """
+
+    def __init__(self, cassette: Cassette, embeddings: Optional[Embeddings], model_id: str):
+        self.cassette = cassette
+        self.embeddings = embeddings
+        self.model_id = model_id
+
+    def _key(self, text: str, query: bool = False) -> str:
+        return _make_key([self.model_id, "query", text] if query else [self.model_id, text])
+
+    def _replay(self, texts: List[str], query: bool = False) -> tuple[List[List[float]], float]:
+        entries = [self.cassette.lookup("embedding", self._key(text, query)) for text in texts]
+        delay = max((self.cassette._replay_delay(entry) for entry in entries), default=0.0)
+        return [_decode_vector(entry["response"]) for entry in entries], delay
+
+    def _record(self, texts: List[str], vectors: List[List[float]], latency: float, query: bool = False) -> None:
+        for text, vector in zip(texts, vectors):
+            self.cassette.record("embedding", self._key(text, query), _encode_vector(vector), latency)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.cassette.replaying:
+            vectors, delay = self._replay(texts)
+            if delay:
+                time.sleep(delay)
+            return vectors
+        start = time.monotonic()
+        vectors = self.embeddings.embed_documents(texts)
+        self._record(texts, vectors, time.monotonic() - start)
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        if self.cassette.replaying:
+            vectors, delay = self._replay([text], query=True)
+            if delay:
+                time.sleep(delay)
+            return vectors[0]
+        start = time.monotonic()
+        vector = self.embeddings.embed_query(text)
+        self._record([text], [vector], time.monotonic() - start, query=True)
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.cassette.replaying:
+            vectors, delay = self._replay(texts)
+            if delay:
+                await asyncio.sleep(delay)
+            return vectors
+        start = time.monotonic()
+        vectors = await self.embeddings.aembed_documents(texts)
+        self._record(texts, vectors, time.monotonic() - start)
+        return vectors
+
+    async def aembed_query(self, text: str) -> List[float]:
+        if self.cassette.replaying:
+            vectors, delay = self._replay([text], query=True)
+            if delay:
+                await asyncio.sleep(delay)
+            return vectors[0]
+        start = time.monotonic()
+        vector = await self.embeddings.aembed_query(text)
+        self._record([text], [vector], time.monotonic() - start, query=True)
+        return vector
+
+
+_active_cassette: Optional[Cassette] = None
+_env_loaded = False
+_state_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    Get the active cassette, or None when recording and replay are off.
+
+    The first call reads CASSETTE_MODE, CASSETTE_PATH and CASSETTE_LATENCY.
+    """
+    global _active_cassette, _env_loaded
+    if _env_loaded:
+        return _active_cassette
+    with _state_lock:
+        if not _env_loaded:
+            mode = os.environ.get("CASSETTE_MODE", "off").strip().lower() or "off"
+            if mode not in CASSETTE_MODES:
+                logger.warning(f"Unknown CASSETTE_MODE '{mode}', cassette disabled")
+            elif mode != "off":
+                _active_cassette = Cassette(
+                    os.environ.get("CASSETTE_PATH", "./cassettes/research.json.gz"),
+                    mode,
+                    float(os.environ.get("CASSETTE_LATENCY", 0) or 0),
+                )
+                if mode == "record":
+                    atexit.register(_active_cassette.save)
+                logger.info(f"Cassette {mode} mode enabled with {_active_cassette.path}")
+            _env_loaded = True
+    return _active_cassette
+
+
+@contextmanager
+def use_cassette(path: str, mode: str = "replay", latency_factor: float = 0.0):
+    """
+    Record or replay every call made inside the block, then restore the previous cassette.
+
+    Recordings are saved when the block exits.
+
+    Example:
+        ```python
+        with use_cassette("cassettes/solar.json.gz", "record"):
+            await GPTResearcher("solar panel efficiency").conduct_research()
+        ```
+    """
+    global _active_cassette
+    get_cassette()
+    cassette = Cassette(path, mode, latency_factor)
+    with _state_lock:
+        previous = _active_cassette
+        _active_cassette = cassette
+    try:
+        yield cassette
+    finally:
+        with _state_lock:
+            _active_cassette = previous
+        cassette.save()
@@ -0,0 +1,133 @@
+"""
+Process-wide pooled async HTTP client.
+
+Retrievers share one httpx.AsyncClient per event loop so repeated requests to
+the same provider reuse keep-alive connections instead of paying a fresh
+TCP+TLS handshake (and tying up a thread) for every search.
+"""
+import asyncio
+import importlib.util
+import weakref
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+import httpx
+
+# Pool settings of clients created from now on, set from the HTTP_* Config
+# options by configure_http_client
+_settings = {
+    # Total open connections across all hosts
+    "max_connections": 100,
+    # Concurrent requests per destination host
+    "max_connections_per_host": 10,
+    # Seconds an idle keep-alive connection is kept in the pool
+    "keepalive_expiry": 30.0,
+    # Default request timeout in seconds (individual calls may override it)
+    "timeout": 30.0,
+}
+
+
+def configure_http_client(cfg) -> None:
+    """
+    Apply the HTTP_* options of a Config to the shared clients.
+
+    Clients already open keep their pool; the settings apply to clients
+    created afterwards (one per event loop).
+
+    Args:
+        cfg: The researcher Config.
+    """
+    keepalive_expiry = getattr(cfg, "http_keepalive_expiry", None)
+    _settings.update(
+        max_connections=int(getattr(cfg, "http_max_connections", 100) or 100),
+        max_connections_per_host=int(getattr(cfg, "http_max_connections_per_host", 10) or 10),
+        keepalive_expiry=30.0 if keepalive_expiry is None else float(keepalive_expiry),
+        timeout=float(getattr(cfg, "http_timeout", 30.0) or 30.0),
+    )
+
+
+class PooledAsyncClient:
+    """
+    An httpx.AsyncClient with a bounded connection pool and per-host limits.
+
+    httpx only caps the total number of connections, so requests additionally
+    go through a per-host semaphore. This keeps one slow provider from holding
+    every pooled connection.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        keepalive_expiry: float | None = None,
+        timeout: float | None = None,
+    ):
+        max_connections = max_connections or _settings["max_connections"]
+        if keepalive_expiry is None:
+            keepalive_expiry = _settings["keepalive_expiry"]
+        timeout = timeout or _settings["timeout"]
+        self.max_connections_per_host = max_connections_per_host or _settings["max_connections_per_host"]
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+            # HTTP/2 multiplexes requests to one host over a single connection,
+            # but needs the optional h2 package.
+            http2=importlib.util.find_spec("h2") is not None,
+            follow_redirects=True,
+        )
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(str(url)).netloc.lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_semaphores[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, waiting for a free slot on the destination host."""
+        async with self._host_semaphore(url):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Stream a response body; the host slot is held until the body is closed."""
+        async with self._host_semaphore(url):
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+# httpx connections are bound to the event loop that opened them, so keep one
+# client per loop (e.g. the backend's loop, or each asyncio.run() in scripts).
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PooledAsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> PooledAsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = PooledAsyncClient()
+        _clients[loop] = client
+    return client
+
+
+async def close_async_http_client():
+    """Close the shared HTTP client of the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -20,6 +20,7 @@ from gpt_researcher.llm_provider.generic.base import (
 )
 
 from ..prompts import PromptFamily
+from .cassette import CassetteMissError
 from .costs import calculate_llm_cost
 from .validators import Subtopics
 
@@ -114,6 +115,9 @@ async def create_chat_completion(
             response = await provider.get_chat_response(
                 messages, stream, websocket, **kwargs
             )
+        except CassetteMissError:
+            # Replaying again cannot produce a response that was never recorded
+            raise
         except Exception as exc:
             last_exception = exc
             logging.getLogger(__name__).warning(
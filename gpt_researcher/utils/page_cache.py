@@ -0,0 +1,313 @@
+"""
+Scraped page cache shared across researchers and processes.
+
+Popular pages are scraped again by every research run and nested researcher.
+The cache keeps each page's extracted ``(content, image_urls, title)`` per
+scraper and canonical URL in SQLite, so every process on the host shares it.
+Payloads are zlib-compressed and content-addressed: pages with identical
+extracted content (mirrors, URL variants) share one stored blob.
+
+Entries are fresh for a TTL. A stale entry that came with an ETag or
+Last-Modified header is revalidated with a conditional GET, and reused
+without a scrape when the server answers 304 Not Modified. The total stored
+size is bounded; the least recently used pages are evicted first. Access
+times of hits are written in batches, so lookups don't take the database's
+write lock.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from .url_index import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_BACKENDS = ("none", "memory", "sqlite")
+
+
+class PageCache:
+    """
+    TTL + size-bounded LRU cache of scraped pages.
+
+    The "memory" backend keeps the same tables in an in-memory database. All
+    methods are thread-safe so one instance can serve concurrent researchers.
+    They block on SQLite, so async callers run them off the event loop.
+    """
+
+    # Hits whose access times are held in memory before they're written on their own (writes flush them sooner)
+    touch_batch = 64
+
+    def __init__(self, ttl: float = 86400, max_bytes: int = 512 * 1024 * 1024, db_path: Optional[str] = None):
+        self.ttl = float(ttl)
+        self.max_bytes = max(0, int(max_bytes))
+        self.db_path = db_path
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Access times of hits not yet written, by key
+        self._touched: Dict[str, float] = {}
+        self._db = self._open_db(db_path)
+
+    @staticmethod
+    def _open_db(db_path: Optional[str]) -> sqlite3.Connection:
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+            # WAL lets several processes read the cache while one of them writes.
+            db.execute("PRAGMA journal_mode=WAL")
+        else:
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, digest TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL)"
+        )
+        db.commit()
+        return db
+
+    @staticmethod
+    def make_key(url: str, scraper: str) -> str:
+        """Build the cache key; scrapers extract pages differently, so each has its own entries."""
+        return f"{scraper}:{canonicalize_url(url)}"
+
+    def get(self, url: str, scraper: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a page.
+
+        Returns:
+            None on a miss, else a dict with "content", "image_urls", "title",
+            "etag", "last_modified" and "fresh" (False once the TTL is over).
+        """
+        key = self.make_key(url, scraper)
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT blobs.payload, pages.etag, pages.last_modified, pages.expires_at "
+                    "FROM pages JOIN blobs ON blobs.digest = pages.digest WHERE pages.key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                content, image_urls, title = json.loads(zlib.decompress(row[0]))
+            except (sqlite3.Error, zlib.error, ValueError) as e:
+                logger.warning(f"Failed to read page cache entry for {url}: {e}")
+                return None
+            # Reads don't lock the database; the access time is written with
+            # the next write, or once enough hits have piled up
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch:
+                try:
+                    self._flush_touched()
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Failed to record page cache access times: {e}")
+        return {
+            "content": content,
+            "image_urls": image_urls,
+            "title": title,
+            "etag": row[1],
+            "last_modified": row[2],
+            "fresh": row[3] > now,
+        }
+
+    def set(
+        self,
+        url: str,
+        scraper: str,
+        content: str,
+        image_urls: List[Dict[str, Any]],
+        title: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Cache a scraped page with the validators its response came with."""
+        if self.ttl <= 0 or not content:
+            return
+        try:
+            data = json.dumps([content, image_urls or [], title or ""]).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache page {url}: {e}")
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        payload = zlib.compress(data, 6)
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO blobs (digest, payload, size) VALUES (?, ?, ?)",
+                    (digest, payload, len(payload)),
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (key, url, digest, etag, last_modified, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.make_key(url, scraper), url, digest, etag, last_modified, now + self.ttl, now),
+                )
+                self._flush_touched()
+                self._evict()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write page cache entry for {url}: {e}")
+
+    def refresh(self, url: str, scraper: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Start a new TTL for a page the server confirmed unchanged."""
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "UPDATE pages SET expires_at = ?, accessed_at = ?, "
+                    "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                    (now + self.ttl, now, etag, last_modified, self.make_key(url, scraper)),
+                )
+                self._flush_touched()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to refresh page cache entry for {url}: {e}")
+
+    def _flush_touched(self) -> None:
+        # Write the access times of recent hits, within the caller's transaction
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        self._db.executemany(
+            "UPDATE pages SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in touched.items()],
+        )
+
+    def _evict(self) -> None:
+        # Drop least recently used pages until the stored blobs fit max_bytes
+        if not self.max_bytes:
+            return
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        while total > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT pages.key, blobs.size FROM pages JOIN blobs ON blobs.digest = pages.digest "
+                "ORDER BY pages.accessed_at"
+            ).fetchall()
+            keys = []
+            freed = 0
+            for key, size in rows:
+                keys.append((key,))
+                freed += size
+                if total - freed <= self.max_bytes:
+                    break
+            if not keys:
+                break
+            self._db.executemany("DELETE FROM pages WHERE key = ?", keys)
+            # Blobs still used by other pages stay, so the loop re-checks the total
+            self._db.execute("DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM pages)")
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: "hits", "revalidated" or "misses"."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def clear(self) -> None:
+        """Drop every cached page."""
+        with self._lock:
+            self._touched.clear()
+            self._db.execute("DELETE FROM pages")
+            self._db.execute("DELETE FROM blobs")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cumulative counters and size of this cache."""
+        with self._lock:
+            pages, size = self._db.execute(
+                "SELECT (SELECT COUNT(*) FROM pages), (SELECT COALESCE(SUM(size), 0) FROM blobs)"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "pages": pages,
+            "bytes": size,
+        }
+
+
+async def revalidate(url: str, etag: Optional[str], last_modified: Optional[str], user_agent: Optional[str] = None):
+    """
+    Ask the server whether a cached page changed, with a conditional GET.
+
+    Returns:
+        The response's (etag, last_modified) when the server answered 304 Not
+        Modified, else None (changed, no validators, or the request failed).
+    """
+    if not etag and not last_modified:
+        return None
+
+    import httpx
+
+    from .http_client import get_async_http_client
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    if user_agent:
+        headers["User-Agent"] = user_agent
+    try:
+        # Stream so a changed page's body isn't downloaded here; the scraper fetches it
+        async with get_async_http_client().stream("GET", url, headers=headers, timeout=10) as response:
+            if response.status_code != 304:
+                return None
+            return response.headers.get("ETag"), response.headers.get("Last-Modified")
+    except httpx.HTTPError as e:
+        logger.debug(f"Revalidating {url} failed: {e!r}")
+        return None
+
+
+# Caches are shared process-wide so every researcher using the same settings,
+# including nested ones, reads and fills the same entries.
+_caches: Dict[tuple, PageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_page_cache(cfg) -> Optional[PageCache]:
+    """
+    Get the shared page cache configured by PAGE_CACHE, or None when disabled.
+
+    Args:
+        cfg: The researcher Config.
+
+    Returns:
+        The process-wide PageCache for these settings, or None.
+    """
+    backend = str(getattr(cfg, "page_cache", "none") or "none").lower()
+    if backend not in PAGE_CACHE_BACKENDS:
+        logger.warning(f"Unknown PAGE_CACHE backend '{backend}', page caching disabled")
+        return None
+    if backend == "none":
+        return None
+
+    db_path = getattr(cfg, "page_cache_path", None) if backend == "sqlite" else None
+    if db_path:
+        db_path = os.path.abspath(db_path)
+    ttl = getattr(cfg, "page_cache_ttl", 86400)
+    max_bytes = int(float(getattr(cfg, "page_cache_max_mb", 512)) * 1024 * 1024)
+
+    key = (backend, db_path, ttl, max_bytes)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            try:
+                cache = PageCache(ttl=ttl, max_bytes=max_bytes, db_path=db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to open page cache at {db_path}, using memory only: {e}")
+                cache = PageCache(ttl=ttl, max_bytes=max_bytes)
+            _caches[key] = cache
+        return cache
@@ -1,13 +1,20 @@
 """
-Global rate limiter for scraper requests.
+Rate limiting for scraper requests.
 
-Ensures that SCRAPER_RATE_LIMIT_DELAY is enforced globally across ALL WorkerPools,
-not just per-pool. This prevents multiple concurrent researchers from overwhelming
-rate-limited APIs like Firecrawl.
+ScrapeScheduler gives every destination host and every scraping API provider
+(Firecrawl, Tavily Extract) its own token bucket and in-flight limit, shared
+across ALL WorkerPools. A slow or rate-limited host or provider only delays
+its own requests, so total throughput across many domains stays high while
+each host and each paid API gets exactly its allowed rate.
+
+GlobalRateLimiter is the older single minimum delay between ANY two requests.
 """
 import asyncio
 import time
-from typing import ClassVar
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import ClassVar, Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 
 class GlobalRateLimiter:
@@ -90,3 +97,212 @@ _global_rate_limiter = GlobalRateLimiter()
 def get_global_rate_limiter() -> GlobalRateLimiter:
     """Get the global rate limiter singleton instance."""
     return _global_rate_limiter
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts of up to `burst`.
+
+    Tokens are only counted from the monotonic clock, so a bucket isn't bound to
+    an event loop.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0 if one is now)."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        """Use a token; call right after delay() returned 0."""
+        self.tokens -= 1
+
+    def idle(self) -> bool:
+        """Whether the bucket is full, i.e. dropping it changes nothing."""
+        self._refill()
+        return self.tokens >= self.burst
+
+
+class _InFlightSlots:
+    """FIFO counter of requests in flight to one host or provider."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self.waiters = deque()
+
+    @property
+    def unused(self) -> bool:
+        return self.in_use == 0 and not self.waiters
+
+    async def acquire(self) -> None:
+        if self.in_use < self.limit and not self.waiters:
+            self.in_use += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled
+                self.release()
+            elif waiter in self.waiters:
+                self.waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        # Hand the slot straight to the next waiter, so in_use stays the same
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_use -= 1
+
+
+# Limits are (rate per second, burst, max in flight); 0 = unlimited
+Limits = Tuple[float, int, int]
+
+
+class ScrapeScheduler:
+    """
+    Per-host and per-provider politeness scheduler for scraper requests.
+
+    Requests for a scraping API are keyed by the provider, since that's whose
+    rate limit applies; all other requests are keyed by destination host.
+    """
+
+    # Buckets kept before full (idle) ones are dropped
+    MAX_IDLE_BUCKETS = 1024
+
+    def __init__(self):
+        self._settings = None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._slots: Dict[str, _InFlightSlots] = {}
+        self.configure()
+
+    def configure(
+        self,
+        host_rate: float = 0.0,
+        host_burst: int = 1,
+        host_max_in_flight: int = 0,
+        provider_limits: Optional[Dict[str, dict]] = None,
+        default_delay: float = 0.0,
+    ) -> None:
+        """
+        Configure the limits.
+
+        Args:
+            host_rate: Requests per second to any one host (0 = no limit).
+            host_burst: Requests a host may get back to back before host_rate applies.
+            host_max_in_flight: Requests in flight to any one host (0 = no limit).
+            provider_limits: Limits per scraping API provider, e.g.
+                {"firecrawl": {"rate": 0.16, "burst": 1, "max_in_flight": 2}}.
+            default_delay: Minimum seconds between requests to a host or provider
+                without a rate of its own (SCRAPER_RATE_LIMIT_DELAY, 0 = no limit).
+        """
+        settings = (
+            float(host_rate or 0),
+            max(1, int(host_burst or 1)),
+            max(0, int(host_max_in_flight or 0)),
+            {name: dict(limits or {}) for name, limits in (provider_limits or {}).items()},
+            float(default_delay or 0),
+        )
+        if settings == self._settings:
+            # Pools of nested researchers configure the same limits; keep the buckets' state
+            return
+        self._settings = settings
+        self._buckets.clear()
+
+    def limits(self, key: str) -> Limits:
+        """Get the (rate, burst, max in flight) for a "host:" or "provider:" key."""
+        host_rate, host_burst, host_max_in_flight, provider_limits, default_delay = self._settings
+        default_rate = 1 / default_delay if default_delay > 0 else 0.0
+        if key.startswith("provider:"):
+            limits = provider_limits.get(key[len("provider:"):], {})
+            return (
+                float(limits.get("rate") or default_rate),
+                max(1, int(limits.get("burst") or 1)),
+                max(0, int(limits.get("max_in_flight") or 0)),
+            )
+        return host_rate or default_rate, host_burst, host_max_in_flight
+
+    @staticmethod
+    def key_for(url: Optional[str] = None, provider: Optional[str] = None) -> Optional[str]:
+        """Get the key whose limits apply to a request, or None if none do."""
+        if provider:
+            return f"provider:{provider}"
+        host = urlparse(url).hostname if url else None
+        return f"host:{host}" if host else None
+
+    def _bucket(self, key: str, rate: float, burst: int) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_IDLE_BUCKETS:
+                for idle_key in [k for k, b in self._buckets.items() if b.idle()]:
+                    del self._buckets[idle_key]
+            bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    @asynccontextmanager
+    async def slot(self, semaphore: asyncio.Semaphore, url: Optional[str] = None, provider: Optional[str] = None):
+        """
+        Wait until a request to `url` (or through `provider`) may start, then hold a slot for it.
+
+        The pool's semaphore is only held once the host or provider is ready,
+        so requests waiting on one slow host don't hold up the other hosts.
+        """
+        key = self.key_for(url, provider)
+        rate, burst, max_in_flight = self.limits(key) if key else (0.0, 1, 0)
+
+        slots = None
+        if max_in_flight:
+            slots = self._slots.get(key)
+            if slots is None:
+                slots = self._slots[key] = _InFlightSlots(max_in_flight)
+            slots.limit = max_in_flight
+            await slots.acquire()
+        try:
+            while True:
+                bucket = self._bucket(key, rate, burst) if rate > 0 else None
+                if bucket is not None:
+                    wait = bucket.delay()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                        continue
+                async with semaphore:
+                    if bucket is not None:
+                        # Another request may have used the token while we waited on the pool
+                        if bucket.delay() > 0:
+                            continue
+                        bucket.take()
+                    yield
+                    break
+        finally:
+            if slots is not None:
+                slots.release()
+                if slots.unused and self._slots.get(key) is slots:
+                    del self._slots[key]
+
+    def reset(self) -> None:
+        """Refill every bucket (useful for testing)."""
+        self._buckets.clear()
+
+
+_scrape_scheduler = ScrapeScheduler()
+
+
+def get_scrape_scheduler() -> ScrapeScheduler:
+    """Get the scrape scheduler shared by all WorkerPools."""
+    return _scrape_scheduler
@@ -0,0 +1,201 @@
+"""
+Process-wide health tracking for retrievers.
+
+Every search records its latency and outcome per retriever. The registry
+keeps a rolling window of those samples to report latency percentiles and
+error rates, and runs a circuit breaker per retriever: after repeated
+consecutive failures the circuit opens and the retriever is skipped until a
+cooldown has passed, after which a single probe request is let through
+(half-open). A successful probe closes the circuit, a failed one reopens it.
+
+The registry is shared by every researcher in the process, so a provider
+that degrades during one research session is skipped by the others too.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class RetrieverUnavailableError(Exception):
+    """Raised instead of searching when a retriever's circuit is open."""
+
+
+class RetrieverHealth:
+    """Rolling latency/outcome samples and circuit state of one retriever."""
+
+    def __init__(self, window: int):
+        self.samples: Deque[tuple[float, bool]] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Get a latency percentile of the successful samples, or None without samples."""
+        latencies = sorted(latency for latency, ok in self.samples if ok)
+        if not latencies:
+            return None
+        rank = max(0, math.ceil(percentile / 100 * len(latencies)) - 1)
+        return latencies[min(rank, len(latencies) - 1)]
+
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+
+class RetrieverHealthRegistry:
+    """
+    Thread-safe health registry keyed by retriever name.
+
+    Args:
+        window: Number of recent searches kept per retriever.
+        failure_threshold: Consecutive failures that open the circuit (0 disables circuit breaking).
+        cooldown: Seconds an open circuit waits before letting a probe through.
+    """
+
+    def __init__(self, window: int = 100, failure_threshold: int = 0, cooldown: float = 60):
+        self.window = max(1, int(window))
+        self.failure_threshold = max(0, int(failure_threshold or 0))
+        self.cooldown = max(0.0, float(cooldown or 0))
+        self._health: Dict[str, RetrieverHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> RetrieverHealth:
+        health = self._health.get(name)
+        if health is None:
+            health = self._health[name] = RetrieverHealth(self.window)
+        return health
+
+    def allow_request(self, name: str) -> bool:
+        """
+        Check whether a search may be sent to the retriever.
+
+        Closed circuits always allow it. Open circuits refuse it until the
+        cooldown has passed, then half-open and allow one probe at a time.
+        """
+        if not self.failure_threshold:
+            return True
+        with self._lock:
+            health = self._get(name)
+            if health.state == CLOSED:
+                return True
+            if health.state == OPEN:
+                if time.monotonic() - health.opened_at < self.cooldown:
+                    return False
+                health.state = HALF_OPEN
+                health.probe_in_flight = False
+            if health.probe_in_flight:
+                return False
+            health.probe_in_flight = True
+            return True
+
+    def record_success(self, name: str, latency: float) -> None:
+        """Record a successful search; closes a half-open circuit."""
+        with self._lock:
+            health = self._get(name)
+            health.samples.append((latency, True))
+            health.consecutive_failures = 0
+            if health.state != CLOSED:
+                logger.info(f"Retriever {name} recovered, closing its circuit")
+            health.state = CLOSED
+            health.probe_in_flight = False
+
+    def record_failure(self, name: str, latency: float) -> None:
+        """Record a failed or timed out search; may open the circuit."""
+        with self._lock:
+            health = self._get(name)
+            health.samples.append((latency, False))
+            health.consecutive_failures += 1
+            health.probe_in_flight = False
+            if not self.failure_threshold:
+                return
+            if health.state == HALF_OPEN or (
+                health.state == CLOSED and health.consecutive_failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Retriever {name} failed {health.consecutive_failures} times in a row, "
+                    f"skipping it for {self.cooldown:g}s"
+                )
+                health.state = OPEN
+                health.opened_at = time.monotonic()
+
+    def release_request(self, name: str) -> None:
+        """Forget a search allowed by allow_request that ended without an outcome (it was cancelled)."""
+        with self._lock:
+            self._get(name).probe_in_flight = False
+
+    def get_state(self, name: str) -> str:
+        with self._lock:
+            return self._get(name).state
+
+    def latency_percentile(self, name: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Get a latency percentile in seconds for the retriever.
+
+        Returns None until at least ``min_samples`` successful searches were recorded.
+        """
+        with self._lock:
+            health = self._get(name)
+            if sum(1 for _, ok in health.samples if ok) < min_samples:
+                return None
+            return health.latency_percentile(percentile)
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Get the current health of every retriever seen so far."""
+        with self._lock:
+            return {
+                name: {
+                    "state": health.state,
+                    "requests": len(health.samples),
+                    "error_rate": health.error_rate(),
+                    "consecutive_failures": health.consecutive_failures,
+                    "p50": health.latency_percentile(50),
+                    "p95": health.latency_percentile(95),
+                }
+                for name, health in self._health.items()
+            }
+
+    def reset(self) -> None:
+        """Forget every sample and close every circuit."""
+        with self._lock:
+            self._health.clear()
+
+
+# Registries are shared process-wide so every researcher using the same
+# settings, including ones in other research sessions, sees the same health.
+_registries: Dict[tuple, RetrieverHealthRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_retriever_health_registry(cfg) -> RetrieverHealthRegistry:
+    """
+    Get the shared retriever health registry for the configured circuit breaker settings.
+
+    Args:
+        cfg: The researcher Config.
+
+    Returns:
+        The process-wide RetrieverHealthRegistry for these settings.
+    """
+    window = getattr(cfg, "retriever_health_window", 100) or 100
+    failure_threshold = getattr(cfg, "retriever_failure_threshold", 0) or 0
+    cooldown = getattr(cfg, "retriever_circuit_cooldown", 60)
+
+    key = (window, failure_threshold, cooldown)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = RetrieverHealthRegistry(
+                window=window, failure_threshold=failure_threshold, cooldown=cooldown
+            )
+        return registry
@@ -0,0 +1,489 @@
+"""
+Scholarly identity layer for deduplicating papers across academic retrievers.
+
+arXiv, Semantic Scholar, OpenAlex and PubMed Central often return the same
+paper under different URLs: arXiv abs vs pdf pages, doi.org links, publisher
+PDFs and PMC article pages. ``extract_scholarly_ids`` reads DOI, arXiv and
+PMCID identifiers from a URL, ``collapse_scholarly_duplicates`` keeps one
+preferred source per paper, and ``ScholarlyCache`` remembers paper metadata,
+abstracts and which URLs belong to which paper, optionally in a SQLite
+database so later runs can resolve URLs that carry no identifier.
+"""
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .url_index import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+SCHOLARLY_CACHE_BACKENDS = ("none", "memory", "sqlite")
+
+# Identifier kinds, in the order they are preferred as a paper's primary key
+SCHOLARLY_ID_KINDS = ("doi", "arxiv", "pmcid")
+
+# Placeholder abstracts retrievers return when a paper has none
+MISSING_ABSTRACTS = {"", "abstract not available", "no abstract available"}
+
+_DOI = re.compile(r"\b(10\.\d{4,9}/[^\s\"<>?#]+)", re.IGNORECASE)
+_ARXIV_NEW = re.compile(r"^(\d{4}\.\d{4,5})(?:v\d+)?$")
+_ARXIV_OLD = re.compile(r"^([a-z\-]+(?:\.[a-z]{2})?/\d{7})(?:v\d+)?$", re.IGNORECASE)
+_ARXIV_PATH = re.compile(r"^/(?:abs|pdf|html)/(?P<id>.+?)(?:\.pdf)?/?$", re.IGNORECASE)
+_PMCID = re.compile(r"\bPMC(\d+)\b", re.IGNORECASE)
+_PMC_PATH = re.compile(r"/(?:pmc/)?articles/(?:PMC)?(\d+)", re.IGNORECASE)
+_PMC_HOSTS = ("ncbi.nlm.nih.gov", "pmc.ncbi.nlm.nih.gov", "europepmc.org")
+# Publisher URLs append views to the DOI: /doi/10.1000/xyz/full, .../10.1000/xyz.pdf
+_DOI_URL_SUFFIX = re.compile(r"(?:\.pdf|/(?:full|abstract|pdf|epdf|fulltext|html))+$", re.IGNORECASE)
+# arXiv registers DOIs for its preprints: 10.48550/arXiv.2101.00001
+_ARXIV_DOI_PREFIX = "10.48550/arxiv."
+
+
+def normalize_doi(value: Any) -> Optional[str]:
+    """Get a lowercase bare DOI from a DOI, ``doi:`` string or doi.org URL."""
+    if not isinstance(value, str):
+        return None
+    match = _DOI.search(unquote(value))
+    if not match:
+        return None
+    return match.group(1).rstrip(".,;)/").lower()
+
+
+def normalize_arxiv_id(value: Any) -> Optional[str]:
+    """Get an unversioned arXiv ID from an ID, ``arXiv:`` string or arxiv.org URL."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if "arxiv.org" in value.lower():
+        try:
+            path = urlsplit(value).path
+        except ValueError:
+            return None
+        match = _ARXIV_PATH.match(path)
+        if not match:
+            return None
+        value = match.group("id")
+    elif value.lower().startswith("arxiv:"):
+        value = value[len("arxiv:"):]
+    for pattern in (_ARXIV_NEW, _ARXIV_OLD):
+        match = pattern.match(value)
+        if match:
+            return match.group(1).lower()
+    return None
+
+
+def normalize_pmcid(value: Any) -> Optional[str]:
+    """Get an uppercase ``PMC<digits>`` ID from a PMCID, bare number or PMC URL."""
+    if isinstance(value, int):
+        value = str(value)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return f"PMC{value}"
+    match = _PMCID.search(value)
+    if match:
+        return f"PMC{match.group(1)}"
+    if any(host in value.lower() for host in _PMC_HOSTS):
+        match = _PMC_PATH.search(value)
+        if match:
+            return f"PMC{match.group(1)}"
+    return None
+
+
+_NORMALIZERS = {"doi": normalize_doi, "arxiv": normalize_arxiv_id, "pmcid": normalize_pmcid}
+
+
+def _with_implied_ids(ids: Dict[str, str]) -> Dict[str, str]:
+    """Add the arXiv ID implied by an arXiv-issued DOI."""
+    doi = ids.get("doi")
+    if doi and doi.startswith(_ARXIV_DOI_PREFIX) and "arxiv" not in ids:
+        arxiv_id = normalize_arxiv_id(doi[len(_ARXIV_DOI_PREFIX):])
+        if arxiv_id:
+            ids["arxiv"] = arxiv_id
+    return ids
+
+
+def normalize_scholarly_ids(ids: Any) -> Dict[str, str]:
+    """Normalize a ``{"doi": ..., "arxiv": ..., "pmcid": ...}`` dict, dropping invalid values."""
+    if not isinstance(ids, dict):
+        return {}
+    normalized = {}
+    for kind in SCHOLARLY_ID_KINDS:
+        value = _NORMALIZERS[kind](ids.get(kind))
+        if value:
+            normalized[kind] = value
+    return _with_implied_ids(normalized)
+
+
+def extract_scholarly_ids(url: str) -> Dict[str, str]:
+    """
+    Extract the scholarly identifiers a URL carries.
+
+    Recognizes doi.org (and other DOI-in-path) links, arxiv.org abs/pdf/html
+    pages and PMC article pages on NCBI and Europe PMC.
+
+    Args:
+        url: The URL of a search result.
+
+    Returns:
+        A dict with any of the keys ``doi``, ``arxiv`` and ``pmcid``.
+    """
+    if not isinstance(url, str) or not url:
+        return {}
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return {}
+    host = (parts.hostname or "").lower()
+
+    ids = {}
+    if host.endswith("arxiv.org"):
+        arxiv_id = normalize_arxiv_id(url)
+        if arxiv_id:
+            ids["arxiv"] = arxiv_id
+    elif any(host.endswith(pmc_host) for pmc_host in _PMC_HOSTS):
+        pmcid = normalize_pmcid(url)
+        if pmcid:
+            ids["pmcid"] = pmcid
+    # Look in the path first so a DOI never swallows the query string
+    doi = normalize_doi(_DOI_URL_SUFFIX.sub("", parts.path)) or normalize_doi(parts.query)
+    if doi:
+        ids["doi"] = doi
+    return _with_implied_ids(ids)
+
+
+def result_scholarly_ids(result: Dict[str, Any]) -> Dict[str, str]:
+    """Get the identifiers of a search result from its ``scholarly_ids`` and its URL."""
+    ids = extract_scholarly_ids(result.get("href") or result.get("url") or "")
+    ids.update(normalize_scholarly_ids(result.get("scholarly_ids")))
+    return ids
+
+
+def paper_keys(ids: Dict[str, str]) -> Set[str]:
+    """Get the ``kind:value`` keys of a paper; two results are the same paper if any key matches."""
+    return {f"{kind}:{value}" for kind, value in ids.items() if kind in SCHOLARLY_ID_KINDS and value}
+
+
+def _has_full_text(result: Dict[str, Any]) -> bool:
+    return len(result.get("raw_content") or "") > 100
+
+
+def _source_preference(result: Dict[str, Any]) -> int:
+    """Lower is better: full text in hand, then a PDF, then arXiv, then landing pages."""
+    if _has_full_text(result):
+        return 0
+    url = result.get("href") or result.get("url") or ""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return 3
+    if parts.path.lower().endswith(".pdf"):
+        return 1
+    if (parts.hostname or "").lower().endswith("arxiv.org"):
+        return 2
+    return 3
+
+
+def collapse_scholarly_duplicates(
+    results: List[Dict[str, Any]],
+    visited_keys: Iterable[str] = (),
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Keep one source per paper among ranked search results.
+
+    Results sharing any identifier are grouped. Each group is kept at the
+    position of its best-ranked member, represented by the member with the
+    most useful content: full text returned by the retriever first, then a
+    PDF, then an arXiv page, then any other page. The kept result's
+    ``scholarly_ids`` hold the identifiers of the whole group. Groups whose
+    paper is in ``visited_keys`` are dropped entirely. Results without
+    identifiers are kept as they are.
+
+    Args:
+        results: Search results, best first.
+        visited_keys: Paper keys (see ``paper_keys``) already researched.
+
+    Returns:
+        The collapsed results and the number of results dropped.
+    """
+    # Union-find over the results that share a paper key
+    parent = list(range(len(results)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    ids_by_index: Dict[int, Dict[str, str]] = {}
+    owner_by_key: Dict[str, int] = {}
+    for index, result in enumerate(results):
+        ids = result_scholarly_ids(result)
+        if not ids:
+            continue
+        ids_by_index[index] = ids
+        for key in paper_keys(ids):
+            if key in owner_by_key:
+                parent[find(index)] = find(owner_by_key[key])
+            else:
+                owner_by_key[key] = index
+
+    groups: Dict[int, List[int]] = {}
+    for index in ids_by_index:
+        groups.setdefault(find(index), []).append(index)
+
+    visited_keys = set(visited_keys)
+    representative: Dict[int, Dict[str, Any]] = {}
+    for root, members in groups.items():
+        merged_ids: Dict[str, str] = {}
+        for index in members:
+            for kind, value in ids_by_index[index].items():
+                merged_ids.setdefault(kind, value)
+        if visited_keys & paper_keys(merged_ids):
+            continue
+        best = min(members, key=lambda index: (_source_preference(results[index]), index))
+        kept = dict(results[best])
+        kept["scholarly_ids"] = merged_ids
+        representative[min(members)] = kept
+
+    collapsed = []
+    for index, result in enumerate(results):
+        if index not in ids_by_index:
+            collapsed.append(result)
+        elif index in representative:
+            collapsed.append(representative[index])
+    return collapsed, len(results) - len(collapsed)
+
+
+class ScholarlyCache:
+    """
+    Cache of paper metadata keyed by scholarly identifiers and URLs.
+
+    Each paper record holds its identifiers, title, abstract and the URLs it
+    was seen under, and is stored under every ``kind:value`` paper key and
+    every ``url:<canonical URL>`` key, so a URL without an identifier in it
+    still resolves to its paper once any retriever reported it. Records live
+    in an in-memory LRU, optionally backed by a SQLite database. All methods
+    are thread-safe so one instance can serve concurrent researchers.
+    """
+
+    def __init__(self, max_entries: int = 4096, db_path: Optional[str] = None):
+        self.max_entries = max(1, int(max_entries))
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = self._open_db(db_path)
+
+    @staticmethod
+    def _open_db(db_path: str) -> sqlite3.Connection:
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("CREATE TABLE IF NOT EXISTS papers (key TEXT PRIMARY KEY, record TEXT NOT NULL)")
+        db.commit()
+        return db
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return f"url:{canonicalize_url(url)}"
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        record = self._memory.get(key)
+        if record is None and self._db is not None:
+            try:
+                row = self._db.execute("SELECT record FROM papers WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read scholarly cache entry: {e}")
+                row = None
+            if row is not None:
+                try:
+                    record = json.loads(row[0])
+                except ValueError:
+                    record = None
+            if record is not None:
+                self._store_in_memory(key, record)
+        elif record is not None:
+            self._memory.move_to_end(key)
+        return record
+
+    def _store_in_memory(self, key: str, record: Dict[str, Any]) -> None:
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def lookup_url(self, url: str) -> Dict[str, str]:
+        """Get the identifiers of the paper a URL belongs to, from the URL itself or the cache."""
+        ids = extract_scholarly_ids(url)
+        with self._lock:
+            record = self._get(self._url_key(url))
+        if record:
+            for kind, value in record.get("ids", {}).items():
+                ids.setdefault(kind, value)
+        return ids
+
+    def get_paper(self, ids: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Get the cached record of a paper by any of its identifiers, or None."""
+        with self._lock:
+            for key in sorted(paper_keys(normalize_scholarly_ids(ids))):
+                record = self._get(key)
+                if record is not None:
+                    return dict(record)
+        return None
+
+    def remember(self, result: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Record the paper a search result belongs to.
+
+        The result's identifiers are merged with the cached ones for its URL
+        and with any record already stored under one of them, and the merged
+        record is stored under all of its keys.
+
+        Args:
+            result: A search result with ``href``/``url``, ``title``, ``body``
+                and optionally ``scholarly_ids``.
+
+        Returns:
+            The paper's identifiers, or an empty dict if it has none.
+        """
+        url = result.get("href") or result.get("url") or ""
+        ids = self.lookup_url(url) if url else {}
+        ids.update(normalize_scholarly_ids(result.get("scholarly_ids")))
+        if not ids:
+            return {}
+
+        with self._lock:
+            record: Dict[str, Any] = {"ids": {}, "title": "", "abstract": "", "urls": []}
+            seen_keys = set()
+            pending_keys = list(paper_keys(ids))
+            while pending_keys:
+                key = pending_keys.pop()
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                existing = self._get(key)
+                if not existing:
+                    continue
+                for kind, value in existing.get("ids", {}).items():
+                    record["ids"].setdefault(kind, value)
+                    pending_keys.append(f"{kind}:{value}")
+                record["title"] = record["title"] or existing.get("title") or ""
+                record["abstract"] = record["abstract"] or existing.get("abstract") or ""
+                record["urls"].extend(u for u in existing.get("urls", []) if u not in record["urls"])
+
+            for kind, value in ids.items():
+                record["ids"].setdefault(kind, value)
+            title = result.get("title") or ""
+            if title and title != "No Title":
+                record["title"] = record["title"] or title
+            abstract = result.get("body") or ""
+            if abstract.strip().lower() not in MISSING_ABSTRACTS:
+                record["abstract"] = record["abstract"] or abstract
+            if url and url not in record["urls"]:
+                record["urls"].append(url)
+
+            keys = paper_keys(record["ids"]) | {self._url_key(u) for u in record["urls"]}
+            for key in keys:
+                self._store_in_memory(key, record)
+            if self._db is not None:
+                try:
+                    payload = json.dumps(record)
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO papers (key, record) VALUES (?, ?)",
+                        [(key, payload) for key in keys],
+                    )
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.warning(f"Failed to write scholarly cache entry: {e}")
+            return dict(record["ids"])
+
+    def annotate(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Remember the papers of search results and attach their identifiers.
+
+        Results that belong to a paper get the paper's ``scholarly_ids``, and a
+        missing abstract is filled in from the cache.
+
+        Args:
+            results: Search results.
+
+        Returns:
+            The annotated results (copies of the results that were changed).
+        """
+        annotated = []
+        for result in results:
+            ids = self.remember(result)
+            if not ids:
+                annotated.append(result)
+                continue
+            result = dict(result, scholarly_ids=ids)
+            if (result.get("body") or "").strip().lower() in MISSING_ABSTRACTS:
+                record = self.get_paper(ids)
+                if record and record.get("abstract"):
+                    result["body"] = record["abstract"]
+            annotated.append(result)
+        return annotated
+
+    def visited_paper_keys(self, urls: Iterable[str]) -> Set[str]:
+        """Get the paper keys of the papers any of the URLs belong to."""
+        keys: Set[str] = set()
+        for url in urls:
+            if isinstance(url, str) and url:
+                keys |= paper_keys(self.lookup_url(url))
+        return keys
+
+    def clear(self) -> None:
+        """Drop every cached record from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM papers")
+                self._db.commit()
+
+
+# Caches are shared process-wide so nested researchers resolve URLs seen by others.
+_caches: Dict[tuple, ScholarlyCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_scholarly_cache(cfg) -> Optional[ScholarlyCache]:
+    """
+    Get the shared scholarly cache configured by SCHOLARLY_CACHE, or None when disabled.
+
+    Args:
+        cfg: The researcher Config.
+
+    Returns:
+        The process-wide ScholarlyCache for these settings, or None.
+    """
+    backend = str(getattr(cfg, "scholarly_cache", "memory") or "none").lower()
+    if backend not in SCHOLARLY_CACHE_BACKENDS:
+        logger.warning(f"Unknown SCHOLARLY_CACHE backend '{backend}', scholarly deduplication disabled")
+        return None
+    if backend == "none":
+        return None
+
+    db_path = getattr(cfg, "scholarly_cache_path", None) if backend == "sqlite" else None
+    if db_path:
+        db_path = os.path.abspath(db_path)
+
+    key = (backend, db_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            try:
+                cache = ScholarlyCache(db_path=db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to open scholarly cache at {db_path}, using memory only: {e}")
+                cache = ScholarlyCache()
+            _caches[key] = cache
+        return cache
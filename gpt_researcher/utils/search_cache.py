@@ -0,0 +1,233 @@
+"""
+Search result cache shared across GPTResearcher instances.
+
+Identical searches recur across sub-queries, deep research branches and
+reruns. Results are cached per (retriever, normalized query, query domains,
+max results, full-text mode) with per-retriever TTLs in an in-memory LRU tier, optionally
+backed by a SQLite database that other processes can share.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_BACKENDS = ("none", "memory", "sqlite")
+
+
+class SearchCache:
+    """
+    Two-tier TTL cache for retriever search results.
+
+    Lookups hit the in-memory LRU first and fall back to the SQLite tier when
+    a database path is given; disk hits are promoted into memory. All methods
+    are thread-safe so one instance can serve concurrent researchers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 86400,
+        ttls: Optional[Dict[str, float]] = None,
+        db_path: Optional[str] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.default_ttl = float(default_ttl)
+        self.ttls = dict(ttls or {})
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = self._open_db(db_path)
+
+    @staticmethod
+    def _open_db(db_path: str) -> sqlite3.Connection:
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        # WAL lets several processes read the cache while one of them writes.
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, retriever TEXT NOT NULL, "
+            "results TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        db.commit()
+        return db
+
+    @staticmethod
+    def make_key(
+        retriever_name: str,
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> str:
+        """Build the cache key; queries and domains are normalized first."""
+        from gpt_researcher.retrievers.utils import full_text_enabled
+
+        normalized_query = " ".join(query.lower().split())
+        domains = sorted({d.strip().lower() for d in (query_domains or []) if d and d.strip()})
+        parts = [retriever_name, normalized_query, domains, max_results]
+        # RETRIEVER_FULL_TEXT results carry page content, so they're kept
+        # apart from snippet-only ones (whose keys stay as they were)
+        if full_text_enabled():
+            parts.append("full_text")
+        raw = json.dumps(parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, retriever_name: str) -> float:
+        """Get the TTL in seconds for a retriever (0 or less disables caching)."""
+        try:
+            return float(self.ttls.get(retriever_name, self.default_ttl))
+        except (TypeError, ValueError):
+            return self.default_ttl
+
+    def get(
+        self,
+        retriever_name: str,
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results, or None on a miss."""
+        if self.get_ttl(retriever_name) <= 0:
+            return None
+
+        key = self.make_key(retriever_name, query, query_domains, max_results)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._memory[key]
+                entry = None
+            if entry is None and self._db is not None:
+                entry = self._get_from_db(key, now)
+                if entry is not None:
+                    self._store_in_memory(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._memory.move_to_end(key)
+            self.hits += 1
+            # Callers may annotate the results, so never hand out the cached objects.
+            return copy.deepcopy(entry[1])
+
+    def set(
+        self,
+        retriever_name: str,
+        query: str,
+        results: List[Dict[str, Any]],
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> None:
+        """Cache the results of a search. Empty results are not cached."""
+        ttl = self.get_ttl(retriever_name)
+        if ttl <= 0 or not results:
+            return
+
+        key = self.make_key(retriever_name, query, query_domains, max_results)
+        entry = (time.time() + ttl, copy.deepcopy(results))
+        with self._lock:
+            self._store_in_memory(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO search_cache (key, retriever, results, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, retriever_name, json.dumps(results), entry[0]),
+                    )
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.warning(f"Failed to write search cache entry: {e}")
+
+    def _store_in_memory(self, key: str, entry: tuple) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_from_db(self, key: str, now: float) -> Optional[tuple]:
+        try:
+            row = self._db.execute(
+                "SELECT results, expires_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            return row[1], json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Failed to read search cache entry: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Drop every cached entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cumulative hit/miss counters of this cache."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
+
+
+# Caches are shared process-wide so every researcher using the same settings,
+# including nested ones, reads and fills the same entries.
+_caches: Dict[tuple, SearchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_search_cache(cfg) -> Optional[SearchCache]:
+    """
+    Get the shared search cache configured by SEARCH_CACHE, or None when disabled.
+
+    Args:
+        cfg: The researcher Config.
+
+    Returns:
+        The process-wide SearchCache for these settings, or None.
+    """
+    backend = str(getattr(cfg, "search_cache", "none") or "none").lower()
+    if backend not in SEARCH_CACHE_BACKENDS:
+        logger.warning(f"Unknown SEARCH_CACHE backend '{backend}', search caching disabled")
+        return None
+    if backend == "none":
+        return None
+
+    db_path = getattr(cfg, "search_cache_path", None) if backend == "sqlite" else None
+    if db_path:
+        db_path = os.path.abspath(db_path)
+    max_entries = getattr(cfg, "search_cache_max_entries", 1024)
+    default_ttl = getattr(cfg, "search_cache_ttl", 86400)
+    ttls = getattr(cfg, "search_cache_ttls", None) or {}
+
+    key = (backend, db_path, max_entries, default_ttl, json.dumps(ttls, sort_keys=True))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            try:
+                cache = SearchCache(
+                    max_entries=max_entries,
+                    default_ttl=default_ttl,
+                    ttls=ttls,
+                    db_path=db_path,
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to open search cache at {db_path}, using memory only: {e}")
+                cache = SearchCache(max_entries=max_entries, default_ttl=default_ttl, ttls=ttls)
+            _caches[key] = cache
+        return cache
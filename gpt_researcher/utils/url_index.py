@@ -0,0 +1,252 @@
+"""
+Canonical URL normalization for deduplicating sources.
+
+Retrievers often return the same page under different URLs: http vs https,
+with or without ``www.``, a trailing slash, tracking parameters, an AMP
+variant or a fragment. ``canonicalize_url`` maps all of those to one key, and
+``CanonicalURLSet`` is a set of URLs that deduplicates on that key while
+keeping the first original URL it saw for citations.
+"""
+import re
+from collections.abc import MutableSet, Set as AbstractSet
+from typing import Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gclsrc", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "mkt_tok", "ref_src",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# Query parameters that only switch a page to its AMP rendering
+AMP_PARAMS = {("amp", ""), ("amp", "1"), ("amp", "true"), ("outputtype", "amp")}
+
+# https://example-com.cdn.ampproject.org/c/s/example.com/article
+_AMP_CACHE_PATH = re.compile(r"^/(?:[a-z]/)*(s/)?(?P<rest>[^/]+\.[^/]+/?.*)$", re.IGNORECASE)
+# https://www.google.com/amp/s/example.com/article
+_GOOGLE_AMP_PATH = re.compile(r"^/amp/(s/)?(?P<rest>[^/]+\.[^/]+/?.*)$", re.IGNORECASE)
+
+
+def _unwrap_amp_cache(host: str, path: str) -> Optional[str]:
+    """Return the publisher URL (without scheme) for AMP cache URLs."""
+    if host.endswith(".cdn.ampproject.org"):
+        match = _AMP_CACHE_PATH.match(path)
+    elif re.match(r"^(www\.)?google\.[a-z.]+$", host):
+        match = _GOOGLE_AMP_PATH.match(path)
+    else:
+        return None
+    return match.group("rest") if match else None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Get the canonical form of a URL used to detect duplicate sources.
+
+    The result is a dedup key, not a URL to fetch: the scheme is always
+    ``https``, ``www.``/``amp.`` prefixes, default ports, fragments, trailing
+    slashes, tracking and AMP parameters are dropped, and the remaining query
+    parameters are sorted. Non-HTTP(S) strings are returned stripped but
+    otherwise unchanged.
+
+    Args:
+        url: The URL to normalize.
+
+    Returns:
+        The canonical URL.
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return url
+
+    host = (parts.hostname or "").lower()
+    port = parts.port if parts.port not in (None, 80, 443) else None
+    path = parts.path or "/"
+
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        return canonicalize_url(f"https://{unwrapped}")
+
+    for prefix in ("www.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    # AMP renderings: /article/amp, /amp/article, /article.amp.html. A lone
+    # "amp" segment, or one that isn't lowercase (e.g. /wiki/Amp), is a page
+    # of its own rather than a rendering of another.
+    segments = [segment for segment in path.split("/") if segment]
+    if len(segments) > 1 and segments[-1] == "amp":
+        segments.pop()
+    elif len(segments) > 1 and segments[0] == "amp":
+        segments.pop(0)
+    if segments:
+        segments[-1] = re.sub(r"\.amp(\.html?)$", r"\1", segments[-1], flags=re.IGNORECASE)
+    path = "/" + "/".join(segments)
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        and (key.lower(), value.lower()) not in AMP_PARAMS
+    )
+
+    netloc = f"{host}:{port}" if port else host
+    return urlunsplit(("https", netloc, path, urlencode(query), ""))
+
+
+class CanonicalURLSet(MutableSet):
+    """
+    A set of URLs that treats URLs with the same canonical form as equal.
+
+    The set holds the original URLs, so iterating it yields URLs as the
+    retrievers returned them (for citations), while membership, updates,
+    comparisons and set algebra all compare canonical forms. The first
+    original URL of each canonical form is kept.
+
+    It wraps a dict of canonical form to original URL instead of subclassing
+    ``set``, so no inherited set method can compare raw strings.
+    """
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._canonical: dict[str, str] = {}
+        self.update(urls)
+
+    @classmethod
+    def _from_iterable(cls, urls: Iterable[str]) -> "CanonicalURLSet":
+        return cls(urls)
+
+    @classmethod
+    def _coerce(cls, other):
+        """Canonicalize the other operand of a set operator, e.g. a plain set."""
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, AbstractSet):
+            return cls(other)
+        return NotImplemented
+
+    def __contains__(self, url) -> bool:
+        if not isinstance(url, str):
+            return False
+        return canonicalize_url(url) in self._canonical
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._canonical.values())
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._canonical.values())!r})"
+
+    def add(self, url: str) -> None:
+        self._canonical.setdefault(canonicalize_url(url), url)
+
+    def discard(self, url: str) -> None:
+        if isinstance(url, str):
+            self._canonical.pop(canonicalize_url(url), None)
+
+    def clear(self) -> None:
+        self._canonical.clear()
+
+    def copy(self) -> "CanonicalURLSet":
+        return CanonicalURLSet(self)
+
+    def get_original(self, url: str) -> Optional[str]:
+        """Get the URL stored for the canonical form of ``url``, if any."""
+        return self._canonical.get(canonicalize_url(url))
+
+    # Operators canonicalize the other operand first, so a plain set holding
+    # two variants of one URL counts them once
+    def __le__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__le__(other)
+
+    def __lt__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__lt__(other)
+
+    def __ge__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__ge__(other)
+
+    def __gt__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__gt__(other)
+
+    def __eq__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__eq__(other)
+
+    def __and__(self, other):
+        # Keep this set's originals, as intersection_update does
+        other = self._coerce(other)
+        return other if other is NotImplemented else self._from_iterable(url for url in self if url in other)
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__sub__(other)
+
+    def __xor__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__xor__(other)
+
+    __rxor__ = __xor__
+
+    def __ixor__(self, other):
+        other = self._coerce(other)
+        return other if other is NotImplemented else super().__ixor__(other)
+
+    # Named methods of set, which (like set's) take any iterables
+    def update(self, *iterables: Iterable[str]) -> None:
+        for urls in iterables:
+            for url in urls:
+                self.add(url)
+
+    def difference_update(self, *iterables: Iterable[str]) -> None:
+        for urls in iterables:
+            for url in urls:
+                self.discard(url)
+
+    def intersection_update(self, *iterables: Iterable[str]) -> None:
+        for urls in iterables:
+            self &= CanonicalURLSet(urls)
+
+    def symmetric_difference_update(self, urls: Iterable[str]) -> None:
+        self ^= CanonicalURLSet(urls)
+
+    def union(self, *iterables: Iterable[str]) -> "CanonicalURLSet":
+        result = self.copy()
+        result.update(*iterables)
+        return result
+
+    def difference(self, *iterables: Iterable[str]) -> "CanonicalURLSet":
+        result = self.copy()
+        result.difference_update(*iterables)
+        return result
+
+    def intersection(self, *iterables: Iterable[str]) -> "CanonicalURLSet":
+        result = self.copy()
+        result.intersection_update(*iterables)
+        return result
+
+    def symmetric_difference(self, urls: Iterable[str]) -> "CanonicalURLSet":
+        return self ^ CanonicalURLSet(urls)
+
+    def issubset(self, urls: Iterable[str]) -> bool:
+        return self <= CanonicalURLSet(urls)
+
+    def issuperset(self, urls: Iterable[str]) -> bool:
+        return all(url in self for url in urls)
+
+
+def dedupe_urls(urls: Iterable[str]) -> list[str]:
+    """Remove URLs with duplicate canonical forms, keeping the first original of each."""
+    unique_urls = {}
+    for url in urls:
+        unique_urls.setdefault(canonicalize_url(url), url)
+    return list(unique_urls.values())
@@ -1,50 +1,129 @@
 import asyncio
-import time
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from .rate_limiter import get_global_rate_limiter
+from typing import Dict, Optional
+
+from .rate_limiter import get_scrape_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Worker processes for CPU-bound page parsing, shared by all WorkerPools in
+# this process (one per worker count) so nested researchers don't each start
+# their own
+_process_executors: Dict[int, ProcessPoolExecutor] = {}
+_process_executors_lock = threading.Lock()
+
+
+def get_process_executor(workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool with the given number of worker processes.
+
+    Workers are spawned rather than forked, since forking a process that runs
+    an event loop and worker threads can deadlock the child. A pool whose
+    worker died is replaced.
+
+    Returns:
+        The pool, or None if worker processes can't be started here (e.g. no
+        shared memory semaphores), in which case callers parse on threads.
+    """
+    with _process_executors_lock:
+        executor = _process_executors.get(workers)
+        if executor is None or getattr(executor, "_broken", False):
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            except (OSError, NotImplementedError, ImportError) as e:
+                logger.warning(f"Could not start {workers} parse worker processes, parsing on threads: {e}")
+                return None
+            _process_executors[workers] = executor
+        return executor
 
 
 class WorkerPool:
-    def __init__(self, max_workers: int, rate_limit_delay: float = 0.0):
+    def __init__(
+        self,
+        max_workers: int,
+        rate_limit_delay: float = 0.0,
+        max_concurrency: int = 0,
+        parse_workers: int = 0,
+        host_rate: float = 0.0,
+        host_burst: int = 1,
+        host_max_in_flight: int = 0,
+        provider_limits: Optional[Dict[str, dict]] = None,
+    ):
         """
         Initialize WorkerPool with concurrency and rate limiting.
 
         Args:
-            max_workers: Maximum number of concurrent workers
-            rate_limit_delay: Minimum seconds between requests GLOBALLY (0 = no limit)
-                             This delay is enforced across ALL WorkerPools to prevent
-                             overwhelming rate-limited APIs.
+            max_workers: Maximum number of worker threads (sync scrapes and page parsing)
+            rate_limit_delay: Minimum seconds between requests to each host or scraping
+                             API provider that has no rate of its own (0 = no limit).
                              Example: 6.0 for 10 req/min (Firecrawl free tier)
+            max_concurrency: Maximum number of scrapes in flight (0 = max_workers).
+                             Async scrapers hold no thread while they wait on
+                             the network, so this can be far above max_workers.
+            parse_workers: Number of worker processes that parse pages (0 = parse on
+                           the worker threads). HTML parsing is CPU-bound and holds
+                           the GIL, so threads alone can't use more than one core for it.
+            host_rate: Requests per second to any one host (0 = no limit).
+            host_burst: Requests a host may get back to back before host_rate applies.
+            host_max_in_flight: Requests in flight to any one host (0 = no limit).
+            provider_limits: "rate", "burst" and "max_in_flight" per scraping API
+                             provider, e.g. {"firecrawl": {"rate": 0.16}}.
 
         Note:
-            The rate_limit_delay is enforced GLOBALLY using a singleton rate limiter.
+            The limits are enforced across ALL WorkerPools by a shared scheduler.
             This means if you have multiple GPTResearcher instances (e.g., in deep research),
-            they will all share the same rate limit, preventing API overload.
+            they will all share each host's and provider's limits, preventing API overload.
         """
         self.max_workers = max_workers
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrency = max_concurrency if max_concurrency and max_concurrency > 0 else max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.parse_workers = parse_workers if parse_workers and parse_workers > 0 else 0
+
+        # Configure the scheduler shared by all WorkerPools
+        get_scrape_scheduler().configure(
+            host_rate=host_rate,
+            host_burst=host_burst,
+            host_max_in_flight=host_max_in_flight,
+            provider_limits=provider_limits,
+            default_delay=rate_limit_delay,
+        )
+
+    @property
+    def process_executor(self) -> Optional[ProcessPoolExecutor]:
+        """The shared parse worker processes, or None when parsing runs on threads."""
+        if not self.parse_workers:
+            return None
+        return get_process_executor(self.parse_workers)
 
-        # Configure the global rate limiter
-        # All WorkerPools share the same rate limiter instance
-        global_limiter = get_global_rate_limiter()
-        global_limiter.configure(rate_limit_delay)
+    @property
+    def parse_executor(self) -> Executor:
+        """Executor for parse steps: the worker processes if enabled, else the threads."""
+        return self.process_executor or self.executor
 
     @asynccontextmanager
-    async def throttle(self):
+    async def throttle(self, url: Optional[str] = None, provider: Optional[str] = None):
         """
-        Throttle requests with both concurrency limiting and GLOBAL rate limiting.
+        Throttle a request with both concurrency limiting and per-host/provider rate limiting.
 
         - Semaphore controls concurrent operations within THIS pool (how many at once)
-        - Global rate limiter controls request frequency ACROSS ALL POOLS (global timing)
+        - The shared scheduler controls each host's or provider's request rate and
+          requests in flight ACROSS ALL POOLS
 
         This ensures that even with multiple concurrent GPTResearcher instances
-        (e.g., in deep research), the total request rate stays within limits.
+        (e.g., in deep research), each host and API gets no more than its allowed rate.
+
+        Args:
+            url: The URL requested; its host's limits apply.
+            provider: Scraping API the request goes through (e.g. "firecrawl");
+                      its limits apply instead of the host's.
         """
-        async with self.semaphore:
-            # Use global rate limiter (shared across all WorkerPools)
-            global_limiter = get_global_rate_limiter()
-            await global_limiter.wait_if_needed()
+        async with get_scrape_scheduler().slot(self.semaphore, url, provider):
             yield
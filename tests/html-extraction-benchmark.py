@@ -0,0 +1,71 @@
+"""
+Micro-benchmark of the page extraction engines on the HTML fixture corpus.
+
+Times extract_page() with the "bs4" engine (BeautifulSoup tree, clean_soup,
+get_text_from_soup, get_relevant_images, extract_title) against the
+single-pass "lxml" engine, and checks that both produce the same output.
+
+    python tests/html-extraction-benchmark.py [--repeat 50] [--scale 20]
+
+``--scale`` repeats each page's body to approximate long articles.
+"""
+import argparse
+import re
+import time
+import warnings
+from pathlib import Path
+
+from gpt_researcher.scraper.utils import extract_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+URL = "https://example.com/articles/page"
+
+
+def load_corpus(scale: int) -> dict:
+    corpus = {}
+    for path in sorted(FIXTURES.glob("*.html")):
+        page = path.read_bytes()
+        if scale > 1:
+            # Repeat the body content to get a page the size of a long article
+            match = re.search(rb"(?is)<body[^>]*>(.*)</body>", page)
+            if match:
+                page = page[:match.start(1)] + match.group(1) * scale + page[match.end(1):]
+        corpus[path.name] = page
+    return corpus
+
+
+def time_engine(engine: str, corpus: dict, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in corpus.values():
+            extract_page(page, URL, engine=engine)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the corpus per engine")
+    parser.add_argument("--scale", type=int, default=20, help="times each page body is repeated")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")  # bs4 warns about the XML declaration in edge_cases.html
+    corpus = load_corpus(args.scale)
+    total_bytes = sum(len(page) for page in corpus.values())
+
+    for name, page in corpus.items():
+        if extract_page(page, URL, engine="bs4") != extract_page(page, URL, engine="lxml"):
+            raise SystemExit(f"Engines disagree on {name}")
+
+    print(f"{len(corpus)} pages, {total_bytes / 1024:.0f} KiB per pass, {args.repeat} passes")
+    timings = {engine: time_engine(engine, corpus, args.repeat) for engine in ("bs4", "lxml")}
+    pages = len(corpus) * args.repeat
+    for engine, seconds in timings.items():
+        print(
+            f"{engine:>5}: {seconds:7.3f}s  {seconds / pages * 1000:7.2f} ms/page  "
+            f"{total_bytes * args.repeat / seconds / 1024 / 1024:6.1f} MiB/s"
+        )
+    print(f"speedup: {timings['bs4'] / timings['lxml']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
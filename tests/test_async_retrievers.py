@@ -0,0 +1,235 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+
+from gpt_researcher.actions.query_processing import get_search_results
+from gpt_researcher.actions.retriever import run_retriever_search
+from gpt_researcher.retrievers.brave.brave import BraveSearch
+from gpt_researcher.retrievers.pubmed_central.pubmed_central import PubMedCentralSearch
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils import http_client
+from gpt_researcher.utils.http_client import PooledAsyncClient, configure_http_client, get_async_http_client
+from gpt_researcher.utils.retriever_health import RetrieverHealthRegistry, RetrieverUnavailableError
+
+PMC_ARTICLE = """<pmc-articleset><article><front><article-meta>
+<article-id pub-id-type="doi">10.1000/xyz</article-id>
+<title-group><article-title>Gut flora</article-title></title-group>
+<abstract><p>Short abstract.</p></abstract>
+</article-meta></front><body><p>Full text.</p></body></article></pmc-articleset>"""
+
+
+def _mock_client(handler):
+    pooled = PooledAsyncClient()
+    pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch("gpt_researcher.utils.http_client.get_async_http_client", return_value=pooled)
+
+
+class SyncOnlyRetriever:
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        return [{"href": "https://example.com/sync", "body": "sync"}]
+
+
+class AsyncRetriever:
+    cancelled = False
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        raise AssertionError("search_async should be preferred over search")
+
+    async def search_async(self, max_results=10):
+        return [{"href": "https://example.com/async", "body": "async"}]
+
+
+class HangingAsyncRetriever:
+    cancelled = False
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    async def search_async(self, max_results=10):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            HangingAsyncRetriever.cancelled = True
+            raise
+        return []
+
+
+class RunRetrieverSearchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_prefers_search_async(self):
+        results = await run_retriever_search(AsyncRetriever("q"), max_results=3)
+        self.assertEqual(results[0]["href"], "https://example.com/async")
+
+    async def test_falls_back_to_sync_search(self):
+        results = await run_retriever_search(SyncOnlyRetriever("q"), max_results=3)
+        self.assertEqual(results[0]["href"], "https://example.com/sync")
+
+    async def test_get_search_results_uses_async_path(self):
+        results = await get_search_results("q", AsyncRetriever, max_results=3)
+        self.assertEqual(results[0]["body"], "async")
+
+    async def test_conductor_cancels_async_retriever_past_deadline(self):
+        HangingAsyncRetriever.cancelled = False
+        researcher = SimpleNamespace(
+            retrievers=[HangingAsyncRetriever],
+            cfg=SimpleNamespace(max_search_results_per_query=5, retriever_timeout=0.05),
+            visited_urls=set(),
+            verbose=False,
+            websocket=None,
+        )
+        conductor = ResearchConductor(researcher)
+
+        await conductor._search_relevant_source_urls("q")
+
+        self.assertTrue(HangingAsyncRetriever.cancelled)
+
+
+class RetrieverSearchAsyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_brave_sends_a_get_with_params_and_parses_web_results(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"web": {"results": [
+                {"url": "https://example.com/a", "title": "A", "description": "About A"},
+                {"title": "no url"},
+            ]}})
+
+        with patch.dict("os.environ", {"BRAVE_API_KEY": "key"}), _mock_client(handler):
+            results = await BraveSearch("gut flora").search_async(max_results=30)
+
+        self.assertEqual(requests[0].method, "GET")
+        self.assertEqual(dict(requests[0].url.params), {"q": "gut flora", "count": "20"})
+        self.assertEqual(requests[0].headers["X-Subscription-Token"], "key")
+        self.assertEqual(results, [{"title": "A", "href": "https://example.com/a", "body": "About A"}])
+
+    async def test_tavily_posts_json_and_parses_results(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"results": [{"url": "https://example.com/a", "content": "About A"}]})
+
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "key"}), _mock_client(handler):
+            results = await TavilySearch("gut flora site:nih.gov").search_async(max_results=3)
+
+        body = json.loads(requests[0].content)
+        self.assertEqual(requests[0].method, "POST")
+        self.assertEqual(
+            (body["query"], body["include_domains"], body["max_results"], body["api_key"]),
+            ("gut flora", ["nih.gov"], 3, "key"),
+        )
+        self.assertEqual(results, [{"href": "https://example.com/a", "body": "About A"}])
+
+    async def test_rate_limited_tavily_searches_open_the_circuit(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429)
+
+        researcher = SimpleNamespace(retriever_health=RetrieverHealthRegistry(failure_threshold=2, cooldown=60))
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "key"}), _mock_client(handler):
+            for _ in range(2):
+                with self.assertRaises(httpx.HTTPStatusError):
+                    await get_search_results("gut flora", TavilySearch, researcher=researcher)
+            with self.assertRaises(RetrieverUnavailableError):
+                await get_search_results("gut flora", TavilySearch, researcher=researcher)
+
+        health = researcher.retriever_health.snapshot()["tavily"]
+        self.assertEqual((health["state"], health["error_rate"]), ("open", 1.0))
+        self.assertEqual(len(requests), 2)
+
+    async def test_pubmed_searches_then_fetches_each_article(self):
+        requests = []
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("esearch.fcgi"):
+                return httpx.Response(200, json={"esearchresult": {"idlist": [f"PMC{i}" for i in range(6)]}})
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, text=PMC_ARTICLE)
+
+        with patch.dict("os.environ", {"NCBI_API_KEY": ""}), _mock_client(handler):
+            results = await PubMedCentralSearch("gut flora").search_async(max_results=6)
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[0]["href"], "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC0/")
+        self.assertEqual(results[0]["title"], "Gut flora")
+        self.assertEqual(results[0]["scholarly_ids"], {"pmcid": "PMC0", "doi": "10.1000/xyz"})
+        self.assertEqual(dict(requests[1].url.params)["id"], "PMC0")
+        # Without an API key NCBI allows 3 requests/s, and no empty api_key= is sent
+        self.assertEqual(in_flight["max"], 3)
+        self.assertTrue(all("api_key" not in request.url.params for request in requests))
+
+    async def test_pubmed_sends_the_api_key_when_set(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"esearchresult": {"idlist": []}})
+
+        with patch.dict("os.environ", {"NCBI_API_KEY": "key"}), _mock_client(handler):
+            await PubMedCentralSearch("gut flora").search_async()
+
+        self.assertEqual(requests[0].url.params["api_key"], "key")
+
+
+class PooledAsyncClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_client_is_shared_within_event_loop(self):
+        self.assertIs(get_async_http_client(), get_async_http_client())
+
+    async def test_per_host_limit_caps_concurrent_requests(self):
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, json={})
+
+        pooled = PooledAsyncClient(max_connections_per_host=2)
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            await asyncio.gather(*(pooled.get("https://example.com/") for _ in range(6)))
+        finally:
+            await pooled.aclose()
+
+        self.assertEqual(in_flight["max"], 2)
+
+
+def test_pool_settings_come_from_the_config(monkeypatch):
+    monkeypatch.setattr(http_client, "_settings", dict(http_client._settings))
+    configure_http_client(SimpleNamespace(http_max_connections_per_host=4, http_timeout=5))
+
+    pooled = PooledAsyncClient()
+
+    assert pooled.max_connections_per_host == 4
+    assert pooled.client.timeout.read == 5
+    assert PooledAsyncClient(max_connections_per_host=2).max_connections_per_host == 2
+
+
+def test_each_event_loop_gets_its_own_client():
+    async def current_client():
+        return get_async_http_client()
+
+    assert asyncio.run(current_client()) is not asyncio.run(current_client())
+
+
+if __name__ == "__main__":
+    unittest.main()
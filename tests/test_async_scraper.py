@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import unittest
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import requests
+
+from gpt_researcher.scraper import BeautifulSoupScraper
+from gpt_researcher.scraper.beautiful_soup import beautiful_soup
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils import http_client
+from gpt_researcher.utils.http_client import PooledAsyncClient
+from gpt_researcher.utils import workers
+from gpt_researcher.utils.workers import WorkerPool
+
+PAGE = (
+    "<html><head><title>Async page</title></head><body><nav>menu</nav>"
+    "<p>" + "Readable paragraph text. " * 20 + "</p></body></html>"
+)
+
+
+def _install_client(handler):
+    pooled = PooledAsyncClient()
+    pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    http_client._clients[asyncio.get_running_loop()] = pooled
+    return pooled
+
+
+class AsyncScraperTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await http_client.close_async_http_client()
+
+    async def test_fetches_on_shared_client_and_parses_on_executor(self):
+        seen = {}
+
+        def handler(request):
+            seen["user_agent"] = request.headers.get("User-Agent")
+            return httpx.Response(200, text=PAGE, headers={"Content-Type": "text/html; charset=utf-8"})
+
+        _install_client(handler)
+        session = requests.Session()
+        session.headers.update({"User-Agent": "test-agent"})
+        scraper = BeautifulSoupScraper("https://example.com/page", session)
+        parse_threads = []
+        extract_page = beautiful_soup.extract_page
+
+        def parse(*args):
+            parse_threads.append(threading.current_thread().name)
+            return extract_page(*args)
+
+        with ThreadPoolExecutor(thread_name_prefix="parse") as executor, patch.object(
+            beautiful_soup, "extract_page", parse
+        ):
+            scraper.parse_executor = executor
+            content, image_urls, title = await scraper.scrape_async()
+
+        self.assertEqual(seen["user_agent"], "test-agent")
+        self.assertEqual(title, "Async page")
+        self.assertIn("Readable paragraph text.", content)
+        self.assertNotIn("menu", content)
+        self.assertTrue(parse_threads[0].startswith("parse"))
+
+    async def test_retries_once_then_skips_error_pages(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(503)
+
+        _install_client(handler)
+        scraper = BeautifulSoupScraper("https://example.com/down")
+        with patch("asyncio.sleep", new=AsyncMock()):
+            self.assertEqual(await scraper.scrape_async(), ("", [], ""))
+        self.assertEqual(len(calls), 2)
+
+    async def test_concurrency_is_independent_of_worker_threads(self):
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, text=PAGE, headers={"Content-Type": "text/html"})
+
+        pooled = _install_client(handler)
+        pooled.max_connections_per_host = 100
+        urls = [f"https://example.com/{i}" for i in range(12)]
+        pool = WorkerPool(max_workers=2, max_concurrency=12)
+        results = await Scraper(urls, "ua", "bs", pool).run()
+
+        self.assertEqual(len(results), 12)
+        self.assertGreater(in_flight["max"], 2)
+
+    async def test_parses_in_shared_worker_processes(self):
+        def handler(request):
+            return httpx.Response(200, text=PAGE, headers={"Content-Type": "text/html"})
+
+        _install_client(handler)
+        pool = WorkerPool(max_workers=2, max_concurrency=4, parse_workers=1)
+        urls = [f"https://example.com/{i}" for i in range(3)]
+        results = await Scraper(urls, "ua", "bs", pool).run()
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result["title"] == "Async page" for result in results))
+        self.assertIsInstance(pool.parse_executor, ProcessPoolExecutor)
+        self.assertIs(WorkerPool(4, parse_workers=1).process_executor, pool.process_executor)
+        self.assertNotEqual(pool.process_executor.submit(os.getpid).result(), os.getpid())
+
+
+class ParseExecutorTests(unittest.TestCase):
+    def test_parse_workers_default_to_the_thread_pool(self):
+        pool = WorkerPool(max_workers=2)
+        self.assertIsNone(pool.process_executor)
+        self.assertIs(pool.parse_executor, pool.executor)
+
+    def test_falls_back_to_threads_when_processes_cannot_start(self):
+        with patch.object(workers, "ProcessPoolExecutor", side_effect=OSError("no sem_open")), \
+                patch.dict(workers._process_executors, clear=True):
+            pool = WorkerPool(max_workers=2, parse_workers=3)
+            self.assertIsNone(pool.process_executor)
+            self.assertIs(pool.parse_executor, pool.executor)
+
+    def test_sync_scrapers_only_get_worker_processes(self):
+        class SyncScraper:
+            def __init__(self, link, session=None):
+                self.link = link
+                self.parse_executor = "unset"
+
+            def scrape(self):
+                return "x" * 200, [], "t"
+
+        seen = []
+        pool = WorkerPool(max_workers=2)
+        scraper = Scraper(["https://example.com/a"], "ua", "bs", pool)
+        scraper.get_scraper = lambda link: lambda *args: seen.append(SyncScraper(*args)) or seen[-1]
+
+        asyncio.run(scraper.run())
+        self.assertIsNone(seen[0].parse_executor)
+
+    def test_sync_scrapers_are_told_the_worker_process_count(self):
+        class SyncScraper:
+            def __init__(self, link, session=None):
+                self.link = link
+                self.parse_executor = None
+                self.parse_workers = 1
+
+            def scrape(self):
+                return "x" * 200, [], "t"
+
+        seen = []
+        processes = object()
+        pool = WorkerPool(max_workers=2, parse_workers=3)
+        scraper = Scraper(["https://example.com/a"], "ua", "bs", pool)
+        scraper.get_scraper = lambda link: lambda *args: seen.append(SyncScraper(*args)) or seen[-1]
+
+        with patch.object(workers, "get_process_executor", return_value=processes):
+            asyncio.run(scraper.run())
+        self.assertIs(seen[0].parse_executor, processes)
+        self.assertEqual(seen[0].parse_workers, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.scraper.firecrawl.firecrawl import FireCrawl
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.scraper.tavily_extract.tavily_extract import TavilyExtract
+from gpt_researcher.scraper.utils import match_batch_results
+from gpt_researcher.utils.workers import WorkerPool
+
+CONTENT = "Extracted by the API. " * 10
+
+
+def test_batch_results_are_matched_to_the_links_asked_for():
+    links = ["https://www.example.com/a?utm_source=x", "https://example.com/b", "https://example.com/c"]
+    results = [("https://example.com/a", "A"), ("https://example.com/b", "B"), (None, "orphan")]
+
+    assert match_batch_results(links, results) == {links[0]: "A", links[1]: "B", links[2]: None}
+
+
+def test_tavily_extracts_a_batch_in_one_call():
+    calls = []
+    scraper = TavilyExtract.__new__(TavilyExtract)
+    scraper.tavily_client = SimpleNamespace(extract=lambda urls: calls.append(urls) or {
+        "results": [{"url": "https://example.com/a", "raw_content": "A"}],
+        "failed_results": [{"url": "https://example.com/b", "error": "blocked"}],
+    })
+
+    pages = scraper.extract_batch(["https://example.com/a", "https://example.com/b"])
+
+    assert calls == [["https://example.com/a", "https://example.com/b"]]
+    assert pages == {"https://example.com/a": ("A", ""), "https://example.com/b": None}
+
+
+def test_firecrawl_extracts_a_batch_in_one_call():
+    def document(url, markdown, title="", status_code=200, error=None):
+        metadata = SimpleNamespace(source_url=url, url=url, title=title, status_code=status_code, error=error)
+        return SimpleNamespace(markdown=markdown, metadata=metadata)
+
+    calls = []
+    scraper = FireCrawl.__new__(FireCrawl)
+    scraper.firecrawl = SimpleNamespace(batch_scrape=lambda urls, **kwargs: calls.append(urls) or SimpleNamespace(data=[
+        document("https://example.com/a", "# A", "Title A"),
+        document("https://example.com/b", "", status_code=404),
+    ]))
+
+    pages = scraper.extract_batch(["https://example.com/a", "https://example.com/b"])
+
+    assert calls == [["https://example.com/a", "https://example.com/b"]]
+    assert pages == {"https://example.com/a": ("# A", "Title A"), "https://example.com/b": None}
+
+
+@pytest.mark.asyncio
+async def test_scraper_batches_api_extraction_and_falls_back_per_url(monkeypatch):
+    batches = []
+    fallbacks = []
+
+    class FakeExtract:
+        def __init__(self, link, session=None):
+            pass
+
+        def extract_batch(self, links):
+            batches.append(links)
+            return {link: None if link.endswith("/3") else (CONTENT, "") for link in links}
+
+    class FakeBeautifulSoup:
+        def __init__(self, link, session=None):
+            self.link = link
+
+        def scrape(self):
+            fallbacks.append(self.link)
+            return "Scraped directly. " * 10, [], "Direct"
+
+    monkeypatch.setattr(
+        "gpt_researcher.scraper.scraper.fetch_images_and_title",
+        lambda link, session: ([{"url": f"{link}/image.png", "score": 1}], f"Page {link[-1]}"),
+    )
+    urls = [f"https://site{i}.example/{i}" for i in range(5)]
+    scraper = Scraper(urls, "ua", "tavily_extract", WorkerPool(4), batch_size=2)
+    scraper.get_scraper = lambda link, key=None: FakeBeautifulSoup if key == "bs" else FakeExtract
+
+    results = {result["url"]: result for result in await scraper.run()}
+
+    assert batches == [urls[:2], urls[2:4], urls[4:]]
+    assert fallbacks == [urls[3]]
+    assert results[urls[0]] == {
+        "url": urls[0],
+        "raw_content": CONTENT,
+        "image_urls": [{"url": f"{urls[0]}/image.png", "score": 1}],
+        "title": "Page 0",
+    }
+    assert results[urls[3]]["title"] == "Direct"
+    assert len(results) == 5
+
+
+def test_batch_size_one_keeps_one_call_per_url():
+    scraper = Scraper(["https://example.com/a"], "ua", "tavily_extract", WorkerPool(2))
+
+    assert scraper._batcher is None
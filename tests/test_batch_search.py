@@ -0,0 +1,148 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+
+from gpt_researcher.actions.query_processing import get_search_results_many
+from gpt_researcher.actions.retriever import search_many
+from gpt_researcher.retrievers.serper.serper import SerperSearch
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils import retriever_health as retriever_health_module
+from gpt_researcher.utils.http_client import PooledAsyncClient
+from gpt_researcher.utils.retriever_health import (
+    CLOSED,
+    OPEN,
+    RetrieverHealthRegistry,
+    RetrieverUnavailableError,
+)
+from gpt_researcher.utils.search_cache import SearchCache
+
+
+class SingleQueryRetriever:
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    async def search_async(self, max_results=10):
+        SingleQueryRetriever.in_flight += 1
+        SingleQueryRetriever.max_in_flight = max(SingleQueryRetriever.max_in_flight, SingleQueryRetriever.in_flight)
+        await asyncio.sleep(0.01)
+        SingleQueryRetriever.in_flight -= 1
+        return [{"href": f"https://example.com/{self.query}", "body": "snippet"}]
+
+
+class BatchRetriever:
+    batches = []
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        raise AssertionError("single searches should be served by the batch")
+
+    @classmethod
+    async def search_many(cls, queries, max_results=10, query_domains=None):
+        cls.batches.append(list(queries))
+        return [[{"href": f"https://batch.example.com/{query}", "body": "snippet"}] for query in queries]
+
+
+class SearchManyTests(unittest.IsolatedAsyncioTestCase):
+    async def test_default_runs_bounded_concurrent_single_searches(self):
+        SingleQueryRetriever.max_in_flight = 0
+
+        results = await search_many(SingleQueryRetriever, ["a", "b", "c", "d"], concurrency=2)
+
+        self.assertEqual([r[0]["href"] for r in results], [f"https://example.com/{q}" for q in "abcd"])
+        self.assertEqual(SingleQueryRetriever.max_in_flight, 2)
+
+    async def test_serper_batches_queries_in_one_request(self):
+        requests = []
+
+        async def handler(request):
+            body = json.loads(request.content)
+            requests.append(body)
+            return httpx.Response(200, json=[
+                {"organic": [{"title": params["q"], "link": f"https://example.com/{i}", "snippet": "s"}]}
+                for i, params in enumerate(body)
+            ])
+
+        pooled = PooledAsyncClient()
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.dict("os.environ", {"SERPER_API_KEY": "key"}), \
+                patch("gpt_researcher.utils.http_client.get_async_http_client", return_value=pooled):
+            results = await SerperSearch.search_many(["first", "second"], max_results=3)
+        await pooled.aclose()
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual([params["q"] for params in requests[0]], ["first", "second"])
+        self.assertEqual([params["num"] for params in requests[0]], [3, 3])
+        self.assertEqual([r[0]["title"] for r in results], ["first", "second"])
+
+    async def test_cached_queries_are_left_out_of_the_batch(self):
+        BatchRetriever.batches = []
+        cache = SearchCache()
+        cache.set("BatchRetriever", "cached", [{"href": "https://example.com/cached"}], max_results=5)
+        researcher = SimpleNamespace(search_cache=cache, search_cache_stats={"hits": 0, "misses": 0})
+
+        results = await get_search_results_many(
+            ["cached", "fresh", "other"], BatchRetriever, researcher=researcher, max_results=5
+        )
+
+        self.assertEqual(BatchRetriever.batches, [["fresh", "other"]])
+        self.assertEqual(results["cached"], [{"href": "https://example.com/cached"}])
+        self.assertEqual(cache.get("BatchRetriever", "fresh", max_results=5)[0]["href"], "https://batch.example.com/fresh")
+
+    async def test_batches_feed_retriever_health_and_probe_half_open_circuits(self):
+        class FlakyBatchRetriever(BatchRetriever):
+            fail = True
+
+            @classmethod
+            async def search_many(cls, queries, max_results=10, query_domains=None):
+                if cls.fail:
+                    raise ConnectionError("provider throttled")
+                return await super().search_many(queries, max_results, query_domains)
+
+        now = [100.0]
+        health = RetrieverHealthRegistry(failure_threshold=1, cooldown=30)
+        researcher = SimpleNamespace(retriever_health=health)
+        with patch.object(retriever_health_module.time, "monotonic", lambda: now[0]):
+            with self.assertRaises(ConnectionError):
+                await get_search_results_many(["a", "b"], FlakyBatchRetriever, researcher=researcher)
+            self.assertEqual(health.get_state("FlakyBatchRetriever"), OPEN)
+            with self.assertRaises(RetrieverUnavailableError):
+                await get_search_results_many(["a", "b"], FlakyBatchRetriever, researcher=researcher)
+
+            now[0] += 31
+            FlakyBatchRetriever.fail = False
+            results = await get_search_results_many(["a", "b"], FlakyBatchRetriever, researcher=researcher)
+
+        self.assertEqual(results["b"][0]["href"], "https://batch.example.com/b")
+        self.assertEqual(health.get_state("FlakyBatchRetriever"), CLOSED)
+        self.assertEqual(health.snapshot()["FlakyBatchRetriever"]["requests"], 2)
+
+    async def test_conductor_resolves_sub_queries_with_one_batch(self):
+        BatchRetriever.batches = []
+        researcher = SimpleNamespace(
+            retrievers=[BatchRetriever],
+            cfg=SimpleNamespace(max_search_results_per_query=5),
+            visited_urls=set(),
+            verbose=False,
+        )
+        conductor = ResearchConductor(researcher)
+
+        await conductor._batch_search_sub_queries(["one", "two", "three"], [])
+        searches = await asyncio.gather(*(
+            conductor._run_retriever(BatchRetriever, query, []) for query in ("one", "two", "three")
+        ))
+
+        self.assertEqual(BatchRetriever.batches, [["one", "two", "three"]])
+        self.assertEqual([s[0]["href"] for s in searches], [f"https://batch.example.com/{q}" for q in ("one", "two", "three")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+
+from gpt_researcher.scraper.browser import driver_pool
+from gpt_researcher.scraper.browser.browser import BrowserScraper
+from gpt_researcher.scraper.browser.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.crashed = False
+        self.quit_calls = 0
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise ConnectionError("browser is gone")
+        return "about:blank"
+
+    def execute_script(self, script):
+        return None
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def _factory():
+    drivers = []
+
+    def create():
+        drivers.append(FakeDriver(len(drivers)))
+        return drivers[-1]
+
+    return create, drivers
+
+
+def _use(pool):
+    with pool.lease() as driver:
+        return driver
+
+
+def test_drivers_are_reused_and_recycled_after_max_pages():
+    create, drivers = _factory()
+    pool = DriverPool(create, max_drivers=2, max_pages=3)
+
+    used = [_use(pool) for _ in range(4)]
+
+    assert used[:3] == [drivers[0]] * 3
+    assert drivers[0].quit_calls == 1
+    assert used[3] is drivers[1]
+
+
+def test_crashed_drivers_are_replaced_but_slow_pages_keep_theirs():
+    create, drivers = _factory()
+    pool = DriverPool(create, max_drivers=1, max_pages=0)
+
+    with pytest.raises(TimeoutError):
+        with pool.lease():
+            raise TimeoutError("page load timed out")
+    with pytest.raises(ConnectionError):
+        with pool.lease() as driver:
+            driver.crashed = True
+            raise ConnectionError("browser is gone")
+
+    assert drivers[0].quit_calls == 1
+    # A driver that died while idle is caught by the check before reuse
+    _use(pool).crashed = True
+    assert _use(pool) is drivers[2]
+    assert [driver.quit_calls for driver in drivers] == [1, 1, 0]
+
+
+def test_leases_wait_when_the_pool_is_full():
+    create, drivers = _factory()
+    pool = DriverPool(create, max_drivers=2, max_pages=0)
+    in_use = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def scrape():
+        with pool.lease():
+            with lock:
+                in_use["now"] += 1
+                in_use["max"] = max(in_use["max"], in_use["now"])
+            time.sleep(0.02)
+            with lock:
+                in_use["now"] -= 1
+
+    threads = [threading.Thread(target=scrape) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert in_use["max"] == 2
+    assert len(drivers) == 2
+
+    pool.close()
+    assert [driver.quit_calls for driver in drivers] == [1, 1]
+    with pytest.raises(RuntimeError):
+        _use(pool)
+
+
+def test_browser_scraper_shares_warm_drivers_across_instances(monkeypatch):
+    create, drivers = _factory()
+    monkeypatch.setattr(BrowserScraper, "_import_selenium", lambda self: None)
+    monkeypatch.setattr(BrowserScraper, "_start_driver", lambda self: create())
+    monkeypatch.setattr(
+        BrowserScraper, "scrape_text_with_selenium", lambda self: (f"Text of {self.url}", [], self.driver.number)
+    )
+    driver_pool.close_driver_pools()
+
+    try:
+        results = [BrowserScraper(f"https://example.com/{i}").scrape() for i in range(3)]
+        pool = BrowserScraper("https://example.com")._driver_pool()
+        configured = BrowserScraper("https://example.com")
+        configured.driver_max_pages = 10
+        assert configured._driver_pool() is pool
+    finally:
+        driver_pool.close_driver_pools()
+
+    assert results == [(f"Text of https://example.com/{i}", [], 0) for i in range(3)]
+    assert pool.max_drivers == 4
+    assert pool.max_pages == 10
+    assert drivers[0].quit_calls == 1
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from gpt_researcher.actions.retriever import get_retriever_name, get_retrievers
+from gpt_researcher.llm_provider.generic.base import GenericLLMProvider
+from gpt_researcher.memory.embeddings import Memory
+from gpt_researcher.retrievers import Duckduckgo
+from gpt_researcher.scraper import BeautifulSoupScraper
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.cassette import CassetteMissError, CassetteReplayedError, get_cassette, use_cassette
+from gpt_researcher.utils.workers import WorkerPool
+
+
+class CountingRetriever:
+    calls = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        CountingRetriever.calls += 1
+        time.sleep(0.05)
+        if self.query == "broken":
+            raise ConnectionError("provider down")
+        return [{"href": f"https://example.com/{self.query}", "body": "snippet"}][:max_results]
+
+
+class FakeScraper:
+    calls = 0
+
+    def __init__(self, link, session=None):
+        self.link = link
+
+    async def scrape_async(self):
+        FakeScraper.calls += 1
+        return "page content " * 20, [{"url": "https://example.com/a.png"}], "Title"
+
+
+class FakeEmbeddings:
+    calls = 0
+
+    async def aembed_documents(self, texts):
+        FakeEmbeddings.calls += 1
+        return [[float(len(text)), 0.5] for text in texts]
+
+    async def aembed_query(self, text):
+        FakeEmbeddings.calls += 1
+        return [float(len(text)), 1.0]
+
+
+class FakeLLM:
+    calls = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        FakeLLM.calls += 1
+        return SimpleNamespace(content=f"answer to {messages[-1]['content']}", usage_metadata={"input_tokens": 3})
+
+
+def test_retriever_searches_replay_without_calling_the_retriever(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    CountingRetriever.calls = 0
+
+    with use_cassette(path, "record") as cassette:
+        retriever = cassette.wrap_retriever(CountingRetriever)
+        recorded = asyncio.run(retriever("solar", query_domains=["a.com"]).search_async(max_results=3))
+        with pytest.raises(ConnectionError):
+            retriever("broken").search(max_results=3)
+
+    with use_cassette(path, "replay") as cassette:
+        retriever = cassette.wrap_retriever(CountingRetriever)
+        assert asyncio.run(retriever("solar", query_domains=["a.com"]).search_async(max_results=3)) == recorded
+        with pytest.raises(CassetteReplayedError, match="provider down"):
+            retriever("broken").search(max_results=3)
+        with pytest.raises(CassetteMissError):
+            retriever("never searched").search(max_results=3)
+
+    assert CountingRetriever.calls == 2
+
+
+def test_full_text_searches_are_recorded_apart(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.json.gz")
+    monkeypatch.setenv("RETRIEVER_FULL_TEXT", "false")
+    with use_cassette(path, "record") as cassette:
+        cassette.wrap_retriever(CountingRetriever)("solar").search(max_results=3)
+
+    monkeypatch.setenv("RETRIEVER_FULL_TEXT", "true")
+    with use_cassette(path, "replay") as cassette:
+        with pytest.raises(CassetteMissError):
+            cassette.wrap_retriever(CountingRetriever)("solar").search(max_results=3)
+
+
+def test_replay_can_simulate_recorded_latency(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    with use_cassette(path, "record") as cassette:
+        cassette.wrap_retriever(CountingRetriever)("slow").search(max_results=1)
+
+    for latency_factor, check in ((0, lambda t: t < 0.04), (1, lambda t: t >= 0.05)):
+        with use_cassette(path, "replay", latency_factor=latency_factor) as cassette:
+            start = time.perf_counter()
+            cassette.wrap_retriever(CountingRetriever)("slow").search(max_results=1)
+            assert check(time.perf_counter() - start)
+
+
+def test_scraper_results_and_embeddings_are_replayed(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    FakeScraper.calls = 0
+    FakeEmbeddings.calls = 0
+
+    with use_cassette(path, "record") as cassette:
+        scraped = asyncio.run(cassette.wrap_scraper(FakeScraper)("https://example.com").scrape_async())
+        embeddings = cassette.wrap_embeddings(FakeEmbeddings(), "openai:small")
+        asyncio.run(embeddings.aembed_documents(["query", "a longer document"]))
+        asyncio.run(embeddings.aembed_query("query"))
+
+    with use_cassette(path, "replay") as cassette:
+        assert asyncio.run(cassette.wrap_scraper(FakeScraper)("https://example.com").scrape_async()) == scraped
+        # Texts are replayed one by one, so a different batching still replays
+        embeddings = cassette.wrap_embeddings(None, "openai:small")
+        assert embeddings.embed_documents(["a longer document"]) == [[17.0, 0.5]]
+        # Queries are replayed apart from documents of the same text
+        assert embeddings.embed_query("query") == [5.0, 1.0]
+        assert embeddings.embed_documents(["query"]) == [[5.0, 0.5]]
+
+    assert FakeScraper.calls == 1
+    assert FakeEmbeddings.calls == 2
+
+
+def test_recorded_scrapers_get_the_pool_sizing_of_the_run(tmp_path):
+    class PooledBrowserScraper:
+        sizes = []
+
+        def __init__(self, link, session=None):
+            self.link = link
+            self.driver_pool_size = 4
+
+        def scrape(self):
+            PooledBrowserScraper.sizes.append(self.driver_pool_size)
+            return "page content " * 20, [], "Title"
+
+    with use_cassette(str(tmp_path / "run.json.gz"), "record") as cassette:
+        scraper = Scraper(["https://example.com"], "ua", "browser", WorkerPool(7))
+        scraper.get_scraper = lambda link: cassette.wrap_scraper(PooledBrowserScraper)
+        asyncio.run(scraper.run())
+
+    assert PooledBrowserScraper.sizes == [7]
+
+
+def test_recorded_scrapers_get_the_scraper_options(tmp_path):
+    class LimitedScraper:
+        limits = []
+
+        def __init__(self, link, session=None):
+            self.link = link
+            self.max_content_bytes = 10
+
+        def scrape(self):
+            LimitedScraper.limits.append(self.max_content_bytes)
+            return "page content " * 20, [], "Title"
+
+    with use_cassette(str(tmp_path / "run.json.gz"), "record") as cassette:
+        scraper = Scraper(
+            ["https://example.com"], "ua", "bs", WorkerPool(1), scraper_options={"max_content_bytes": 1000, "other": 1}
+        )
+        scraper.get_scraper = lambda link: cassette.wrap_scraper(LimitedScraper)
+        asyncio.run(scraper.run())
+
+    assert LimitedScraper.limits == [1000]
+
+
+def test_chat_responses_replay_without_building_the_model(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    messages = [{"role": "user", "content": "hello"}]
+    FakeLLM.calls = 0
+
+    build_fake = classmethod(lambda cls, provider, chat_log=None, verbose=True, **kwargs: cls(FakeLLM()))
+    with use_cassette(path, "record"), patch.object(GenericLLMProvider, "_from_provider", build_fake):
+        provider = GenericLLMProvider.from_provider("openai", model="gpt-test", temperature=0.4)
+        assert asyncio.run(provider.get_chat_response(messages, stream=False)) == "answer to hello"
+
+    with use_cassette(path, "replay"):
+        provider = GenericLLMProvider.from_provider("openai", model="gpt-test", temperature=0.4)
+        assert provider.llm is None
+        assert asyncio.run(provider.get_chat_response(messages, stream=False)) == "answer to hello"
+        assert provider.last_usage_metadata == {"input_tokens": 3}
+        with pytest.raises(CassetteMissError):
+            asyncio.run(GenericLLMProvider.from_provider("openai", model="other").get_chat_response(messages, False))
+
+    assert FakeLLM.calls == 1
+
+
+def test_extension_points_are_wrapped_only_while_a_cassette_is_active(tmp_path):
+    cfg = SimpleNamespace(retrievers="duckduckgo", retriever=None)
+    scraper = Scraper([], "test-agent", "bs", worker_pool=None)
+    assert get_cassette() is None
+    assert get_retrievers({}, cfg) == [Duckduckgo]
+
+    with use_cassette(str(tmp_path / "run.json.gz"), "record"):
+        [retriever_class] = get_retrievers({}, cfg)
+        assert retriever_class.__wrapped__ is Duckduckgo
+        assert get_retriever_name(retriever_class) == "duckduckgo"
+        assert scraper.get_scraper("https://example.com").__wrapped__ is BeautifulSoupScraper
+        assert Memory("openai", "text-embedding-3-small", openai_api_key="test").get_embeddings().model_id == (
+            "openai:text-embedding-3-small"
+        )
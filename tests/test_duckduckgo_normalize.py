@@ -3,7 +3,7 @@ import sys
 import types
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -13,20 +13,22 @@ MODULE_PATH = ROOT / "gpt_researcher" / "retrievers" / "duckduckgo" / "duckduckg
 def _load_duckduckgo_module():
     # Load the module file directly so we never import gpt_researcher package
     # (pulling json_repair and other heavy deps is unrelated to this unit).
+    # The stubs are scoped to the load so they don't leak into other tests.
     utils_mod = types.ModuleType("gpt_researcher.retrievers.utils")
     utils_mod.check_pkg = lambda *a, **k: None
     pkg = types.ModuleType("gpt_researcher")
     retrievers = types.ModuleType("gpt_researcher.retrievers")
-    sys.modules.setdefault("gpt_researcher", pkg)
-    sys.modules.setdefault("gpt_researcher.retrievers", retrievers)
-    sys.modules["gpt_researcher.retrievers.utils"] = utils_mod
+    with patch.dict(sys.modules):
+        sys.modules.setdefault("gpt_researcher", pkg)
+        sys.modules.setdefault("gpt_researcher.retrievers", retrievers)
+        sys.modules["gpt_researcher.retrievers.utils"] = utils_mod
 
-    spec = importlib.util.spec_from_file_location(
-        "gpt_researcher.retrievers.duckduckgo.duckduckgo", MODULE_PATH
-    )
-    mod = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = mod
-    spec.loader.exec_module(mod)
+        spec = importlib.util.spec_from_file_location(
+            "gpt_researcher.retrievers.duckduckgo.duckduckgo", MODULE_PATH
+        )
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = mod
+        spec.loader.exec_module(mod)
     return mod
 
 
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from gpt_researcher.actions.retriever import get_retriever, get_retriever_name
+from gpt_researcher.retrievers.localindex import localindex as localindex_module
+from gpt_researcher.retrievers.localindex.localindex import LocalIndex, LocalIndexSearch
+from gpt_researcher.skills.researcher import ResearchConductor
+
+ROBOTS = "# Warehouse robots\n\nAutonomous mobile robots move pallets in cold storage warehouses.\n" + "Robots robots. " * 20
+FINANCE = "# Expense policy\n\nMeals are reimbursed up to 50 EUR per day.\n\nHotels need approval in advance."
+HANDBOOK = "# Handbook\n\nRemote work is allowed two days per week.\n\nRobots are mentioned once."
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "ops").mkdir(parents=True)
+    (docs / "ops" / "robots.md").write_text(ROBOTS)
+    (docs / "finance.md").write_text(FINANCE)
+    (docs / "handbook.txt").write_text(HANDBOOK)
+    (docs / "image.png").write_bytes(b"\x89PNG")
+    return docs
+
+
+@pytest.fixture
+def extract_calls(monkeypatch):
+    calls = []
+    extract_text = localindex_module._extract_text
+
+    def counting_extract_text(path, extension):
+        calls.append(os.path.basename(path))
+        return extract_text(path, extension)
+
+    monkeypatch.setattr(localindex_module, "_extract_text", counting_extract_text)
+    return calls
+
+
+def test_bm25_ranks_documents_by_term_relevance(corpus, tmp_path):
+    index = LocalIndex(str(corpus), str(tmp_path / "index.json"))
+    index.refresh()
+
+    ranked = [path for path, _ in index.search("cold storage robots", max_results=5)]
+
+    assert ranked == [os.path.join("ops", "robots.md"), "handbook.txt"]
+    assert index.search("nothing matches this", max_results=5) == []
+
+
+def test_refresh_only_reindexes_changed_files(corpus, tmp_path, extract_calls):
+    index_path = str(tmp_path / "index.json")
+    assert LocalIndex(str(corpus), index_path).refresh() == {"added": 3, "updated": 0, "removed": 0}
+
+    (corpus / "finance.md").write_text(FINANCE + "\n\nTaxis are reimbursed.")
+    os.remove(corpus / "handbook.txt")
+    extract_calls.clear()
+
+    # A new instance starts from the persisted index, as after a restart
+    index = LocalIndex(str(corpus), index_path)
+    assert index.refresh() == {"added": 0, "updated": 1, "removed": 1}
+    assert extract_calls == ["finance.md"]
+    assert [path for path, _ in index.search("taxis", max_results=5)] == ["finance.md"]
+
+
+def test_retriever_returns_prefetched_content(corpus, tmp_path, monkeypatch):
+    monkeypatch.setenv("LOCAL_INDEX_PATH", str(corpus))
+    monkeypatch.setenv("LOCAL_INDEX_STORE", str(tmp_path / "store.json"))
+
+    results = LocalIndexSearch("meals reimbursed").search(max_results=1)
+
+    assert results == [{
+        "title": "Expense policy",
+        "href": (corpus / "finance.md").as_uri(),
+        "body": "Meals are reimbursed up to 50 EUR per day.",
+        "raw_content": FINANCE,
+    }]
+    urls, prefetched = ResearchConductor._split_search_results(LocalIndexSearch("robots").search())
+    assert urls == [(corpus / "handbook.txt").as_uri()]
+    assert prefetched == [{"url": (corpus / "ops" / "robots.md").as_uri(), "raw_content": ROBOTS}]
+
+
+def test_retriever_is_registered():
+    assert get_retriever("localindex") is LocalIndexSearch
+    assert get_retriever_name(LocalIndexSearch) == "localindex"
@@ -0,0 +1,83 @@
+import warnings
+from pathlib import Path
+
+import pytest
+
+from gpt_researcher.actions.web_scraping import scraper_options
+from gpt_researcher.config import Config
+from gpt_researcher.scraper.beautiful_soup.beautiful_soup import BeautifulSoupScraper
+from gpt_researcher.scraper.utils import apply_scraper_options, extract_page
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures" / "html").glob("*.html"))
+URL = "https://example.com/blog/post"
+
+
+@pytest.fixture(autouse=True)
+def _quiet_bs4():
+    # edge_cases.html starts with an XML declaration, which bs4 warns about
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def _both(markup, declared_encoding=None):
+    return (
+        extract_page(markup, URL, declared_encoding, engine="bs4"),
+        extract_page(markup, URL, declared_encoding, engine="lxml"),
+    )
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.name)
+@pytest.mark.parametrize("declared_encoding", [None, "utf-8", "iso-8859-1", "no-such-charset"])
+def test_lxml_engine_matches_bs4_on_bytes(path, declared_encoding):
+    bs4_result, lxml_result = _both(path.read_bytes(), declared_encoding)
+    assert lxml_result == bs4_result
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.name)
+def test_lxml_engine_matches_bs4_on_decoded_and_utf16_pages(path):
+    page = path.read_bytes().decode("utf-8", "replace")
+    for markup in (page, "\N{BYTE ORDER MARK}" + page, page.encode("utf-16")):
+        bs4_result, lxml_result = _both(markup)
+        assert lxml_result == bs4_result
+
+
+@pytest.mark.parametrize("markup", [b"", b"   ", b"<!-- only a comment -->", ""])
+def test_lxml_engine_handles_empty_documents(markup):
+    bs4_result, lxml_result = _both(markup)
+    assert lxml_result == bs4_result == ("", [], "")
+
+
+def test_lxml_engine_extracts_the_article():
+    text, image_urls, title = extract_page(
+        (Path(__file__).parent / "fixtures" / "html" / "article.html").read_bytes(), URL, engine="lxml"
+    )
+
+    assert title == "How Solid-State Batteries Work & Why They Matter"
+    assert "A solid-state battery replaces that liquid" in text
+    assert "Trailing" not in text
+    for dropped in ("Subscribe", "Most read", "All rights reserved", "dataLayer", "renderAd", "Share"):
+        assert dropped not in text
+    assert image_urls[0] == {"url": "https://cdn.example.com/img/solid-state-cell.jpg", "score": 4}
+    assert {"url": "https://example.com/uploads/2024/03/diagram.png", "score": 3} in image_urls
+    assert not any(image["url"].endswith(("inline-icon.png", "grid.jpg")) for image in image_urls)
+
+
+def test_scraper_uses_the_configured_engine(monkeypatch):
+    page = b"<html><head><title>T</title></head><body><nav>menu</nav><p>Body</p></body></html>"
+    monkeypatch.setenv("SCRAPER_EXTRACTION_ENGINE", "lxml")
+    scraper = BeautifulSoupScraper(URL)
+    apply_scraper_options(scraper, scraper_options(Config()))
+    calls = []
+    monkeypatch.setattr(
+        "gpt_researcher.scraper.lxml_extract.extract_page_lxml",
+        lambda *args: calls.append(args) or ("Body", [], "T"),
+    )
+
+    assert scraper._parse(page, "utf-8") == ("Body", [], "T")
+    assert calls == [(page, URL, "utf-8")]
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="extraction engine"):
+        extract_page(b"<p>x</p>", URL, engine="regex")
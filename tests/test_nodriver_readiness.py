@@ -0,0 +1,83 @@
+import pytest
+
+from gpt_researcher.actions.web_scraping import scraper_options
+from gpt_researcher.config import Config
+from gpt_researcher.scraper.browser.nodriver_scraper import NoDriverScraper, blocked_url_patterns
+from gpt_researcher.scraper.utils import apply_scraper_options
+
+
+class FakePage:
+    """Page whose DOM snapshot changes a given number of times before it settles."""
+
+    def __init__(self, changes, fail_first=0):
+        self.changes = changes
+        self.fail_first = fail_first
+        self.evaluations = 0
+
+    async def evaluate(self, script):
+        self.evaluations += 1
+        if self.evaluations <= self.fail_first:
+            raise RuntimeError("Cannot find context with specified id")
+        if self.evaluations <= self.changes:
+            return f"interactive:{self.evaluations}:0"
+        return "complete:100:5000"
+
+
+@pytest.mark.asyncio
+async def test_waits_until_the_dom_stops_changing():
+    browser = NoDriverScraper.Browser(driver=None)
+    page = FakePage(changes=4, fail_first=2)
+
+    settled = await browser.wait_until_stable(page, timeout=2, quiet=0.05, interval=0.01)
+
+    assert 0.03 <= settled < 0.5
+    assert page.evaluations >= 9
+
+
+@pytest.mark.asyncio
+async def test_gives_up_at_the_timeout():
+    browser = NoDriverScraper.Browser(driver=None)
+
+    assert await browser.wait_until_stable(FakePage(changes=10**6), timeout=0.1, interval=0.01) == 0.1
+
+
+def test_wait_times_are_learned_per_domain(monkeypatch):
+    monkeypatch.setattr(NoDriverScraper, "settle_times", {})
+
+    assert NoDriverScraper.settle_timeout("https://news.example.com/a") == NoDriverScraper.max_settle_timeout
+    NoDriverScraper.record_settle_time("https://news.example.com/a", 1.0)
+    NoDriverScraper.record_settle_time("https://www.example.com/b", 2.0)
+    NoDriverScraper.record_settle_time("https://fast.example.org/", 0.1)
+
+    assert NoDriverScraper.settle_timeout("https://example.com/c") == pytest.approx(2 * 1.3)
+    assert NoDriverScraper.settle_timeout("https://fast.example.org/") == NoDriverScraper.min_settle_timeout
+
+
+class FakeDriver:
+    def __init__(self):
+        self.targets = []
+
+    async def get(self, url, **kwargs):
+        self.targets.append(url)
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_resource_blocking_can_be_turned_off_in_the_config(monkeypatch):
+    monkeypatch.setenv("SCRAPER_NODRIVER_BLOCK_RESOURCES", "false")
+    scraper = NoDriverScraper("https://example.com/a")
+    apply_scraper_options(scraper, scraper_options(Config()))
+    driver = FakeDriver()
+
+    await NoDriverScraper.Browser(driver).get(scraper.url, scraper.block_resources)
+
+    assert scraper.block_resources is False
+    assert driver.targets == ["https://example.com/a"]
+
+
+def test_blocked_hosts_match_with_and_without_a_subdomain():
+    patterns = blocked_url_patterns()
+
+    assert "*://hotjar.com/*" in patterns
+    assert "*://*.hotjar.com/*" in patterns
+    assert "*://connect.facebook.net/*" in patterns
@@ -0,0 +1,206 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils import http_client
+from gpt_researcher.utils.http_client import PooledAsyncClient
+from gpt_researcher.utils.page_cache import PageCache, get_page_cache
+from gpt_researcher.utils.workers import WorkerPool
+
+CONTENT = "Cached page content. " * 20
+
+
+def _blob_count(db_path):
+    with sqlite3.connect(db_path) as db:
+        return db.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+
+def test_round_trip_is_shared_through_the_database(tmp_path):
+    db_path = str(tmp_path / "pages.sqlite")
+    PageCache(db_path=db_path).set(
+        "https://www.example.com/a?utm_source=x", "bs", CONTENT, [{"url": "https://example.com/i.png", "score": 2}],
+        "Title", etag='"v1"', last_modified="Wed, 01 May 2024 00:00:00 GMT",
+    )
+
+    # Another instance (as in another process) sees the entry under the canonical URL
+    entry = PageCache(db_path=db_path).get("http://example.com/a", "bs")
+
+    assert entry == {
+        "content": CONTENT,
+        "image_urls": [{"url": "https://example.com/i.png", "score": 2}],
+        "title": "Title",
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 May 2024 00:00:00 GMT",
+        "fresh": True,
+    }
+    assert PageCache(db_path=db_path).get("https://example.com/a", "browser") is None
+
+
+def test_identical_pages_share_one_compressed_blob(tmp_path):
+    db_path = str(tmp_path / "pages.sqlite")
+    cache = PageCache(db_path=db_path)
+    cache.set("https://mirror-one.example/doc", "bs", CONTENT, [], "Doc")
+    cache.set("https://mirror-two.example/doc", "bs", CONTENT, [], "Doc")
+
+    assert _blob_count(db_path) == 1
+    assert cache.stats()["pages"] == 2
+    assert cache.stats()["bytes"] < len(CONTENT)
+
+
+def test_entries_go_stale_after_the_ttl_and_refresh_restarts_it():
+    cache = PageCache(ttl=60)
+    cache.set("https://example.com/a", "bs", CONTENT, [], "", etag='"v1"')
+    cache.refresh("https://example.com/b", "bs")  # unknown pages are ignored
+    cache._db.execute("UPDATE pages SET expires_at = ?", (time.time() - 1,))
+
+    assert cache.get("https://example.com/a", "bs")["fresh"] is False
+    cache.refresh("https://example.com/a", "bs", etag='"v2"')
+    entry = cache.get("https://example.com/a", "bs")
+    assert entry["fresh"] is True
+    assert entry["etag"] == '"v2"'
+
+
+def test_evicts_least_recently_used_pages_beyond_the_size_bound():
+    cache = PageCache(max_bytes=0)
+    pages = {f"https://example.com/{i}": f"Page {i} " + "x" * 2000 for i in range(3)}
+    for url, content in pages.items():
+        cache.set(url, "bs", content, [], "")
+        time.sleep(0.01)
+    cache.get("https://example.com/0", "bs")
+    sizes = [row[0] for row in cache._db.execute("SELECT size FROM blobs")]
+
+    cache.max_bytes = sum(sizes) - 1
+    cache.set("https://example.com/3", "bs", "Page 3 " + "y" * 2000, [], "")
+
+    assert cache.get("https://example.com/1", "bs") is None
+    assert cache.get("https://example.com/0", "bs") is not None
+    assert cache.get("https://example.com/3", "bs") is not None
+
+
+def test_hits_write_access_times_in_batches(tmp_path):
+    db_path = str(tmp_path / "pages.sqlite")
+    cache = PageCache(db_path=db_path)
+    cache.touch_batch = 3
+    for i in range(3):
+        cache.set(f"https://example.com/{i}", "bs", CONTENT + str(i), [], "")
+
+    def accessed_at():
+        with sqlite3.connect(db_path) as db:
+            return dict(db.execute("SELECT url, accessed_at FROM pages"))
+
+    before = accessed_at()
+    time.sleep(0.01)
+    cache.get("https://example.com/0", "bs")
+    cache.get("https://example.com/1", "bs")
+    assert accessed_at() == before
+
+    cache.get("https://example.com/2", "bs")
+    after = accessed_at()
+    assert all(after[url] > before[url] for url in before)
+
+
+def test_get_page_cache_is_shared_and_can_be_disabled():
+    assert get_page_cache(SimpleNamespace(page_cache="none")) is None
+    assert get_page_cache(SimpleNamespace(page_cache="bogus")) is None
+    cfg = SimpleNamespace(page_cache="memory", page_cache_ttl=60, page_cache_max_mb=1)
+    assert get_page_cache(cfg) is get_page_cache(cfg)
+
+
+class _CountingScraper:
+    calls = []
+
+    def __init__(self, link, session=None):
+        self.link = link
+        self.validators = ('"v1"', None)
+
+    def scrape(self):
+        self.calls.append(self.link)
+        return CONTENT, [], "Scraped"
+
+
+class _ThreadRecordingCache(PageCache):
+    """Notes the threads SQLite is used from; none may be the event loop's."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def get(self, *args):
+        self.threads.add(threading.current_thread())
+        return super().get(*args)
+
+    def set(self, *args):
+        self.threads.add(threading.current_thread())
+        return super().set(*args)
+
+    def refresh(self, *args):
+        self.threads.add(threading.current_thread())
+        return super().refresh(*args)
+
+
+def _scraper(cache, stats):
+    scraper = Scraper(["https://example.com/page"], "ua", "bs", WorkerPool(2), page_cache=cache, cache_stats=stats)
+    scraper.get_scraper = lambda link: _CountingScraper
+    return scraper
+
+
+@pytest.fixture
+def conditional_server():
+    requests_seen = []
+
+    def install(status):
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(status, text="" if status == 304 else "<p>changed</p>")
+
+        pooled = PooledAsyncClient()
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_client._clients[asyncio.get_running_loop()] = pooled
+
+    yield install, requests_seen
+    _CountingScraper.calls = []
+
+
+@pytest.mark.asyncio
+async def test_scraper_answers_fresh_and_revalidated_pages_from_the_cache(conditional_server):
+    install, requests_seen = conditional_server
+    install(304)
+    cache = _ThreadRecordingCache(ttl=60)
+    stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    first = await _scraper(cache, stats).run()
+    second = await _scraper(cache, stats).run()
+    cache._db.execute("UPDATE pages SET expires_at = 0")
+    third = await _scraper(cache, stats).run()
+    await http_client.close_async_http_client()
+
+    assert first == second == third
+    assert first[0]["raw_content"] == CONTENT
+    assert cache.threads and threading.main_thread() not in cache.threads
+    assert _CountingScraper.calls == ["https://example.com/page"]
+    assert stats == {"hits": 1, "revalidated": 1, "misses": 1}
+    assert requests_seen[0].headers["If-None-Match"] == '"v1"'
+    assert cache.get("https://example.com/page", "bs")["fresh"] is True
+
+
+@pytest.mark.asyncio
+async def test_changed_pages_are_scraped_again(conditional_server):
+    install, _ = conditional_server
+    install(200)
+    cache = PageCache(ttl=60)
+    stats = {}
+    await _scraper(cache, stats).run()
+    cache._db.execute("UPDATE pages SET expires_at = 0")
+
+    results = await _scraper(cache, stats).run()
+    await http_client.close_async_http_client()
+
+    assert results[0]["raw_content"] == CONTENT
+    assert len(_CountingScraper.calls) == 2
+    assert stats == {"misses": 2}
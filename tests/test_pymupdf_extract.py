@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from gpt_researcher.scraper.pymupdf import pymupdf as pymupdf_scraper
+from gpt_researcher.scraper.pymupdf.pymupdf import PyMuPDFScraper, extract_pdf, extract_pdf_pages
+
+pymupdf = pytest.importorskip("pymupdf")
+
+
+def _pdf(pages, title="Scholarly PDF"):
+    doc = pymupdf.open()
+    for number in range(pages):
+        doc.new_page().insert_text((72, 72), f"Text of page {number}")
+    doc.set_metadata({"title": title})
+    return doc.tobytes()
+
+
+class _Response:
+    headers = {"Content-Type": "application/pdf"}
+
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        return None
+
+    def close(self):
+        return None
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def test_scrape_reads_the_download_in_memory(tmp_path):
+    body = _pdf(3)
+    with patch.object(pymupdf_scraper.requests, "get", return_value=_Response(body)), patch(
+        "tempfile.NamedTemporaryFile", side_effect=AssertionError("no temp files")
+    ):
+        content, images, title = PyMuPDFScraper("https://example.com/paper").scrape()
+
+    assert content == "Text of page 0\nText of page 1\nText of page 2"
+    assert (images, title) == ([], "Scholarly PDF")
+
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(body)
+    assert PyMuPDFScraper(str(path)).scrape() == (content, images, title)
+
+
+def test_page_and_character_caps():
+    body = _pdf(10)
+
+    content, _, _ = extract_pdf(body, max_pages=2)
+    assert content == "Text of page 0\nText of page 1"
+
+    content, _, _ = extract_pdf(body, max_chars=20)
+    assert content == "Text of page 0\nText "
+    assert extract_pdf_pages(body, 0, 10, max_chars=20) == ["Text of page 0", "Text of page 1"]
+
+
+def test_scraper_applies_the_configured_caps(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(_pdf(3))
+    scraper = PyMuPDFScraper(str(path))
+    scraper.pdf_max_pages = 2
+
+    assert scraper.scrape()[0] == "Text of page 0\nText of page 1"
+
+
+def test_long_pdfs_are_split_across_the_executor(monkeypatch):
+    body = _pdf(18)
+    calls = []
+
+    def record(*args):
+        calls.append(args[1:3])
+        return extract_pdf_pages(*args)
+
+    monkeypatch.setattr(pymupdf_scraper, "extract_pdf_pages", record)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = extract_pdf(body, executor, workers=3, parallel_pages=4)
+
+    assert calls == [(0, 6), (6, 12), (12, 18)]
+    assert parallel == extract_pdf(body)
+    assert parallel[0].endswith("Text of page 17")
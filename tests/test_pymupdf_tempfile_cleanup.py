@@ -6,20 +6,28 @@ When scraping a remote PDF, the scraper downloads it to a
 success path, so a parse failure (malformed/partial PDF -> ``PyMuPDFLoader.load``
 raises) left the temp file behind on disk every time. The exception is then
 swallowed by the broad ``except``, so the leak was silent.
+
+Downloads are now opened from memory, so a corrupt PDF must still yield the
+empty result without leaving any temp file behind.
 """
 
 import os
 import glob
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from gpt_researcher.scraper.pymupdf.pymupdf import PyMuPDFScraper
 
 
 class _FakeResponse:
+    headers = {}
+
     def raise_for_status(self):
         return None
 
+    def close(self):
+        return None
+
     def iter_content(self, chunk_size=8192):
         yield b"%PDF-1.4 not-a-real-pdf"
 
@@ -36,11 +44,7 @@ def test_tempfile_removed_when_loader_raises():
     with patch(
         "gpt_researcher.scraper.pymupdf.pymupdf.requests.get",
         return_value=_FakeResponse(),
-    ), patch(
-        "gpt_researcher.scraper.pymupdf.pymupdf.PyMuPDFLoader"
-    ) as mock_loader:
-        mock_loader.return_value.load.side_effect = RuntimeError("corrupt PDF")
-
+    ):
         content, images, title = scraper.scrape()
 
     # Broad except still yields the empty-result contract...
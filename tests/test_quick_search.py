@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch, AsyncMock
 import asyncio
 from gpt_researcher.agent import GPTResearcher
+from gpt_researcher.utils.retriever_health import RetrieverUnavailableError
 import os
 
 class TestQuickSearch(unittest.TestCase):
@@ -105,6 +106,23 @@ class TestQuickSearch(unittest.TestCase):
         self.assertEqual(mock_search.await_count, 1)
         self.assertEqual(len(results), 1)
 
+    @patch('gpt_researcher.agent.get_search_results', new_callable=AsyncMock)
+    @patch('langchain_openai.OpenAIEmbeddings')
+    def test_quick_search_falls_back_when_the_primary_circuit_is_open(self, mock_embeddings, mock_search):
+        mock_search.side_effect = [
+            RetrieverUnavailableError("R1 circuit is open, skipping search"),
+            [{'title': 'B', 'body': 'b', 'href': 'http://b.com'}],
+        ]
+
+        researcher = GPTResearcher(query="test query")
+        researcher.retrievers = [MagicMock(__name__='R1'), MagicMock(__name__='R2')]
+
+        results = asyncio.run(researcher.quick_search("test query"))
+
+        self.assertEqual(results, [{'title': 'B', 'body': 'b', 'href': 'http://b.com'}])
+        mock_search.side_effect = RetrieverUnavailableError("circuit is open")
+        self.assertEqual(asyncio.run(researcher.quick_search("test query")), [])
+
 
 if __name__ == '__main__':
     unittest.main()
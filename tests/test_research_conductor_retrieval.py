@@ -1,7 +1,11 @@
+import asyncio
+import time
 import unittest
 from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils.retriever_health import RetrieverHealthRegistry
 
 
 class FakeSnippetRetriever:
@@ -37,20 +41,88 @@ class FakeFullContentRetriever:
         ]
 
 
+def make_slow_retriever(name, delay, url_count=1):
+    class FakeSlowRetriever:
+        def __init__(self, query, query_domains=None):
+            self.query = query
+
+        def search(self, max_results=10):
+            time.sleep(delay)
+            return [
+                {"href": f"https://{name}.example.com/{i}", "body": "snippet"}
+                for i in range(url_count)
+            ]
+
+    FakeSlowRetriever.__name__ = f"{name.capitalize()}Search"
+    return FakeSlowRetriever
+
+
+class CountingRetriever:
+    calls = []
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        CountingRetriever.calls.append(self.query)
+        return [
+            {"href": f"https://example.com/{self.query}/{i}", "body": "snippet"}
+            for i in range(2)
+        ]
+
+
+class FakeEmbeddings:
+    async def aembed_documents(self, texts):
+        return [[float("rust" in t.lower()), float("python" in t.lower())] for t in texts]
+
+    async def aembed_query(self, text):
+        return (await self.aembed_documents([text]))[0]
+
+
+class FakeMixedSnippetRetriever:
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=10):
+        return [
+            {"href": "https://example.com/rust", "body": "Rust async runtimes compared"},
+            {"href": "https://example.com/python", "body": "Python packaging tips"},
+        ]
+
+
+class FakeScraperManager:
+    def __init__(self):
+        self.scraped = []
+
+    async def browse_urls(self, urls):
+        self.scraped.append(list(urls))
+        return [{"url": url, "raw_content": "page"} for url in urls]
+
+
 class ResearchConductorRetrievalTests(unittest.IsolatedAsyncioTestCase):
-    def make_researcher(self, retriever_class):
+    def make_researcher(self, *retriever_classes, **cfg):
         class FakeResearcher:
             def __init__(self):
-                self.retrievers = [retriever_class]
-                self.cfg = SimpleNamespace(max_search_results_per_query=5)
+                self.retrievers = list(retriever_classes)
+                self.cfg = SimpleNamespace(max_search_results_per_query=5, **cfg)
                 self.verbose = False
                 self.websocket = None
                 self.visited_urls = set()
                 self.research_sources = []
+                self.role = None
+                self.parent_query = ""
+                self.report_type = "research_report"
+                self.kwargs = {}
+                self.vector_store = None
+                self.scraper_manager = FakeScraperManager()
+                self.memory = SimpleNamespace(get_embeddings=lambda: FakeEmbeddings())
 
             def add_research_sources(self, sources):
                 self.research_sources.extend(sources)
 
+            def add_costs(self, cost):
+                pass
+
         return FakeResearcher()
 
     async def test_snippet_only_results_are_sent_to_scraper(self):
@@ -77,6 +149,258 @@ class ResearchConductorRetrievalTests(unittest.IsolatedAsyncioTestCase):
             [{"url": "https://example.com/full", "raw_content": "C" * 500}],
         )
 
+    async def test_prefetched_results_are_counted_per_retriever(self):
+        researcher = self.make_researcher(FakeFullContentRetriever, FakeSnippetRetriever)
+        researcher.prefetch_stats = {}
+        conductor = ResearchConductor(researcher)
+
+        await conductor._search_relevant_source_urls("query")
+
+        self.assertEqual(
+            researcher.prefetch_stats,
+            {
+                "FakeFullContentRetriever": {"results": 1, "prefetched": 1},
+                "FakeSnippetRetriever": {"results": 2, "prefetched": 0},
+            },
+        )
+
+    async def test_retrievers_run_concurrently(self):
+        researcher = self.make_researcher(
+            make_slow_retriever("alpha", 0.3),
+            make_slow_retriever("beta", 0.3),
+            make_slow_retriever("gamma", 0.3),
+        )
+        conductor = ResearchConductor(researcher)
+
+        started = time.monotonic()
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(len(urls), 3)
+
+    async def test_retriever_past_deadline_is_dropped(self):
+        researcher = self.make_researcher(
+            make_slow_retriever("fast", 0.0),
+            make_slow_retriever("slow", 1.0),
+            retriever_timeout=0,
+            retriever_timeouts={"SlowSearch": 0.1},
+        )
+        conductor = ResearchConductor(researcher)
+
+        started = time.monotonic()
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(urls, ["https://fast.example.com/0"])
+
+    async def test_first_n_results_stops_waiting_for_stragglers(self):
+        researcher = self.make_researcher(
+            make_slow_retriever("fast", 0.0, url_count=3),
+            make_slow_retriever("slow", 1.0),
+            retriever_first_n_results=3,
+        )
+        conductor = ResearchConductor(researcher)
+
+        started = time.monotonic()
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertCountEqual(
+            urls, [f"https://fast.example.com/{i}" for i in range(3)]
+        )
+
+    async def test_stragglers_cut_off_by_first_n_results_keep_a_closed_circuit(self):
+        researcher = self.make_researcher(
+            make_slow_retriever("fast", 0.0, url_count=3),
+            make_slow_retriever("slow", 0.3),
+            retriever_first_n_results=3,
+        )
+        researcher.retriever_health = RetrieverHealthRegistry(failure_threshold=2, cooldown=60)
+        conductor = ResearchConductor(researcher)
+
+        for query in ("first query", "second query", "third query"):
+            await conductor._search_relevant_source_urls(query)
+
+        slow_health = researcher.retriever_health.snapshot()["SlowSearch"]
+        self.assertEqual(slow_health["state"], "closed")
+        self.assertEqual(slow_health["error_rate"], 0.0)
+
+    async def test_failing_retriever_does_not_drop_others(self):
+        class BrokenRetriever:
+            def __init__(self, query, query_domains=None):
+                raise ValueError("missing API key")
+
+        researcher = self.make_researcher(BrokenRetriever, FakeSnippetRetriever)
+        conductor = ResearchConductor(researcher)
+
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertCountEqual(
+            urls,
+            ["https://example.com/one", "https://example.com/two"],
+        )
+
+    async def test_planning_search_is_reused_for_original_query(self):
+        CountingRetriever.calls = []
+        researcher = self.make_researcher(CountingRetriever)
+        conductor = ResearchConductor(researcher)
+
+        with patch(
+            "gpt_researcher.skills.researcher.plan_research_outline",
+            AsyncMock(return_value=["sub query"]),
+        ):
+            await conductor.plan_research("topic")
+        urls, _ = await conductor._search_relevant_source_urls("topic")
+
+        self.assertEqual(CountingRetriever.calls, ["topic"])
+        self.assertCountEqual(
+            urls, ["https://example.com/topic/0", "https://example.com/topic/1"]
+        )
+
+    async def test_planning_skips_a_retriever_with_an_open_circuit(self):
+        CountingRetriever.calls = []
+        researcher = self.make_researcher(make_slow_retriever("slow", 0.0), CountingRetriever)
+        researcher.retriever_health = RetrieverHealthRegistry(failure_threshold=1, cooldown=60)
+        researcher.retriever_health.record_failure("SlowSearch", 1.0)
+        conductor = ResearchConductor(researcher)
+        outline = AsyncMock(return_value=["sub query"])
+
+        with patch("gpt_researcher.skills.researcher.plan_research_outline", outline):
+            self.assertEqual(await conductor.plan_research("topic"), ["sub query"])
+
+            self.assertEqual(CountingRetriever.calls, ["topic"])
+            self.assertEqual(len(outline.call_args.kwargs["search_results"]), 2)
+
+            researcher.retriever_health.record_failure("CountingRetriever", 1.0)
+            await conductor.plan_research("other topic")
+            self.assertEqual(outline.call_args.kwargs["search_results"], [])
+
+    async def test_planning_urls_are_scraped_speculatively(self):
+        CountingRetriever.calls = []
+        researcher = self.make_researcher(CountingRetriever)
+        conductor = ResearchConductor(researcher)
+
+        async def slow_outline(**kwargs):
+            # The planning URLs are being scraped while the outline is generated
+            await asyncio.sleep(0)
+            self.assertEqual(len(researcher.scraper_manager.scraped), 1)
+            return ["sub query"]
+
+        with patch("gpt_researcher.skills.researcher.plan_research_outline", slow_outline):
+            await conductor.plan_research("topic", speculative_scrape=True)
+        scraped = await conductor._scrape_data_by_urls("topic")
+
+        self.assertEqual(CountingRetriever.calls, ["topic"])
+        # Only the speculative scrape fetched the pages; the sub-query reused it
+        self.assertEqual(
+            researcher.scraper_manager.scraped,
+            [["https://example.com/topic/0", "https://example.com/topic/1"], []],
+        )
+        self.assertCountEqual(
+            [item["url"] for item in scraped],
+            ["https://example.com/topic/0", "https://example.com/topic/1"],
+        )
+
+    async def test_speculative_scrape_keeps_to_the_scrape_budget(self):
+        CountingRetriever.calls = []
+        researcher = self.make_researcher(CountingRetriever, scrape_budget_per_query=1)
+        conductor = ResearchConductor(researcher)
+
+        with patch("gpt_researcher.skills.researcher.plan_research_outline", AsyncMock(return_value=[])):
+            await conductor.plan_research("topic", speculative_scrape=True)
+        await conductor._collect_speculative_scrape("topic", None)
+
+        self.assertEqual(researcher.scraper_manager.scraped, [["https://example.com/topic/0"]])
+        self.assertEqual(researcher.visited_urls, {"https://example.com/topic/0"})
+
+    async def test_speculative_scrape_skips_unrelated_urls(self):
+        researcher = self.make_researcher(FakeMixedSnippetRetriever, snippet_similarity_threshold=0.5)
+        conductor = ResearchConductor(researcher)
+
+        with patch("gpt_researcher.skills.researcher.plan_research_outline", AsyncMock(return_value=[])), \
+                patch("gpt_researcher.skills.researcher.estimate_embedding_cost", return_value=0.0):
+            await conductor.plan_research("rust runtimes", speculative_scrape=True)
+        await conductor._collect_speculative_scrape("rust runtimes", None)
+
+        self.assertEqual(researcher.scraper_manager.scraped, [["https://example.com/rust"]])
+
+    async def test_scrape_budget_keeps_top_ranked_urls_unvisited_rest(self):
+        researcher = self.make_researcher(
+            make_slow_retriever("alpha", 0.0, url_count=4),
+            make_slow_retriever("beta", 0.0, url_count=4),
+            scrape_budget_per_query=3,
+        )
+        conductor = ResearchConductor(researcher)
+
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        # Rank fusion interleaves the retrievers' results by rank
+        self.assertEqual(
+            urls,
+            ["https://alpha.example.com/0", "https://beta.example.com/0", "https://alpha.example.com/1"],
+        )
+        self.assertEqual(researcher.visited_urls, set(urls))
+
+        urls, _ = await conductor._search_relevant_source_urls("query")
+        self.assertEqual(
+            urls,
+            ["https://beta.example.com/1", "https://alpha.example.com/2", "https://beta.example.com/2"],
+        )
+
+    async def test_snippet_filter_skips_unrelated_urls(self):
+        researcher = self.make_researcher(FakeMixedSnippetRetriever, snippet_similarity_threshold=0.5)
+        conductor = ResearchConductor(researcher)
+
+        with patch("gpt_researcher.skills.researcher.estimate_embedding_cost", return_value=0.0):
+            urls, _ = await conductor._search_relevant_source_urls("rust runtimes")
+
+        self.assertEqual(urls, ["https://example.com/rust"])
+        # Filtered URLs stay unvisited for other sub-queries
+        self.assertNotIn("https://example.com/python", researcher.visited_urls)
+
+    async def test_sub_queries_paraphrasing_the_query_are_merged(self):
+        researcher = self.make_researcher(sub_query_similarity_threshold=0.9)
+        conductor = ResearchConductor(researcher)
+
+        with patch("gpt_researcher.skills.researcher.estimate_embedding_cost", return_value=0.0):
+            sub_queries = await conductor._deduplicate_sub_queries(
+                ["python packaging", "rust async", "rust concurrency", "rust runtimes"],
+                original_query="rust runtimes",
+            )
+
+        # The original query represents its paraphrases and stays last
+        self.assertEqual(sub_queries, ["python packaging", "rust runtimes"])
+
+    async def test_open_circuit_skips_retriever_without_waiting(self):
+        slow = make_slow_retriever("slow", 0.5)
+        fast = make_slow_retriever("fast", 0.0)
+        researcher = self.make_researcher(slow, fast)
+        researcher.retriever_health = RetrieverHealthRegistry(failure_threshold=1, cooldown=60)
+        researcher.retriever_health.record_failure("SlowSearch", 10.0)
+        conductor = ResearchConductor(researcher)
+
+        start = time.perf_counter()
+        urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertEqual(urls, ["https://fast.example.com/0"])
+        self.assertLess(time.perf_counter() - start, 0.4)
+
+    async def test_slow_primary_is_hedged_with_backup(self):
+        slow = make_slow_retriever("slow", 0.5)
+        backup = make_slow_retriever("backup", 0.0)
+        researcher = self.make_researcher(slow, retriever_hedge_backups={"SlowSearch": "backup"})
+        researcher.retriever_health = RetrieverHealthRegistry()
+        for _ in range(10):
+            researcher.retriever_health.record_success("SlowSearch", 0.05)
+        conductor = ResearchConductor(researcher)
+
+        start = time.perf_counter()
+        with patch("gpt_researcher.skills.researcher.get_retriever", return_value=backup):
+            urls, _ = await conductor._search_relevant_source_urls("query")
+
+        self.assertEqual(urls, ["https://backup.example.com/0"])
+        self.assertLess(time.perf_counter() - start, 0.4)
+
 
 if __name__ == "__main__":
     unittest.main()
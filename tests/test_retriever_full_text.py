@@ -0,0 +1,116 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from gpt_researcher.retrievers.crw.crw import CRWRetriever
+from gpt_researcher.retrievers.exa.exa import ExaSearch
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+from gpt_researcher.retrievers.utils import full_text_enabled, make_snippet
+
+PAGE = "Full page text about async runtimes. " * 20
+
+
+def make_response(json_data):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = json_data
+    return response
+
+
+def make_exa_searcher():
+    searcher = ExaSearch.__new__(ExaSearch)
+    searcher.query = "q"
+    searcher.query_domains = None
+    searcher.client = MagicMock()
+    result = SimpleNamespace(url="https://example.com/a", text=PAGE, summary=None)
+    searcher.client.search.return_value = SimpleNamespace(results=[result])
+    searcher.client.search_and_contents.return_value = SimpleNamespace(results=[result])
+    return searcher
+
+
+class FullTextModeTests(unittest.TestCase):
+    def test_full_text_enabled_reads_environment(self):
+        for value, expected in [("true", True), ("1", True), ("false", False), ("", False)]:
+            with patch.dict("os.environ", {"RETRIEVER_FULL_TEXT": value}):
+                self.assertEqual(full_text_enabled(), expected)
+
+    def test_make_snippet_cuts_at_word_boundary(self):
+        self.assertEqual(make_snippet("short  text"), "short text")
+        snippet = make_snippet(PAGE, max_length=50)
+        self.assertLessEqual(len(snippet), 53)
+        self.assertTrue(snippet.endswith("..."))
+        self.assertTrue(PAGE.startswith(snippet[:-3]))
+
+    @patch("gpt_researcher.retrievers.tavily.tavily_search.requests.post")
+    def test_tavily_requests_and_keeps_raw_content(self, mock_post):
+        mock_post.return_value = make_response(
+            {"results": [{"url": "https://example.com/a", "content": "snippet", "raw_content": PAGE}]}
+        )
+
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "k", "RETRIEVER_FULL_TEXT": "true"}):
+            results = TavilySearch("async runtimes").search()
+
+        self.assertTrue(json.loads(mock_post.call_args.kwargs["data"])["include_raw_content"])
+        self.assertEqual(results, [{"href": "https://example.com/a", "body": "snippet", "raw_content": PAGE}])
+
+    @patch("gpt_researcher.retrievers.tavily.tavily_search.requests.post")
+    def test_tavily_default_mode_is_unchanged(self, mock_post):
+        mock_post.return_value = make_response(
+            {"results": [{"url": "https://example.com/a", "content": "snippet"}]}
+        )
+
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "k", "RETRIEVER_FULL_TEXT": ""}):
+            results = TavilySearch("async runtimes").search()
+
+        self.assertFalse(json.loads(mock_post.call_args.kwargs["data"])["include_raw_content"])
+        self.assertEqual(results, [{"href": "https://example.com/a", "body": "snippet"}])
+
+    @patch("gpt_researcher.retrievers.crw.crw.requests.post")
+    def test_crw_scrapes_results_in_full_text_mode(self, mock_post):
+        mock_post.return_value = make_response(
+            {
+                "success": True,
+                "data": [
+                    {"url": "https://example.com/a", "description": "desc", "markdown": PAGE},
+                    {"url": "https://example.com/b", "description": "not scraped"},
+                ],
+            }
+        )
+
+        with patch.dict("os.environ", {"CRW_API_KEY": "k", "RETRIEVER_FULL_TEXT": "true"}):
+            results = CRWRetriever("async runtimes").search()
+
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(payload["scrapeOptions"], {"formats": ["markdown"]})
+        self.assertEqual(
+            results,
+            [
+                {"href": "https://example.com/a", "body": "desc", "raw_content": PAGE},
+                {"href": "https://example.com/b", "body": "not scraped"},
+            ],
+        )
+
+    def test_exa_fetches_contents_in_full_text_mode(self):
+        searcher = make_exa_searcher()
+
+        with patch.dict("os.environ", {"RETRIEVER_FULL_TEXT": "true"}):
+            results = searcher.search(max_results=3)
+
+        searcher.client.search.assert_not_called()
+        self.assertTrue(searcher.client.search_and_contents.call_args.kwargs["text"])
+        self.assertEqual(results[0]["raw_content"], PAGE)
+        self.assertEqual(results[0]["body"], make_snippet(PAGE))
+
+    def test_exa_default_mode_is_unchanged(self):
+        searcher = make_exa_searcher()
+
+        with patch.dict("os.environ", {"RETRIEVER_FULL_TEXT": ""}):
+            results = searcher.search(max_results=3)
+
+        searcher.client.search_and_contents.assert_not_called()
+        self.assertEqual(results, [{"href": "https://example.com/a", "body": PAGE}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.actions.query_processing import get_search_results
+from gpt_researcher.utils import retriever_health as retriever_health_module
+from gpt_researcher.utils.retriever_health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    RetrieverHealthRegistry,
+    RetrieverUnavailableError,
+    get_retriever_health_registry,
+)
+
+
+class FailingRetriever:
+    calls = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        FailingRetriever.calls += 1
+        raise ConnectionError("provider throttled")
+
+
+def test_latency_percentiles_and_error_rate():
+    registry = RetrieverHealthRegistry()
+    for latency in range(1, 21):
+        registry.record_success("searx", latency / 10)
+    registry.record_failure("searx", 30.0)
+
+    assert registry.latency_percentile("searx", 50) == 1.0
+    assert registry.latency_percentile("searx", 95) == 1.9
+    assert registry.latency_percentile("searx", 95, min_samples=50) is None
+    snapshot = registry.snapshot()["searx"]
+    assert snapshot["requests"] == 21
+    assert snapshot["error_rate"] == pytest.approx(1 / 21)
+
+
+def test_circuit_opens_half_opens_and_closes(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(retriever_health_module.time, "monotonic", lambda: now[0])
+    registry = RetrieverHealthRegistry(failure_threshold=2, cooldown=30)
+
+    registry.record_failure("semantic_scholar", 1.0)
+    assert registry.allow_request("semantic_scholar")
+    registry.record_failure("semantic_scholar", 1.0)
+    assert registry.get_state("semantic_scholar") == OPEN
+    assert not registry.allow_request("semantic_scholar")
+
+    now[0] += 31
+    # Only one probe is let through while half-open
+    assert registry.allow_request("semantic_scholar")
+    assert registry.get_state("semantic_scholar") == HALF_OPEN
+    assert not registry.allow_request("semantic_scholar")
+
+    # A failed probe reopens the circuit straight away
+    registry.record_failure("semantic_scholar", 1.0)
+    assert registry.get_state("semantic_scholar") == OPEN
+
+    now[0] += 31
+    assert registry.allow_request("semantic_scholar")
+    registry.record_success("semantic_scholar", 0.5)
+    assert registry.get_state("semantic_scholar") == CLOSED
+    assert registry.allow_request("semantic_scholar")
+
+
+def test_cancelled_probe_frees_the_half_open_circuit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(retriever_health_module.time, "monotonic", lambda: now[0])
+    registry = RetrieverHealthRegistry(failure_threshold=1, cooldown=30)
+    registry.record_failure("exa", 1.0)
+    now[0] += 31
+
+    assert registry.allow_request("exa")
+    registry.release_request("exa")
+
+    assert registry.get_state("exa") == HALF_OPEN
+    assert registry.allow_request("exa")
+
+
+def test_circuit_breaking_is_disabled_by_default():
+    registry = RetrieverHealthRegistry()
+    for _ in range(10):
+        registry.record_failure("bing", 1.0)
+
+    assert registry.allow_request("bing")
+    assert registry.get_state("bing") == CLOSED
+
+
+def test_registry_is_shared_per_settings():
+    cfg = SimpleNamespace(retriever_failure_threshold=3, retriever_circuit_cooldown=10)
+
+    assert get_retriever_health_registry(cfg) is get_retriever_health_registry(SimpleNamespace(**vars(cfg)))
+
+
+def test_get_search_results_skips_retrievers_with_open_circuit():
+    FailingRetriever.calls = 0
+    researcher = SimpleNamespace(retriever_health=RetrieverHealthRegistry(failure_threshold=2, cooldown=60))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            asyncio.run(get_search_results("q", FailingRetriever, researcher=researcher))
+    with pytest.raises(RetrieverUnavailableError):
+        asyncio.run(get_search_results("q", FailingRetriever, researcher=researcher))
+
+    assert FailingRetriever.calls == 2
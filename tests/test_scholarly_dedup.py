@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.retrievers.openalex.openalex import OpenAlexSearch
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils.scholarly import (
+    ScholarlyCache,
+    collapse_scholarly_duplicates,
+    extract_scholarly_ids,
+    get_scholarly_cache,
+    normalize_scholarly_ids,
+)
+from gpt_researcher.utils.url_index import CanonicalURLSet
+
+FULL_TEXT = "Full text of the paper. " * 20
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://arxiv.org/abs/2101.00001v2", {"arxiv": "2101.00001"}),
+        ("http://arxiv.org/pdf/2101.00001v1", {"arxiv": "2101.00001"}),
+        ("https://arxiv.org/pdf/2101.00001.pdf", {"arxiv": "2101.00001"}),
+        ("https://arxiv.org/abs/hep-th/9901001", {"arxiv": "hep-th/9901001"}),
+        ("https://doi.org/10.1000/ABC.123", {"doi": "10.1000/abc.123"}),
+        ("https://doi.org/10.48550/arXiv.2101.00001", {"doi": "10.48550/arxiv.2101.00001", "arxiv": "2101.00001"}),
+        ("https://onlinelibrary.wiley.com/doi/pdf/10.1002/xyz.42", {"doi": "10.1002/xyz.42"}),
+        ("https://www.frontiersin.org/articles/10.3389/fpsyg.2020.01234/full", {"doi": "10.3389/fpsyg.2020.01234"}),
+        ("https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1234567/", {"pmcid": "PMC1234567"}),
+        ("https://europepmc.org/article/PMC/PMC1234567", {"pmcid": "PMC1234567"}),
+        ("https://example.com/blog/post", {}),
+    ],
+)
+def test_extract_scholarly_ids(url, expected):
+    assert extract_scholarly_ids(url) == expected
+
+
+def test_normalize_scholarly_ids_accepts_retriever_formats():
+    assert normalize_scholarly_ids({
+        "doi": "https://doi.org/10.1000/XYZ",
+        "arxiv": "2101.00001v3",
+        "pmcid": "https://www.ncbi.nlm.nih.gov/pmc/articles/7654321",
+    }) == {"doi": "10.1000/xyz", "arxiv": "2101.00001", "pmcid": "PMC7654321"}
+    assert normalize_scholarly_ids({"pmcid": "7654321", "doi": "not a doi"}) == {"pmcid": "PMC7654321"}
+
+
+def test_collapse_prefers_full_text_and_keeps_best_rank():
+    results = [
+        {"href": "https://arxiv.org/abs/2101.00001", "body": "abstract"},
+        {"href": "https://example.com/unrelated", "body": "other"},
+        {
+            "href": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1/",
+            "raw_content": FULL_TEXT,
+            "scholarly_ids": {"doi": "10.1000/paper"},
+        },
+        {"href": "https://publisher.example/paper.pdf", "scholarly_ids": {"doi": "10.1000/paper", "arxiv": "2101.00001"}},
+    ]
+
+    collapsed, dropped = collapse_scholarly_duplicates(results)
+
+    assert dropped == 2
+    assert [result["href"] for result in collapsed] == [
+        "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1/",
+        "https://example.com/unrelated",
+    ]
+    assert collapsed[0]["scholarly_ids"] == {"arxiv": "2101.00001", "doi": "10.1000/paper", "pmcid": "PMC1"}
+
+
+def test_collapse_prefers_pdf_over_landing_page_and_drops_visited_papers():
+    results = [
+        {"href": "https://doi.org/10.1000/a"},
+        {"href": "https://publisher.example/a.pdf", "scholarly_ids": {"doi": "10.1000/a"}},
+        {"href": "https://arxiv.org/abs/2101.00002"},
+    ]
+
+    collapsed, dropped = collapse_scholarly_duplicates(results, visited_keys={"arxiv:2101.00002"})
+
+    assert dropped == 2
+    assert [result["href"] for result in collapsed] == ["https://publisher.example/a.pdf"]
+
+
+def test_cache_resolves_urls_without_identifiers_and_fills_abstracts(tmp_path):
+    db_path = str(tmp_path / "scholarly.sqlite")
+    cache = ScholarlyCache(db_path=db_path)
+    cache.annotate([{
+        "href": "https://pdfs.example/opaque.pdf",
+        "title": "Paper",
+        "body": "The abstract.",
+        "scholarly_ids": {"doi": "10.1000/z"},
+    }])
+
+    # A fresh instance reads the mapping back from disk
+    reloaded = ScholarlyCache(db_path=db_path)
+    assert reloaded.lookup_url("https://pdfs.example/opaque.pdf") == {"doi": "10.1000/z"}
+    annotated = reloaded.annotate([{"href": "https://doi.org/10.1000/Z", "body": "Abstract not available"}])
+    assert annotated[0]["body"] == "The abstract."
+    assert reloaded.get_paper({"doi": "10.1000/z"})["urls"] == [
+        "https://pdfs.example/opaque.pdf",
+        "https://doi.org/10.1000/Z",
+    ]
+
+
+def test_get_scholarly_cache_can_be_disabled():
+    assert get_scholarly_cache(SimpleNamespace(scholarly_cache="none")) is None
+    cfg = SimpleNamespace(scholarly_cache="memory")
+    assert get_scholarly_cache(cfg) is get_scholarly_cache(cfg)
+
+
+def test_openalex_passes_identifiers_on():
+    results = OpenAlexSearch("q")._parse_results({"results": [{
+        "id": "https://openalex.org/W1",
+        "title": "T",
+        "ids": {"doi": "https://doi.org/10.1000/w1", "pmcid": "https://www.ncbi.nlm.nih.gov/pmc/articles/42"},
+    }]})
+    assert results[0]["scholarly_ids"] == {
+        "doi": "https://doi.org/10.1000/w1",
+        "pmcid": "https://www.ncbi.nlm.nih.gov/pmc/articles/42",
+    }
+
+
+def test_conductor_skips_papers_already_researched_under_another_url():
+    researcher = SimpleNamespace(
+        scholarly_cache=ScholarlyCache(),
+        visited_urls=CanonicalURLSet(["https://arxiv.org/pdf/2101.00003v1"]),
+        research_sources=[{"url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC9/"}],
+        verbose=False,
+    )
+    conductor = ResearchConductor(researcher)
+
+    kept = conductor._collapse_scholarly_duplicates("q", [
+        {"href": "https://arxiv.org/abs/2101.00003"},
+        {"href": "https://europepmc.org/article/PMC/PMC9"},
+        {"href": "https://example.com/new"},
+    ])
+
+    assert [result["href"] for result in kept] == ["https://example.com/new"]
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.rate_limiter import ScrapeScheduler, TokenBucket, get_scrape_scheduler
+from gpt_researcher.utils.workers import WorkerPool
+
+
+async def _request(scheduler, semaphore, url, log, provider=None, hold=0.0):
+    async with scheduler.slot(semaphore, url, provider):
+        log.append((url, time.monotonic()))
+        await asyncio.sleep(hold)
+
+
+def test_token_bucket_allows_the_burst_then_the_rate():
+    bucket = TokenBucket(rate=10, burst=2)
+    for _ in range(2):
+        assert bucket.delay() == 0
+        bucket.take()
+
+    assert bucket.delay() == pytest.approx(0.1, abs=0.01)
+    assert not bucket.idle()
+
+
+@pytest.mark.asyncio
+async def test_each_host_gets_its_rate_without_slowing_other_hosts():
+    scheduler = ScrapeScheduler()
+    scheduler.configure(host_rate=20)
+    semaphore = asyncio.Semaphore(10)
+    log = []
+
+    start = time.monotonic()
+    await asyncio.gather(
+        *(_request(scheduler, semaphore, "https://slow.example/page", log) for _ in range(4)),
+        *(_request(scheduler, semaphore, f"https://site{i}.example/page", log) for i in range(4)),
+    )
+
+    slow = [at - start for url, at in log if "slow" in url]
+    others = [at - start for url, at in log if "slow" not in url]
+    assert max(others) < 0.04
+    # One request at once, then 20/s
+    assert slow[-1] >= 0.14
+    assert all(b - a >= 0.045 for a, b in zip(slow, slow[1:]))
+
+
+@pytest.mark.asyncio
+async def test_provider_limits_apply_instead_of_the_hosts():
+    scheduler = ScrapeScheduler()
+    scheduler.configure(provider_limits={"firecrawl": {"rate": 20, "burst": 2}}, default_delay=0)
+    semaphore = asyncio.Semaphore(10)
+    log = []
+
+    start = time.monotonic()
+    await asyncio.gather(
+        *(_request(scheduler, semaphore, f"https://site{i}.example", log, provider="firecrawl") for i in range(4)),
+        *(_request(scheduler, semaphore, "https://plain.example", log) for _ in range(4)),
+    )
+
+    provider = sorted(at - start for url, at in log if "site" in url)
+    plain = [at - start for url, at in log if "plain" in url]
+    assert max(plain) < 0.04
+    assert provider[1] < 0.04 and provider[2] >= 0.045 and provider[3] >= 0.095
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_per_host():
+    scheduler = ScrapeScheduler()
+    scheduler.configure(host_max_in_flight=2)
+    semaphore = asyncio.Semaphore(10)
+    in_flight = {"now": 0, "max": 0}
+
+    async def request(url):
+        async with scheduler.slot(semaphore, url):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+
+    await asyncio.gather(*(request("https://example.com/a") for _ in range(6)))
+
+    assert in_flight["max"] == 2
+    assert scheduler._slots == {}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_delay_applies_per_host_and_scraper_routes_providers():
+    pool = WorkerPool(4, rate_limit_delay=0.05)
+    scheduler = get_scrape_scheduler()
+    scraper = Scraper(["https://example.com/a"], "ua", "firecrawl", pool)
+
+    try:
+        assert scheduler.limits("host:example.com") == (20.0, 1, 0)
+        assert scraper._scraper_key("https://example.com/a") == "firecrawl"
+        assert scraper._scraper_key("https://example.com/paper.PDF?sig=1") == "pdf"
+
+        log = []
+        start = time.monotonic()
+        await asyncio.gather(
+            *(_request(scheduler, pool.semaphore, f"https://host{i}.example", log) for i in range(4))
+        )
+        assert max(at for _, at in log) - start < 0.04
+    finally:
+        WorkerPool(4)
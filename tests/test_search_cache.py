@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.actions.query_processing import get_search_results, get_search_results_many
+from gpt_researcher.utils import search_cache as search_cache_module
+from gpt_researcher.utils.search_cache import SearchCache, get_search_cache
+
+RESULTS = [{"href": "https://example.com/a", "body": "snippet"}]
+
+
+class CountingRetriever:
+    calls = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        CountingRetriever.calls += 1
+        return [{"href": f"https://example.com/{self.query}", "body": "snippet"}]
+
+
+def test_query_and_domains_are_normalized():
+    cache = SearchCache()
+    cache.set("tavily", "  Solar   Panels ", RESULTS, ["b.com", "A.com"], 5)
+
+    assert cache.get("tavily", "solar panels", ["a.com", "b.com"], 5) == RESULTS
+    assert cache.get("tavily", "solar panels", ["a.com"], 5) is None
+    assert cache.get("tavily", "solar panels", ["a.com", "b.com"], 10) is None
+    assert cache.get("bing", "solar panels", ["a.com", "b.com"], 5) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+def test_full_text_and_snippet_results_are_cached_apart(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "search.sqlite")
+    full_text = [{"href": "https://example.com/a", "body": "snippet", "raw_content": "page " * 50}]
+    monkeypatch.setenv("RETRIEVER_FULL_TEXT", "true")
+    SearchCache(db_path=db_path).set("tavily", "solar", full_text, max_results=5)
+
+    monkeypatch.setenv("RETRIEVER_FULL_TEXT", "false")
+    assert SearchCache(db_path=db_path).get("tavily", "solar", max_results=5) is None
+    SearchCache(db_path=db_path).set("tavily", "solar", RESULTS, max_results=5)
+
+    monkeypatch.setenv("RETRIEVER_FULL_TEXT", "true")
+    assert SearchCache(db_path=db_path).get("tavily", "solar", max_results=5) == full_text
+
+
+def test_entries_expire_after_per_retriever_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_cache_module.time, "time", lambda: now[0])
+    cache = SearchCache(default_ttl=100, ttls={"arxiv": 1000, "tavily": 0})
+    cache.set("bing", "q", RESULTS)
+    cache.set("arxiv", "q", RESULTS)
+    cache.set("tavily", "q", RESULTS)
+
+    now[0] += 500
+    assert cache.get("bing", "q") is None
+    assert cache.get("arxiv", "q") == RESULTS
+    assert cache.get("tavily", "q") is None
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = SearchCache(max_entries=2)
+    cache.set("bing", "one", RESULTS)
+    cache.set("bing", "two", RESULTS)
+    cache.get("bing", "one")
+    cache.set("bing", "three", RESULTS)
+
+    assert cache.get("bing", "one") == RESULTS
+    assert cache.get("bing", "two") is None
+
+
+def test_cached_results_are_copies():
+    cache = SearchCache()
+    cache.set("bing", "q", RESULTS)
+    cache.get("bing", "q")[0]["body"] = "mutated"
+
+    assert cache.get("bing", "q")[0]["body"] == "snippet"
+
+
+def test_sqlite_tier_survives_new_instances(tmp_path):
+    db_path = str(tmp_path / "cache" / "search.sqlite")
+    SearchCache(db_path=db_path).set("bing", "q", RESULTS, max_results=5)
+
+    assert SearchCache(db_path=db_path).get("bing", "q", max_results=5) == RESULTS
+
+
+def test_get_search_cache_is_shared_per_settings():
+    cfg = SimpleNamespace(search_cache="memory", search_cache_max_entries=7)
+
+    assert get_search_cache(cfg) is get_search_cache(SimpleNamespace(**vars(cfg)))
+    assert get_search_cache(SimpleNamespace(search_cache="none")) is None
+
+
+def test_get_search_results_serves_repeats_from_cache():
+    CountingRetriever.calls = 0
+    cache = SearchCache()
+    parent = SimpleNamespace(search_cache=cache, search_cache_stats={"hits": 0, "misses": 0})
+    nested = SimpleNamespace(search_cache=cache, search_cache_stats={"hits": 0, "misses": 0})
+
+    first = asyncio.run(get_search_results("q", CountingRetriever, researcher=parent, max_results=5))
+    second = asyncio.run(get_search_results("Q ", CountingRetriever, researcher=nested, max_results=5))
+
+    assert first == second
+    assert CountingRetriever.calls == 1
+    assert parent.search_cache_stats == {"hits": 0, "misses": 1}
+    assert nested.search_cache_stats == {"hits": 1, "misses": 0}
+
+
+class _ThreadRecordingCache(SearchCache):
+    """Notes the threads SQLite is used from; none may be the event loop's."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def get(self, *args):
+        self.threads.add(threading.current_thread())
+        return super().get(*args)
+
+    def set(self, *args):
+        self.threads.add(threading.current_thread())
+        return super().set(*args)
+
+
+def test_search_cache_is_used_off_the_event_loop(tmp_path):
+    cache = _ThreadRecordingCache(db_path=str(tmp_path / "search.db"))
+    researcher = SimpleNamespace(search_cache=cache)
+
+    asyncio.run(get_search_results("q", CountingRetriever, researcher=researcher))
+    asyncio.run(get_search_results_many(["q", "r"], CountingRetriever, researcher=researcher))
+
+    assert cache.threads and threading.main_thread() not in cache.threads
+
+
+@pytest.mark.parametrize("results", [[], None])
+def test_empty_results_are_not_cached(results):
+    cache = SearchCache()
+    cache.set("bing", "q", results)
+
+    assert cache.get("bing", "q") is None
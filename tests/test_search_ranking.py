@@ -0,0 +1,89 @@
+import asyncio
+
+from gpt_researcher.actions.search_ranking import (
+    filter_results_by_snippet_similarity,
+    rank_search_results,
+    snippet_relevance,
+)
+
+
+def result(url, body="", title="", raw_content=None):
+    item = {"href": url, "body": body, "title": title}
+    if raw_content is not None:
+        item["raw_content"] = raw_content
+    return item
+
+
+def test_urls_found_by_several_retrievers_rank_first():
+    ranked = rank_search_results([
+        [result("https://a.com"), result("https://b.com"), result("https://c.com")],
+        [result("https://c.com"), result("https://d.com")],
+    ])
+
+    assert [r["href"] for r in ranked] == ["https://c.com", "https://a.com", "https://b.com", "https://d.com"]
+
+
+def test_url_variants_are_merged_keeping_prefetched_content():
+    ranked = rank_search_results([
+        [result("http://www.a.com/page/")],
+        [result("https://a.com/page", raw_content="full text " * 20)],
+    ])
+
+    assert len(ranked) == 1
+    assert ranked[0]["href"] == "https://a.com/page"
+
+
+def test_snippet_boost_promotes_relevant_snippets():
+    results = [[
+        result("https://off-topic.com", body="celebrity gossip"),
+        result("https://on-topic.com", body="solid state battery energy density"),
+    ]]
+
+    assert rank_search_results(results, "solid state battery density")[0]["href"] == "https://off-topic.com"
+    boosted = rank_search_results(results, "solid state battery density", snippet_boost=1.0)
+    assert boosted[0]["href"] == "https://on-topic.com"
+
+
+def test_snippet_relevance_ignores_stopwords():
+    assert snippet_relevance("what is the rust borrow checker", result("u", title="The Rust borrow checker")) == 1.0
+    assert snippet_relevance("the", result("u", body="the")) == 0.0
+
+
+def test_results_without_urls_are_skipped():
+    assert rank_search_results([[{"body": "no url"}], []]) == []
+
+
+class KeywordEmbeddings:
+    """Embeds text as [mentions battery, mentions gossip]."""
+
+    def __init__(self):
+        self.calls = []
+
+    @staticmethod
+    def _vector(text):
+        return [float("battery" in text.lower()), float("gossip" in text.lower())]
+
+    async def aembed_documents(self, texts):
+        self.calls.append(("documents", list(texts)))
+        return [self._vector(t) for t in texts]
+
+    async def aembed_query(self, text):
+        self.calls.append(("query", text))
+        return self._vector(text)
+
+
+def test_snippet_filter_drops_unrelated_results_in_one_batch():
+    embeddings = KeywordEmbeddings()
+    results = [
+        result("https://a.com", body="Battery chemistry explained"),
+        result("https://b.com", body="Celebrity gossip"),
+        result("https://c.com"),
+    ]
+
+    kept = asyncio.run(filter_results_by_snippet_similarity("battery research", results, embeddings, 0.5))
+
+    assert [r["href"] for r in kept] == ["https://a.com", "https://c.com"]
+    assert embeddings.calls == [
+        ("query", "battery research"),
+        ("documents", ["Battery chemistry explained", "Celebrity gossip"]),
+    ]
@@ -0,0 +1,238 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from gpt_researcher.actions.web_scraping import scraper_options
+from gpt_researcher.config import Config
+from gpt_researcher.scraper import BeautifulSoupScraper
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.scraper.streaming import (
+    ContentRejected,
+    aread_capped,
+    check_text_content_type,
+    declared_charset,
+    is_pdf,
+    peek,
+    read_capped,
+    sniff_binary,
+)
+from gpt_researcher.scraper.utils import fetch_images_and_title
+from gpt_researcher.utils import http_client
+from gpt_researcher.utils.http_client import PooledAsyncClient
+from gpt_researcher.utils.workers import WorkerPool
+
+PAGE = b"<html><head><title>T</title></head><body><p>" + b"Some words here. " * 20 + b"</p></body></html>"
+
+
+def test_stops_reading_at_the_byte_cap():
+    consumed = []
+
+    def chunks():
+        for _ in range(100):
+            consumed.append(1)
+            yield b"a" * 100
+
+    assert len(read_capped(chunks(), max_bytes=250)) == 250
+    assert len(consumed) == 3
+
+
+def test_rejects_oversized_body_when_truncation_is_off():
+    with pytest.raises(ContentRejected):
+        read_capped([b"a" * 100] * 3, max_bytes=250, truncate=False, text_only=False)
+
+
+@pytest.mark.parametrize("head", [b"%PDF-1.7\n", b"\x89PNG\r\n\x1a\n", b"PK\x03\x04", b"\x00\x00\x00\x18ftypmp42"])
+def test_sniffs_binary_bodies(head):
+    assert sniff_binary(head) is not None
+    with pytest.raises(ContentRejected):
+        read_capped([head + b"\x00" * 600])
+
+
+def test_text_passes_sniffing_and_content_type_checks():
+    assert sniff_binary(PAGE) is None
+    check_text_content_type("text/html; charset=utf-8")
+    check_text_content_type("application/vnd.api+json")
+    check_text_content_type(None)
+    for content_type in ("application/pdf", "image/png", "video/mp4", "application/zip"):
+        with pytest.raises(ContentRejected):
+            check_text_content_type(content_type)
+    assert declared_charset('text/html; charset="Shift_JIS"') == "Shift_JIS"
+    assert declared_charset("text/html") is None
+
+
+def test_async_read_budget_aborts_slow_bodies():
+    async def trickle():
+        while True:
+            await asyncio.sleep(0.05)
+            yield b"<p>x</p>"
+
+    with pytest.raises(ContentRejected):
+        asyncio.run(aread_capped(trickle(), read_budget=0.2))
+
+
+def _streaming_response(chunks, headers):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = headers
+    response.iter_content.return_value = iter(chunks)
+    response.__enter__.return_value = response
+    response.__exit__.return_value = False
+    return response
+
+
+def test_sync_scraper_truncates_chunked_pages_without_content_length():
+    session = MagicMock()
+    session.get.return_value = _streaming_response([PAGE] + [b"<p>filler</p>" * 100] * 1000, {"Content-Type": "text/html"})
+    scraper = BeautifulSoupScraper("https://example.com/big", session)
+    scraper.max_content_bytes = 10_000
+
+    body, charset = scraper._fetch()
+
+    assert session.get.call_args.kwargs["stream"] is True
+    assert body.startswith(PAGE)
+    assert charset is None
+
+
+def test_images_and_title_are_read_from_a_capped_stream():
+    consumed = []
+
+    def chunks():
+        yield b'<html><head><title>Batch page</title></head><body><img class="hero" src="/a.png">'
+        while True:
+            consumed.append(1)
+            yield b"<p>filler</p>" * 100
+
+    session = MagicMock()
+    session.get.return_value = _streaming_response(chunks(), {"Content-Type": "text/html"})
+
+    image_urls, title = fetch_images_and_title("https://example.com/page", session, max_bytes=10_000)
+
+    assert session.get.call_args.kwargs["stream"] is True
+    assert title == "Batch page"
+    assert image_urls == [{"url": "https://example.com/a.png", "score": 4}]
+    assert len(consumed) < 10
+
+    binary = _streaming_response([b"\x89PNG"], {"Content-Type": "image/png"})
+    session.get.return_value = binary
+    assert fetch_images_and_title("https://example.com/image", session) == ([], "")
+    binary.iter_content.assert_not_called()
+
+
+def test_download_limits_come_from_the_config(monkeypatch):
+    monkeypatch.setenv("SCRAPER_MAX_CONTENT_BYTES", "1000")
+    monkeypatch.setenv("SCRAPER_READ_BUDGET", "5")
+    options = scraper_options(Config())
+    limits = []
+
+    async def scrape_async(self):
+        limits.append((self.max_content_bytes, self.max_pdf_bytes, self.read_budget))
+        return "", [], ""
+
+    monkeypatch.setattr(BeautifulSoupScraper, "scrape_async", scrape_async)
+    asyncio.run(Scraper(["https://example.com"], "ua", "bs", WorkerPool(1), scraper_options=options).run())
+
+    assert limits == [(1000, 50 * 1024 * 1024, 5.0)]
+
+
+def test_sync_scraper_skips_binary_content_type_without_reading():
+    session = MagicMock()
+    response = _streaming_response([b"\x89PNG"], {"Content-Type": "image/png"})
+    session.get.return_value = response
+
+    assert BeautifulSoupScraper("https://example.com/file", session).scrape() == ("", [], "")
+    response.iter_content.assert_not_called()
+
+
+def _pdf_bytes(text):
+    pymupdf = pytest.importorskip("pymupdf")
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.set_metadata({"title": "Routed PDF"})
+    return doc.tobytes()
+
+
+def test_pdf_detection_and_peek():
+    assert is_pdf("application/pdf; qs=0.9")
+    assert is_pdf("text/html", b"\n%PDF-1.7")
+    assert not is_pdf("text/html", PAGE)
+    head, chunks = peek(iter([b"", b"%PDF-", b"rest"]))
+    assert head == b"%PDF-"
+    assert b"".join(chunks) == b"%PDF-rest"
+
+
+def test_sync_scraper_hands_pdfs_to_the_pdf_extractor():
+    body = _pdf_bytes("Text of the linked paper")
+    session = MagicMock()
+    session.get.return_value = _streaming_response([body[:100], body[100:]], {"Content-Type": "application/pdf"})
+
+    content, image_urls, title = BeautifulSoupScraper("https://example.com/download?id=7", session).scrape()
+
+    assert "Text of the linked paper" in content
+    assert title == "Routed PDF"
+    assert session.get.call_count == 1
+
+
+def test_async_scraper_reads_mislabelled_pdfs_from_the_open_stream():
+    body = _pdf_bytes("Reached through a DOI redirect")
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/html"})
+
+    async def run():
+        pooled = PooledAsyncClient()
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_client._clients[asyncio.get_running_loop()] = pooled
+        try:
+            scraper = BeautifulSoupScraper("https://doi.example/10.1000/xyz")
+            return scraper, await scraper.scrape_async()
+        finally:
+            await http_client.close_async_http_client()
+
+    scraper, (content, _, title) = asyncio.run(run())
+
+    assert scraper.content_kind == "pdf"
+    assert "Reached through a DOI redirect" in content
+    assert title == "Routed PDF"
+    assert len(requests_seen) == 1
+
+
+@pytest.mark.parametrize(
+    "status, content_type, expected",
+    [(200, "application/pdf", "pdf"), (200, "image/png", None), (200, "text/html", "browser"), (405, None, "browser")],
+)
+def test_browser_scrapes_are_routed_by_a_head_request(status, content_type, expected):
+    def handler(request):
+        assert request.method == "HEAD"
+        return httpx.Response(status, headers={"Content-Type": content_type} if content_type else {})
+
+    async def run():
+        pooled = PooledAsyncClient()
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_client._clients[asyncio.get_running_loop()] = pooled
+        scraper = Scraper(["https://example.com/download?id=7"], "ua", "browser", MagicMock())
+        try:
+            return await scraper._route_by_content_type("https://example.com/download?id=7", scraper.session)
+        finally:
+            await http_client.close_async_http_client()
+
+    assert asyncio.run(run()) == expected
+
+
+def test_async_scraper_drops_mislabelled_binaries():
+    async def run():
+        pooled = PooledAsyncClient()
+        pooled.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048,
+                                           headers={"Content-Type": "text/html"})
+        ))
+        http_client._clients[asyncio.get_running_loop()] = pooled
+        try:
+            return await BeautifulSoupScraper("https://example.com/image").scrape_async()
+        finally:
+            await http_client.close_async_http_client()
+
+    assert asyncio.run(run()) == ("", [], "")
@@ -0,0 +1,50 @@
+import asyncio
+
+from gpt_researcher.actions.query_processing import deduplicate_sub_queries
+
+
+class TopicEmbeddings:
+    """Embeds texts by the topics they mention, so paraphrases get equal vectors."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def aembed_documents(self, texts):
+        self.calls += 1
+        return [[float("battery" in t.lower() or "batteries" in t.lower()), float("solar" in t.lower())] for t in texts]
+
+
+class FailingEmbeddings:
+    async def aembed_documents(self, texts):
+        raise RuntimeError("embedding service down")
+
+
+def test_paraphrases_are_merged_in_one_batch():
+    embeddings = TopicEmbeddings()
+    queries = [
+        "solid state battery energy density",
+        "solar panel efficiency records",
+        "how dense are solid-state batteries",
+    ]
+
+    unique, merged = asyncio.run(deduplicate_sub_queries(queries, embeddings, 0.95))
+
+    assert unique == queries[:2]
+    assert merged == {queries[0]: [queries[2]]}
+    assert embeddings.calls == 1
+
+
+def test_lexical_fallback_ignores_word_order_and_stopwords():
+    queries = ["X market size 2025", "2025 market size of X", "Y market size 2025"]
+
+    for embeddings in (None, FailingEmbeddings()):
+        unique, merged = asyncio.run(deduplicate_sub_queries(queries, embeddings, 0.95))
+
+        assert unique == ["X market size 2025", "Y market size 2025"]
+        assert merged == {"X market size 2025": ["2025 market size of X"]}
+
+
+def test_distinct_queries_are_kept():
+    queries = ["solar panel efficiency", "battery recycling"]
+
+    assert asyncio.run(deduplicate_sub_queries(queries, TopicEmbeddings(), 0.95)) == (queries, {})
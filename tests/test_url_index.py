@@ -0,0 +1,132 @@
+import asyncio
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils.url_index import CanonicalURLSet, canonicalize_url, dedupe_urls
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "https://example.com/article",
+        "http://example.com/article",
+        "https://www.example.com/article",
+        "https://EXAMPLE.com/article/",
+        "https://example.com/article#section-2",
+        "https://example.com/article?utm_source=twitter&utm_medium=social",
+        "https://example.com/article?fbclid=abc123",
+        "https://example.com:443/article",
+        "https://example.com/article/amp",
+        "https://example.com/amp/article",
+        "https://amp.example.com/article",
+        "https://example.com/article?amp=1",
+        "https://example-com.cdn.ampproject.org/c/s/example.com/article",
+        "https://www.google.com/amp/s/example.com/article",
+    ],
+)
+def test_variants_share_canonical_form(variant):
+    assert canonicalize_url(variant) == "https://example.com/article"
+
+
+def test_meaningful_differences_are_kept():
+    assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+    assert canonicalize_url("https://example.com/a") != canonicalize_url("https://example.com/b")
+    assert canonicalize_url("https://blog.example.com/a") != canonicalize_url("https://example.com/a")
+    assert canonicalize_url("https://example.com:8080/a") != canonicalize_url("https://example.com/a")
+
+
+def test_pages_named_amp_are_kept():
+    assert canonicalize_url("https://en.wikipedia.org/wiki/Amp") == "https://en.wikipedia.org/wiki/Amp"
+    assert canonicalize_url("https://example.com/amp") == "https://example.com/amp"
+    assert canonicalize_url("https://example.com/amp/") != canonicalize_url("https://example.com/")
+
+
+def test_query_parameter_order_does_not_matter():
+    assert canonicalize_url("https://example.com/s?b=2&a=1") == canonicalize_url("https://example.com/s?a=1&b=2")
+
+
+def test_non_http_urls_are_left_alone():
+    assert canonicalize_url(" mailto:someone@example.com ") == "mailto:someone@example.com"
+    assert canonicalize_url("not a url") == "not a url"
+
+
+def test_canonical_set_keeps_first_original():
+    urls = CanonicalURLSet(["http://www.example.com/article/?utm_source=x"])
+    urls.add("https://example.com/article")
+    urls.update(["https://example.com/article#top", "https://example.com/other"])
+
+    assert "https://example.com/article" in urls
+    assert sorted(urls) == ["http://www.example.com/article/?utm_source=x", "https://example.com/other"]
+    assert urls.get_original("https://example.com/article") == "http://www.example.com/article/?utm_source=x"
+
+
+def test_canonical_set_copy_and_pickle_stay_canonical():
+    urls = CanonicalURLSet(["https://example.com/a"])
+
+    for clone in (urls.copy(), pickle.loads(pickle.dumps(urls))):
+        assert isinstance(clone, CanonicalURLSet)
+        assert "http://www.example.com/a/" in clone
+
+    urls.discard("http://example.com/a")
+    assert len(urls) == 0
+
+
+def test_canonical_set_operations_compare_canonical_forms():
+    urls = CanonicalURLSet(["https://example.com/a", "https://example.com/b"])
+    variants = {"http://www.example.com/a/", "https://example.com/a#top"}
+
+    assert urls - variants == CanonicalURLSet(["https://example.com/b"])
+    assert sorted(urls & variants) == ["https://example.com/a"]
+    assert urls >= variants and urls.issuperset(variants)
+    assert CanonicalURLSet(variants).issubset(urls)
+    assert urls == {"http://example.com/a", "https://www.example.com/b/"}
+    assert not urls.isdisjoint(variants)
+
+    remaining = urls.copy()
+    remaining -= variants
+    assert sorted(remaining) == ["https://example.com/b"]
+    remaining = urls.difference(["http://example.com/b/?utm_source=x"])
+    assert sorted(remaining) == ["https://example.com/a"]
+    urls.intersection_update(["http://example.com/b#x"])
+    assert sorted(urls) == ["https://example.com/b"]
+    urls.remove("https://www.example.com/b")
+    assert len(urls) == 0
+    with pytest.raises(KeyError):
+        urls.remove("https://example.com/b")
+
+
+def test_dedupe_urls_preserves_order():
+    assert dedupe_urls(
+        ["https://b.com/x", "http://a.com/y", "https://www.b.com/x/", "https://a.com/y#z"]
+    ) == ["https://b.com/x", "http://a.com/y"]
+
+
+def test_scraper_drops_url_variants():
+    scraper = Scraper(
+        ["https://example.com/a", "http://www.example.com/a/?fbclid=1", "https://example.com/b"],
+        "test-agent",
+        "bs",
+        worker_pool=None,
+    )
+
+    assert scraper.urls == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_new_urls_are_checked_against_canonical_visited_urls():
+    researcher = SimpleNamespace(
+        visited_urls=CanonicalURLSet(["https://example.com/seen"]),
+        verbose=False,
+    )
+    conductor = ResearchConductor(researcher)
+
+    new_urls = asyncio.run(conductor._get_new_urls([
+        "http://www.example.com/seen/",
+        "https://example.com/new?utm_campaign=x",
+        "https://example.com/new",
+    ]))
+
+    assert new_urls == ["https://example.com/new?utm_campaign=x"]